@@ -18,6 +18,18 @@
 #include "_tracers_pycompat.h"
 #include "_tracers.h"
 
+#if PY_VERSION_HEX >= 0x030B0000
+/* Since 3.11, the value stack lives in a (non-public) interpreter frame. */
+#define Py_BUILD_CORE 1
+#include "internal/pycore_frame.h"
+#undef Py_BUILD_CORE
+#endif
+
+
+static PyObject ** frame_stack_slot(PyFrameObject *frame, int idx);
+static int interceptor_wanted(PyFrameObject *frame, int opcode, int oparg);
+static void coverage_record(CoverageRecorder *self, PyObject *code, int lasti);
+
 
 static int
 pyint_as_int(PyObject * pyint, int *pint)
@@ -55,12 +67,31 @@ static void dont_trace_frame(PyFrameObject *frame)
 #endif
 }
 
+/*
+ * Whether to trace a code object depends only on its filename, so we remember
+ * the decision in the code object's "extra" scratch space. Each decision is
+ * tagged with the generation of the suffix configuration that produced it;
+ * changing the untraced suffixes (on any tracer) starts a new generation.
+ */
+static Py_ssize_t untraced_extra_index = -1;
+static uintptr_t next_untraced_generation = 1;
+
+#define UNTRACED_DECISION(generation, skip) ((void*)(((generation) << 1) | (skip)))
+
 static int
 CTracer_init(CTracer *self, PyObject *args_unused, PyObject *kwds_unused)
 {
     init_framecbvec(&self->postop_callbacks, 5);
     init_modulevec(&self->modules, 5);
+    init_modulevec(&self->code_filters, 5);
     init_tablevec(&self->handlers, 3);
+    self->last_code = NULL;
+    self->last_code_bytes = NULL;
+    self->untraced_suffixes = PyTuple_New(0);
+    if (self->untraced_suffixes == NULL) {
+        return RET_ERROR;
+    }
+    self->untraced_generation = next_untraced_generation++;
     self->enabled = FALSE;
     self->handling = FALSE;
     return RET_OK;
@@ -72,9 +103,14 @@ CTracer_dealloc(CTracer *self)
     ModuleVec* modules = &self->modules;
     for(int i=0; i< modules->count; i++) {
         Py_DECREF(modules->items[i]);
+        Py_DECREF(self->code_filters.items[i]);
     }
+    Py_XDECREF(self->last_code);
+    Py_XDECREF(self->last_code_bytes);
+    Py_XDECREF(self->untraced_suffixes);
     PyMem_Free(self->postop_callbacks.items);
     PyMem_Free(self->modules.items);
+    PyMem_Free(self->code_filters.items);
     PyMem_Free(self->handlers.items);
     Py_TYPE(self)->tp_free((PyObject*)self);
 }
@@ -86,17 +122,50 @@ CTracer_push_module(CTracer *self, PyObject *args)
     if (!PyArg_ParseTuple(args, "O", &tracing_module)) {
         return NULL;
     }
+
+    // Modules may restrict themselves to a set of code objects; in that case,
+    // instructions in other code objects are skipped without leaving C.
+    PyObject* code_filter = NULL;
+    PyObject* codes_wanted = PyObject_GetAttrString(tracing_module, "codeobjects_wanted");
+    if (codes_wanted == NULL)
+    {
+        if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+            return NULL;
+        }
+        PyErr_Clear();
+    } else if (codes_wanted != Py_None) {
+        if (!PyFrozenSet_Check(codes_wanted)) {
+            Py_DECREF(codes_wanted);
+            PyErr_SetString(PyExc_TypeError, "codeobjects_wanted must be None or a frozenset instance");
+            return NULL;
+        }
+        code_filter = PySequence_Tuple(codes_wanted);
+        if (code_filter == NULL) {
+            Py_DECREF(codes_wanted);
+            return NULL;
+        }
+    }
+    Py_XDECREF(codes_wanted);
+
     Py_INCREF(tracing_module);
     push_module(&self->modules, tracing_module);
+    if (code_filter == NULL) {
+        Py_INCREF(Py_None);
+        push_module(&self->code_filters, Py_None);
+    } else {
+        push_module(&self->code_filters, code_filter);
+    }
     TableVec* tables = &self->handlers;
 
     PyObject* wanted = PyObject_GetAttrString(tracing_module, "opcodes_wanted");
     if (wanted == NULL || !PyFrozenSet_Check(wanted))
     {
+        Py_XDECREF(wanted);
         PyErr_SetString(PyExc_TypeError, "opcodes_wanted must be frozenset instance");
         return NULL;
     }
     PyObject* wanted_itr = PyObject_GetIter(wanted);
+    Py_DECREF(wanted);
     if (wanted_itr == NULL)
     {
         return NULL;
@@ -122,6 +191,7 @@ CTracer_push_module(CTracer *self, PyObject *args)
             if (table->entries[opcode] == NULL)
             {
                 table->entries[opcode] = tracing_module;
+                table->code_filters[opcode] = code_filter;
                 break;
             }
         }
@@ -146,16 +216,19 @@ CTracer_pop_module(CTracer *self, PyObject *args)
         return NULL;
     }
     modules->count--;
-    Py_XDECREF(module);
+    self->code_filters.count--;
 
     TableVec* tables = &self->handlers;
     for(int table_idx = 0; table_idx < self->handlers.count; table_idx++) {
         for(int opcode = 0; opcode < 256; opcode++) {
             if (tables->items[table_idx].entries[opcode] == module) {
                 tables->items[table_idx].entries[opcode] = NULL;
+                tables->items[table_idx].code_filters[opcode] = NULL;
             }
         }
     }
+    Py_XDECREF(module);
+    Py_DECREF(self->code_filters.items[self->code_filters.count]);
     Py_RETURN_NONE;
 }
 
@@ -163,15 +236,42 @@ CTracer_pop_module(CTracer *self, PyObject *args)
  * Parts of the trace function.
  */
 
+static BOOL
+tuple_contains_identical(PyObject *tuple, PyObject *item)
+{
+    Py_ssize_t size = PyTuple_GET_SIZE(tuple);
+    for (Py_ssize_t i = 0; i < size; i++) {
+        if (PyTuple_GET_ITEM(tuple, i) == item) {
+            return TRUE;
+        }
+    }
+    return FALSE;
+}
+
 static int
 CTracer_handle_opcode(CTracer *self, PyFrameObject *frame)
 {
     int ret = RET_OK;
-    PyObject * pCode = NULL;
-
+    PyObject * code = (PyObject *)PyFrame_GetCode(frame);
     int lasti = PyFrame_GetLasti(frame);
-    pCode = PyCode_GetCode(PyFrame_GetCode(frame));
-    unsigned char * code_bytes = (unsigned char *)PyBytes_AS_STRING(pCode);
+
+    // Consecutive instructions almost always come from the same code object, so
+    // we keep the bytecode for the most recent one around:
+    if (code != self->last_code)
+    {
+        PyObject * code_bytes_obj = PyCode_GetCode((PyCodeObject *)code);
+        if (code_bytes_obj == NULL)
+        {
+            Py_DECREF(code);
+            return RET_ERROR;
+        }
+        Py_XDECREF(self->last_code);
+        Py_XDECREF(self->last_code_bytes);
+        Py_INCREF(code);
+        self->last_code = code;
+        self->last_code_bytes = code_bytes_obj;
+    }
+    unsigned char * code_bytes = (unsigned char *)PyBytes_AS_STRING(self->last_code_bytes);
 
     // const char * funcname = PyUnicode_AsUTF8(PyFrame_GetCode(frame)->co_name);
     // printf("opcode %s @ %d op: %d\n", funcname, lasti, code_bytes[lasti]);
@@ -189,7 +289,7 @@ CTracer_handle_opcode(CTracer *self, PyFrameObject *frame)
             if (result == NULL)
             {
                 self->handling = FALSE;
-                Py_XDECREF(pCode);
+                Py_DECREF(code);
                 return RET_ERROR;
             }
             Py_DECREF(result);
@@ -205,6 +305,7 @@ CTracer_handle_opcode(CTracer *self, PyFrameObject *frame)
     TableVec* tables = &self->handlers;
     int count = tables->count;
     HandlerTable* first_table = tables->items;
+    PyObject * pyopcode = NULL;
     PyObject *extra = NULL;
     extra = Py_None;
     Py_INCREF(extra);
@@ -213,15 +314,37 @@ CTracer_handle_opcode(CTracer *self, PyFrameObject *frame)
         if (handler == NULL) {
             continue;
         }
-
-        PyObject * arglist = Py_BuildValue("OsiO", frame, "opcode", opcode, extra);
-        if (arglist == NULL) // (out of memory)
-        {
-            ret = RET_ERROR;
-            break;
+        PyObject* code_filter = first_table[table_idx].code_filters[opcode];
+        if (code_filter != NULL && !tuple_contains_identical(code_filter, code)) {
+            continue;
+        }
+        if (Py_TYPE(handler) == &InterceptorTableType) {
+            // Most instructions have only concrete operands; we can tell without
+            // calling into Python:
+            int wanted = interceptor_wanted(frame, opcode, code_bytes[lasti + 1]);
+            if (wanted == RET_ERROR) {
+                ret = RET_ERROR;
+                break;
+            }
+            if (!wanted) {
+                continue;
+            }
+            handler = ((InterceptorTable *)handler)->handlers[opcode];
+        } else if (PyObject_TypeCheck(handler, &CoverageRecorderType)) {
+            coverage_record((CoverageRecorder *)handler, code, lasti);
+            continue;
         }
-        PyObject * result = PyObject_CallObject(handler, arglist);
-        Py_DECREF(arglist);
+        if (pyopcode == NULL) {
+            pyopcode = PyLong_FromLong(opcode);
+            if (pyopcode == NULL) // (out of memory)
+            {
+                ret = RET_ERROR;
+                break;
+            }
+        }
+
+        PyObject * args[4] = {(PyObject *)frame, code, pyopcode, extra};
+        PyObject * result = PyObject_Vectorcall(handler, args, 4, NULL);
         if (result == NULL)
         {
             ret = RET_ERROR;
@@ -235,23 +358,42 @@ CTracer_handle_opcode(CTracer *self, PyFrameObject *frame)
             extra = result;
         }
     }
+    Py_XDECREF(pyopcode);
     Py_DECREF(extra);
     self->handling = FALSE;
-    Py_XDECREF(pCode);
+    Py_DECREF(code);
 
     return ret;
 }
 
 
-int EndsWith(const char *str, const char *suffix)
+static int
+CTracer_is_untraced(CTracer *self, PyCodeObject *code)
 {
-    if (!str || !suffix)
-        return 0;
-    size_t lenstr = strlen(str);
-    size_t lensuffix = strlen(suffix);
-    if (lensuffix >  lenstr)
-        return 0;
-    return strncmp(str + lenstr - lensuffix, suffix, lensuffix) == 0;
+    void* cached = NULL;
+    if (_PyCode_GetExtra((PyObject*)code, untraced_extra_index, &cached) < 0) {
+        return RET_ERROR;
+    }
+    uintptr_t generation = self->untraced_generation;
+    if (cached == UNTRACED_DECISION(generation, TRUE)) {
+        return TRUE;
+    }
+    if (cached == UNTRACED_DECISION(generation, FALSE)) {
+        return FALSE;
+    }
+    PyObject* suffixes = self->untraced_suffixes;
+    int skip = FALSE;
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(suffixes) && !skip; i++) {
+        skip = (int)PyUnicode_Tailmatch(
+            code->co_filename, PyTuple_GET_ITEM(suffixes, i), 0, PY_SSIZE_T_MAX, 1);
+        if (skip < 0) {
+            return RET_ERROR;
+        }
+    }
+    if (_PyCode_SetExtra((PyObject*)code, untraced_extra_index, UNTRACED_DECISION(generation, skip)) < 0) {
+        return RET_ERROR;
+    }
+    return skip;
 }
 
 /*
@@ -269,12 +411,13 @@ CTracer_trace(CTracer *self, PyFrameObject *frame, int what, PyObject *arg_unuse
         // const char * funcname = PyUnicode_AsUTF8(PyFrame_GetCode(frame)->co_name);
         // printf("func  { %s @ %s %d\n", funcname, filename, PyFrame_GetLineNumber(frame));
 
-        // TODO: cache this result, perhaps?:
-        const char * filename = PyUnicode_AsUTF8(PyFrame_GetCode(frame)->co_filename);
-        if (EndsWith(filename, "z3types.py") ||
-            EndsWith(filename, "z3core.py") ||
-            EndsWith(filename, "z3.py"))
-        {
+        PyCodeObject * code = PyFrame_GetCode(frame);
+        int untraced = CTracer_is_untraced(self, code);
+        Py_DECREF(code);
+        if (untraced == RET_ERROR) {
+            return RET_ERROR;
+        }
+        if (untraced) {
             dont_trace_frame(frame);
         } else {
             trace_frame(frame);
@@ -401,6 +544,32 @@ CTracer_push_postop_callback(CTracer *self, PyObject *args)
     Py_RETURN_NONE;
 }
 
+static PyObject *
+CTracer_set_untraced_suffixes(CTracer *self, PyObject *args)
+{
+    PyObject *suffixes;
+    if (!PyArg_ParseTuple(args, "O!", &PyTuple_Type, &suffixes)) {
+        return NULL;
+    }
+    for (Py_ssize_t i = 0; i < PyTuple_GET_SIZE(suffixes); i++) {
+        if (!PyUnicode_Check(PyTuple_GET_ITEM(suffixes, i))) {
+            PyErr_SetString(PyExc_TypeError, "untraced suffixes must be strings");
+            return NULL;
+        }
+    }
+    Py_INCREF(suffixes);
+    Py_XSETREF(self->untraced_suffixes, suffixes);
+    self->untraced_generation = next_untraced_generation++;
+    Py_RETURN_NONE;
+}
+
+static PyObject *
+CTracer_get_untraced_suffixes(CTracer *self, PyObject *args_unused)
+{
+    Py_INCREF(self->untraced_suffixes);
+    return self->untraced_suffixes;
+}
+
 static PyObject *
 CTracer_start(CTracer *self, PyObject *args_unused)
 {
@@ -474,6 +643,12 @@ CTracer_methods[] = {
     { "push_module", (PyCFunction) CTracer_push_module, METH_VARARGS,
             PyDoc_STR("Add a module to the tracer") },
 
+    { "set_untraced_suffixes", (PyCFunction) CTracer_set_untraced_suffixes, METH_VARARGS,
+            PyDoc_STR("Skip tracing code in files ending with any of the given suffixes") },
+
+    { "get_untraced_suffixes", (PyCFunction) CTracer_get_untraced_suffixes, METH_NOARGS,
+            PyDoc_STR("Get the file suffixes for which code is not traced") },
+
     { NULL }
 };
 
@@ -636,6 +811,691 @@ TraceSwapType = {
 };
 
 
+/* Value stack access */
+
+
+static PyObject *str__self__;
+static PyObject *str__func__;
+static PyObject *str__name__;
+
+/*
+ * Get a pointer to a slot on the value stack of a frame that is being traced.
+ * Negative indices count back from the top of the stack (-1 is the top).
+ * Returns NULL (with an IndexError set) if the index is out of range.
+ */
+static PyObject **
+frame_stack_slot(PyFrameObject *frame, int idx)
+{
+#if PY_VERSION_HEX >= 0x030B0000
+    _PyInterpreterFrame *iframe = frame->f_frame;
+    int depth = iframe->stacktop - iframe->f_code->co_nlocalsplus;
+    PyObject **top = iframe->localsplus + iframe->stacktop;
+#elif PY_VERSION_HEX >= 0x030A0000
+    int depth = frame->f_stackdepth;
+    PyObject **top = frame->f_valuestack + frame->f_stackdepth;
+#else
+    if (frame->f_stacktop == NULL) {
+        PyErr_SetString(PyExc_IndexError, "frame stack is not available");
+        return NULL;
+    }
+    int depth = (int)(frame->f_stacktop - frame->f_valuestack);
+    PyObject **top = frame->f_stacktop;
+#endif
+    if (idx >= 0 || idx < -depth) {
+        PyErr_Format(PyExc_IndexError,
+            "stack index %d is out of range (stack depth is %d)", idx, depth);
+        return NULL;
+    }
+    return top + idx;
+}
+
+static PyObject *
+frame_stack_read(PyObject *module, PyObject *args)
+{
+    PyFrameObject *frame;
+    int idx;
+    if (!PyArg_ParseTuple(args, "O!i", &PyFrame_Type, &frame, &idx)) {
+        return NULL;
+    }
+    PyObject **slot = frame_stack_slot(frame, idx);
+    if (slot == NULL) {
+        return NULL;
+    }
+    if (*slot == NULL) {
+        PyErr_SetString(PyExc_ValueError, "PyObject is NULL");
+        return NULL;
+    }
+    return Py_NewRef(*slot);
+}
+
+static PyObject *
+frame_stack_write(PyObject *module, PyObject *args)
+{
+    PyFrameObject *frame;
+    int idx;
+    PyObject *value;
+    if (!PyArg_ParseTuple(args, "O!iO", &PyFrame_Type, &frame, &idx, &value)) {
+        return NULL;
+    }
+    PyObject **slot = frame_stack_slot(frame, idx);
+    if (slot == NULL) {
+        return NULL;
+    }
+    Py_XSETREF(*slot, Py_NewRef(value));
+    Py_RETURN_NONE;
+}
+
+/*
+ * Like object.__getattribute__(obj, name), but returns NULL without an error
+ * when the attribute does not exist.
+ */
+static int
+generic_lookup_attr(PyObject *obj, PyObject *name, PyObject **result)
+{
+    *result = PyObject_GenericGetAttr(obj, name);
+    if (*result != NULL) {
+        return RET_OK;
+    }
+    if (!PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        return RET_ERROR;
+    }
+    PyErr_Clear();
+    return RET_OK;
+}
+
+static PyObject *
+frame_call_target(PyObject *module, PyObject *args)
+{
+    /*
+     * Find the callable of the call that the given opcode is about to make.
+     * Bound methods are split into their underlying function and the object
+     * that they're bound to.
+     * Returns (stack index, function, binding target or None), or None if
+     * the opcode does not make a call.
+     */
+    PyFrameObject *frame;
+    int opcode;
+    if (!PyArg_ParseTuple(args, "O!i", &PyFrame_Type, &frame, &opcode)) {
+        return NULL;
+    }
+    PyCodeObject *code = PyFrame_GetCode(frame);
+    PyObject *code_bytes_obj = PyCode_GetCode(code);
+    Py_DECREF(code);
+    if (code_bytes_obj == NULL) {
+        return NULL;
+    }
+    unsigned char *code_bytes = (unsigned char *)PyBytes_AS_STRING(code_bytes_obj);
+    int oparg = code_bytes[PyFrame_GetLasti(frame) + 1];
+    Py_DECREF(code_bytes_obj);
+
+    int fn_idx;
+    switch (opcode) {
+#ifdef CALL
+    case CALL:
+        /* (a method call leaves the method and its receiver on the stack) */
+        fn_idx = -(oparg + 2);
+        break;
+#endif
+#ifdef CALL_FUNCTION
+    case CALL_FUNCTION:
+        fn_idx = -(oparg + 1);
+        break;
+#endif
+#ifdef CALL_FUNCTION_KW
+    case CALL_FUNCTION_KW:
+        fn_idx = -(oparg + 2);
+        break;
+#endif
+#ifdef CALL_METHOD
+    case CALL_METHOD:
+        fn_idx = -(oparg + 2);
+        break;
+#endif
+#ifdef BUILD_TUPLE_UNPACK_WITH_CALL
+    case BUILD_TUPLE_UNPACK_WITH_CALL:
+        fn_idx = -(oparg + 1);
+        break;
+#endif
+    case CALL_FUNCTION_EX:
+        fn_idx = -((oparg & 1) + 2);
+        break;
+    default:
+        Py_RETURN_NONE;
+    }
+    PyObject **slot = frame_stack_slot(frame, fn_idx);
+    if (slot == NULL) {
+        return NULL;
+    }
+#if defined(CALL) || defined(CALL_METHOD)
+    if (*slot == NULL && (0
+#ifdef CALL
+            || opcode == CALL
+#endif
+#ifdef CALL_METHOD
+            || opcode == CALL_METHOD
+#endif
+            )) {
+        /* Not a method call; the callable is in the next slot. */
+        fn_idx++;
+        slot++;
+    }
+#endif
+    if (*slot == NULL) {
+        Py_RETURN_NONE;
+    }
+
+    PyObject *target = Py_NewRef(*slot);
+    PyObject *binding_target = NULL;
+    PyObject *self_obj;
+    if (generic_lookup_attr(target, str__self__, &self_obj) == RET_ERROR) {
+        goto error;
+    }
+    if (self_obj != NULL) {
+        PyObject *func;
+        if (generic_lookup_attr(target, str__func__, &func) == RET_ERROR) {
+            Py_DECREF(self_obj);
+            goto error;
+        }
+        if (func != NULL) {
+            binding_target = self_obj;
+            Py_SETREF(target, func);
+        } else {
+            /*
+             * The implementation is likely in C.
+             * Attempt to get a function via the type:
+             */
+            PyObject *name = PyObject_GetAttr(target, str__name__);
+            if (name == NULL) {
+                Py_DECREF(self_obj);
+                goto error;
+            }
+            PyObject *typelevel_target = PyObject_GetAttr(
+                (PyObject *)Py_TYPE(self_obj), name);
+            Py_DECREF(name);
+            if (typelevel_target != NULL) {
+                binding_target = self_obj;
+                Py_SETREF(target, typelevel_target);
+            } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+                PyErr_Clear();
+                Py_DECREF(self_obj);
+            } else {
+                Py_DECREF(self_obj);
+                goto error;
+            }
+        }
+    }
+    PyObject *result = Py_BuildValue(
+        "(iOO)", fn_idx, target, binding_target ? binding_target : Py_None);
+    Py_DECREF(target);
+    Py_XDECREF(binding_target);
+    return result;
+error:
+    Py_DECREF(target);
+    return NULL;
+}
+
+
+/* Fused opcode interceptors */
+
+
+static int
+stack_peek(PyFrameObject *frame, int idx, PyObject **value)
+{
+    PyObject **slot = frame_stack_slot(frame, idx);
+    if (slot == NULL) {
+        return RET_ERROR;
+    }
+    *value = *slot;  // (borrowed, and possibly NULL)
+    return RET_OK;
+}
+
+static BOOL
+maybe_symbolic(PyObject *value)
+{
+    // CrossHairValues are always instances of classes defined in Python.
+    return value == NULL || PyType_HasFeature(Py_TYPE(value), Py_TPFLAGS_HEAPTYPE);
+}
+
+static int
+stack_maybe_symbolic(PyFrameObject *frame, int idx)
+{
+    PyObject *value;
+    if (stack_peek(frame, idx, &value) == RET_ERROR) {
+        return RET_ERROR;
+    }
+    return maybe_symbolic(value);
+}
+
+static BOOL
+is_atomic_immutable(PyObject *value)
+{
+    // (the exact types in crosshair.util.ATOMIC_IMMUTABLE_TYPES)
+    if (value == NULL) {
+        return FALSE;
+    }
+    PyTypeObject *type = Py_TYPE(value);
+    return (
+        value == Py_None ||
+        type == &PyBool_Type ||
+        type == &PyLong_Type ||
+        type == &PyUnicode_Type ||
+        type == &PyFloat_Type ||
+        type == &PyComplex_Type ||
+        type == &PyFunction_Type ||
+        type == &PyCFunction_Type ||
+        type == &PyMethod_Type
+    );
+}
+
+/*
+ * Decide whether the interceptor for an opcode could have anything to do, given
+ * the operands on the stack. When this returns FALSE, the opcode runs without
+ * leaving C. Returns TRUE, FALSE, or RET_ERROR.
+ */
+static int
+interceptor_wanted(PyFrameObject *frame, int opcode, int oparg)
+{
+    switch (opcode) {
+    case BINARY_SUBSCR: {
+        PyObject *key, *container;
+        if (stack_peek(frame, -1, &key) == RET_ERROR ||
+            stack_peek(frame, -2, &container) == RET_ERROR) {
+            return RET_ERROR;
+        }
+        if (key == NULL || container == NULL) {
+            return TRUE;
+        }
+        if (PyLong_Check(key) || PyFloat_Check(key) || PyUnicode_Check(key)) {
+            return FALSE;
+        }
+        if (PyDict_CheckExact(container)) {
+            return TRUE;
+        }
+        if (PyList_CheckExact(container) && PySlice_Check(key)) {
+            PySliceObject *slice = (PySliceObject *)key;
+            return maybe_symbolic(slice->start) || maybe_symbolic(slice->stop);
+        }
+        return FALSE;
+    }
+#if PY_VERSION_HEX < 0x03090000
+    case COMPARE_OP:
+        if (oparg != PyCmp_IN && oparg != PyCmp_NOT_IN) {
+            return FALSE;
+        }
+        return stack_maybe_symbolic(frame, -2);
+#else
+    case COMPARE_OP:
+        // (containment is checked by CONTAINS_OP on these versions)
+        return FALSE;
+    case CONTAINS_OP:
+        return stack_maybe_symbolic(frame, -2);
+#endif
+    case UNARY_NOT:
+        return stack_maybe_symbolic(frame, -1);
+    case SET_ADD: {
+        PyObject *set, *item;
+        if (stack_peek(frame, -(oparg + 1), &set) == RET_ERROR ||
+            stack_peek(frame, -1, &item) == RET_ERROR) {
+            return RET_ERROR;
+        }
+        return set == NULL || !PySet_Check(set) || maybe_symbolic(item);
+    }
+    case MAP_ADD: {
+        PyObject *dict, *key;
+#if PY_VERSION_HEX >= 0x03080000
+        int key_idx = -2;
+#else
+        int key_idx = -1;
+#endif
+        if (stack_peek(frame, -(oparg + 2), &dict) == RET_ERROR ||
+            stack_peek(frame, key_idx, &key) == RET_ERROR) {
+            return RET_ERROR;
+        }
+        return dict == NULL || !PyDict_Check(dict) || !is_atomic_immutable(key);
+    }
+    case BUILD_STRING:
+        for (int idx = -oparg; idx < 0; idx++) {
+            PyObject *substr;
+            if (stack_peek(frame, idx, &substr) == RET_ERROR) {
+                return RET_ERROR;
+            }
+            if (substr == NULL || !PyUnicode_CheckExact(substr)) {
+                return TRUE;
+            }
+        }
+        return FALSE;
+    case FORMAT_VALUE: {
+        // (the value is below the format spec, if there is one)
+        BOOL has_spec = (oparg & 0x04) != 0;
+        PyObject *value, *spec = NULL;
+        if (stack_peek(frame, has_spec ? -2 : -1, &value) == RET_ERROR ||
+            (has_spec && stack_peek(frame, -1, &spec) == RET_ERROR)) {
+            return RET_ERROR;
+        }
+        if (!is_atomic_immutable(value)) {
+            return TRUE;
+        }
+        return has_spec && (spec == NULL || !PyUnicode_CheckExact(spec));
+    }
+    default:
+        return TRUE;
+    }
+}
+
+static int
+InterceptorTable_init(InterceptorTable *self, PyObject *args, PyObject *kwds_unused)
+{
+    PyObject *handlers;
+    if (!PyArg_ParseTuple(args, "O!", &PyDict_Type, &handlers)) {
+        return RET_ERROR;
+    }
+    PyObject *opcodes = PyFrozenSet_New(NULL);
+    if (opcodes == NULL) {
+        return RET_ERROR;
+    }
+    PyObject *opcode_obj, *handler;
+    Py_ssize_t pos = 0;
+    while (PyDict_Next(handlers, &pos, &opcode_obj, &handler)) {
+        int opcode;
+        if (pyint_as_int(opcode_obj, &opcode) == RET_ERROR) {
+            Py_DECREF(opcodes);
+            return RET_ERROR;
+        }
+        if (opcode < 0 || opcode > 255) {
+            Py_DECREF(opcodes);
+            PyErr_Format(PyExc_ValueError, "invalid opcode: %d", opcode);
+            return RET_ERROR;
+        }
+        if (PySet_Add(opcodes, opcode_obj) < 0) {
+            Py_DECREF(opcodes);
+            return RET_ERROR;
+        }
+        Py_XSETREF(self->handlers[opcode], Py_NewRef(handler));
+    }
+    Py_XSETREF(self->opcodes_wanted, opcodes);
+    return RET_OK;
+}
+
+static void
+InterceptorTable_dealloc(InterceptorTable *self)
+{
+    for (int opcode = 0; opcode < 256; opcode++) {
+        Py_XDECREF(self->handlers[opcode]);
+    }
+    Py_XDECREF(self->opcodes_wanted);
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+static PyMemberDef
+InterceptorTable_members[] = {
+    { "opcodes_wanted", T_OBJECT, offsetof(InterceptorTable, opcodes_wanted), READONLY,
+            PyDoc_STR("The opcodes that have handlers") },
+    { NULL }
+};
+
+PyTypeObject
+InterceptorTableType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_crosshair_tracers.InterceptorTable", /*tp_name*/
+    sizeof(InterceptorTable),  /*tp_basicsize*/
+    0,                         /*tp_itemsize*/
+    (destructor)InterceptorTable_dealloc, /*tp_dealloc*/
+    0,                         /*tp_print*/
+    0,                         /*tp_getattr*/
+    0,                         /*tp_setattr*/
+    0,                         /*tp_compare*/
+    0,                         /*tp_repr*/
+    0,                         /*tp_as_number*/
+    0,                         /*tp_as_sequence*/
+    0,                         /*tp_as_mapping*/
+    0,                         /*tp_hash */
+    0,                         /*tp_call*/
+    0,                         /*tp_str*/
+    0,                         /*tp_getattro*/
+    0,                         /*tp_setattro*/
+    0,                         /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT,        /*tp_flags*/
+    "A tracing module that dispatches to opcode interceptors, skipping the "
+    "instructions whose operands are all concrete", /* tp_doc */
+    0,                         /* tp_traverse */
+    0,                         /* tp_clear */
+    0,                         /* tp_richcompare */
+    0,                         /* tp_weaklistoffset */
+    0,                         /* tp_iter */
+    0,                         /* tp_iternext */
+    0,                         /* tp_methods */
+    InterceptorTable_members,  /* tp_members */
+    0,                         /* tp_getset */
+    0,                         /* tp_base */
+    0,                         /* tp_dict */
+    0,                         /* tp_descr_get */
+    0,                         /* tp_descr_set */
+    0,                         /* tp_dictoffset */
+    (initproc)InterceptorTable_init, /* tp_init */
+    0,                         /* tp_alloc */
+    0,                         /* tp_new */
+};
+
+
+/* Opcode coverage */
+
+
+static void
+CoverageRecorder_clear(CoverageRecorder *self)
+{
+    if (self->bitmaps != NULL) {
+        Py_ssize_t count = PyTuple_GET_SIZE(self->codes);
+        for (Py_ssize_t i = 0; i < count; i++) {
+            PyMem_Free(self->bitmaps[i]);
+        }
+        PyMem_Free(self->bitmaps);
+        self->bitmaps = NULL;
+    }
+    Py_CLEAR(self->codes);
+}
+
+static int
+CoverageRecorder_init(CoverageRecorder *self, PyObject *args, PyObject *kwds_unused)
+{
+    PyObject *codes;
+    if (!PyArg_ParseTuple(args, "O!", &PyTuple_Type, &codes)) {
+        return RET_ERROR;
+    }
+    CoverageRecorder_clear(self);
+    Py_ssize_t count = PyTuple_GET_SIZE(codes);
+    unsigned char **bitmaps = PyMem_Calloc(count ? count : 1, sizeof(unsigned char *));
+    if (bitmaps == NULL) {
+        PyErr_NoMemory();
+        return RET_ERROR;
+    }
+    self->codes = Py_NewRef(codes);
+    self->bitmaps = bitmaps;
+    for (Py_ssize_t i = 0; i < count; i++) {
+        PyObject *code = PyTuple_GET_ITEM(codes, i);
+        if (!PyCode_Check(code)) {
+            PyErr_SetString(PyExc_TypeError, "CoverageRecorder expects code objects");
+            return RET_ERROR;
+        }
+        PyObject *code_bytes = PyCode_GetCode((PyCodeObject *)code);
+        if (code_bytes == NULL) {
+            return RET_ERROR;
+        }
+        // (instructions are two bytes wide)
+        Py_ssize_t num_instructions = PyBytes_GET_SIZE(code_bytes) / 2;
+        Py_DECREF(code_bytes);
+        bitmaps[i] = PyMem_Calloc(num_instructions / 8 + 1, 1);
+        if (bitmaps[i] == NULL) {
+            PyErr_NoMemory();
+            return RET_ERROR;
+        }
+    }
+    return RET_OK;
+}
+
+static void
+CoverageRecorder_dealloc(CoverageRecorder *self)
+{
+    CoverageRecorder_clear(self);
+    Py_TYPE(self)->tp_free((PyObject*)self);
+}
+
+static void
+coverage_record(CoverageRecorder *self, PyObject *code, int lasti)
+{
+    if (self->bitmaps == NULL || lasti < 0) {
+        return;
+    }
+    Py_ssize_t count = PyTuple_GET_SIZE(self->codes);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        if (PyTuple_GET_ITEM(self->codes, i) == code) {
+            int instruction = lasti / 2;
+            self->bitmaps[i][instruction / 8] |= (unsigned char)(1 << (instruction % 8));
+            return;
+        }
+    }
+}
+
+static PyObject *
+CoverageRecorder_offsets_covered(CoverageRecorder *self, PyObject *code)
+{
+    PyObject *offsets = PySet_New(NULL);
+    if (offsets == NULL || self->bitmaps == NULL) {
+        return offsets;
+    }
+    Py_ssize_t count = PyTuple_GET_SIZE(self->codes);
+    for (Py_ssize_t i = 0; i < count; i++) {
+        if (PyTuple_GET_ITEM(self->codes, i) != code) {
+            continue;
+        }
+        PyObject *code_bytes = PyCode_GetCode((PyCodeObject *)code);
+        if (code_bytes == NULL) {
+            Py_DECREF(offsets);
+            return NULL;
+        }
+        Py_ssize_t num_instructions = PyBytes_GET_SIZE(code_bytes) / 2;
+        Py_DECREF(code_bytes);
+        unsigned char *bitmap = self->bitmaps[i];
+        for (Py_ssize_t instruction = 0; instruction < num_instructions; instruction++) {
+            if (!(bitmap[instruction / 8] & (1 << (instruction % 8)))) {
+                continue;
+            }
+            PyObject *offset = PyLong_FromSsize_t(instruction * 2);
+            if (offset == NULL || PySet_Add(offsets, offset) < 0) {
+                Py_XDECREF(offset);
+                Py_DECREF(offsets);
+                return NULL;
+            }
+            Py_DECREF(offset);
+        }
+        break;
+    }
+    return offsets;
+}
+
+static PyMethodDef
+CoverageRecorder_methods[] = {
+    { "offsets_covered", (PyCFunction) CoverageRecorder_offsets_covered, METH_O,
+            PyDoc_STR("Get the set of instruction offsets executed in a code object") },
+    { NULL }
+};
+
+PyTypeObject
+CoverageRecorderType = {
+    PyVarObject_HEAD_INIT(NULL, 0)
+    "_crosshair_tracers.CoverageRecorder", /*tp_name*/
+    sizeof(CoverageRecorder),  /*tp_basicsize*/
+    0,                         /*tp_itemsize*/
+    (destructor)CoverageRecorder_dealloc, /*tp_dealloc*/
+    0,                         /*tp_print*/
+    0,                         /*tp_getattr*/
+    0,                         /*tp_setattr*/
+    0,                         /*tp_compare*/
+    0,                         /*tp_repr*/
+    0,                         /*tp_as_number*/
+    0,                         /*tp_as_sequence*/
+    0,                         /*tp_as_mapping*/
+    0,                         /*tp_hash */
+    0,                         /*tp_call*/
+    0,                         /*tp_str*/
+    0,                         /*tp_getattro*/
+    0,                         /*tp_setattro*/
+    0,                         /*tp_as_buffer*/
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_BASETYPE, /*tp_flags*/
+    "A tracing module that records the instructions executed in some code "
+    "objects", /* tp_doc */
+    0,                         /* tp_traverse */
+    0,                         /* tp_clear */
+    0,                         /* tp_richcompare */
+    0,                         /* tp_weaklistoffset */
+    0,                         /* tp_iter */
+    0,                         /* tp_iternext */
+    CoverageRecorder_methods,  /* tp_methods */
+    0,                         /* tp_members */
+    0,                         /* tp_getset */
+    0,                         /* tp_base */
+    0,                         /* tp_dict */
+    0,                         /* tp_descr_get */
+    0,                         /* tp_descr_set */
+    0,                         /* tp_dictoffset */
+    (initproc)CoverageRecorder_init, /* tp_init */
+    0,                         /* tp_alloc */
+    0,                         /* tp_new */
+};
+
+
+/* Branch site fingerprints */
+
+
+static PyObject *
+stack_fingerprint(PyObject *module, PyObject *args)
+{
+    /*
+     * Hash the code locations (filename, first line, name, and instruction
+     * offset) of `depth` stack frames, after skipping the innermost `skip`
+     * frames of the caller.
+     * This identifies a decision point far more cheaply than formatting the
+     * filenames and line numbers of those frames.
+     * We hash the contents of the code objects rather than their addresses:
+     * code that is re-created on each path (by exec(), namedtuple, dataclasses,
+     * ...) must get the same fingerprint every time, and a freed code object's
+     * address may be reused by unrelated code.
+     */
+    int skip, depth;
+    if (!PyArg_ParseTuple(args, "ii", &skip, &depth)) {
+        return NULL;
+    }
+    PyFrameObject * frame = PyEval_GetFrame();
+    Py_XINCREF(frame);
+    for (; skip > 0 && frame != NULL; skip--) {
+        PyFrameObject * back = PyFrame_GetBack(frame);
+        Py_DECREF(frame);
+        frame = back;
+    }
+    Py_uhash_t hash = 0x345678UL;
+    for (; depth > 0 && frame != NULL; depth--) {
+        PyCodeObject * code = PyFrame_GetCode(frame);
+        /* (str hashes are cached, so these are cheap after the first time) */
+        Py_hash_t filename_hash = PyObject_Hash(code->co_filename);
+        Py_hash_t name_hash = PyObject_Hash(code->co_name);
+        int firstlineno = code->co_firstlineno;
+        Py_DECREF(code);
+        if (filename_hash == -1 || name_hash == -1) {
+            Py_DECREF(frame);
+            return NULL;
+        }
+        hash = (hash ^ (Py_uhash_t)filename_hash) * 1000003UL;
+        hash = (hash ^ (Py_uhash_t)name_hash) * 1000003UL;
+        hash = (hash ^ (Py_uhash_t)firstlineno) * 1000003UL;
+        hash = (hash ^ (Py_uhash_t)PyFrame_GetLasti(frame)) * 1000003UL;
+        PyFrameObject * back = PyFrame_GetBack(frame);
+        Py_DECREF(frame);
+        frame = back;
+    }
+    Py_XDECREF(frame);
+    return PyLong_FromSsize_t((Py_ssize_t)hash);
+}
+
+
 /* Module definition */
 
 
@@ -643,6 +1503,14 @@ TraceSwapType = {
 
 
 static PyMethodDef TracersMethods[] = {
+    {"stack_fingerprint", stack_fingerprint, METH_VARARGS,
+            PyDoc_STR("Hash the code locations of some of the calling frames.")},
+    {"frame_stack_read", frame_stack_read, METH_VARARGS,
+            PyDoc_STR("Read a value from the stack of a traced frame.")},
+    {"frame_stack_write", frame_stack_write, METH_VARARGS,
+            PyDoc_STR("Replace a value on the stack of a traced frame.")},
+    {"frame_call_target", frame_call_target, METH_VARARGS,
+            PyDoc_STR("Find the callable that a call opcode is about to invoke.")},
     {NULL, NULL, 0, NULL}        /* Sentinel */
 };
 
@@ -668,6 +1536,20 @@ PyInit__crosshair_tracers(void)
         return NULL;
     }
 
+    str__self__ = PyUnicode_InternFromString("__self__");
+    str__func__ = PyUnicode_InternFromString("__func__");
+    str__name__ = PyUnicode_InternFromString("__name__");
+    if (str__self__ == NULL || str__func__ == NULL || str__name__ == NULL) {
+        Py_DECREF(mod);
+        return NULL;
+    }
+
+    untraced_extra_index = _PyEval_RequestCodeExtraIndex(NULL);
+    if (untraced_extra_index < 0) {
+        Py_DECREF(mod);
+        return NULL;
+    }
+
     /* Initialize CTracer */
     CTracerType.tp_new = PyType_GenericNew;
     if (PyType_Ready(&CTracerType) < 0) {
@@ -698,5 +1580,33 @@ PyInit__crosshair_tracers(void)
         return NULL;
     }
 
+    /* Initialize InterceptorTable */
+    InterceptorTableType.tp_new = PyType_GenericNew;
+    if (PyType_Ready(&InterceptorTableType) < 0) {
+        Py_DECREF(mod);
+        return NULL;
+    }
+
+    Py_INCREF(&InterceptorTableType);
+    if (PyModule_AddObject(mod, "InterceptorTable", (PyObject *)&InterceptorTableType) < 0) {
+        Py_DECREF(mod);
+        Py_DECREF(&InterceptorTableType);
+        return NULL;
+    }
+
+    /* Initialize CoverageRecorder */
+    CoverageRecorderType.tp_new = PyType_GenericNew;
+    if (PyType_Ready(&CoverageRecorderType) < 0) {
+        Py_DECREF(mod);
+        return NULL;
+    }
+
+    Py_INCREF(&CoverageRecorderType);
+    if (PyModule_AddObject(mod, "CoverageRecorder", (PyObject *)&CoverageRecorderType) < 0) {
+        Py_DECREF(mod);
+        Py_DECREF(&CoverageRecorderType);
+        return NULL;
+    }
+
     return mod;
 }
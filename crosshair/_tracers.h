@@ -13,6 +13,17 @@ typedef int BOOL;
 #define TRUE    1
 
 
+#if PY_VERSION_HEX < 0x03090000
+#define PyObject_Vectorcall(callable, args, nargsf, kwnames) \
+    _PyObject_FastCall((callable), (PyObject **)(args), (nargsf))
+#endif
+
+#if PY_VERSION_HEX >= 0x030C0000
+#define _PyEval_RequestCodeExtraIndex PyUnstable_Eval_RequestCodeExtraIndex
+#define _PyCode_GetExtra PyUnstable_Code_GetExtra
+#define _PyCode_SetExtra PyUnstable_Code_SetExtra
+#endif
+
 #define DEFINE_VEC(N, T, INITNAME, PUSHNAME) \
 typedef struct N {int count; int capacity; T * items;} N ; \
 void INITNAME (N * vec, int cap) \
@@ -46,6 +57,8 @@ int PUSHNAME (N * vec, T item) \
 
 typedef struct HandlerTable {
     PyObject * entries[256];
+    // For each entry, a tuple of the code objects it applies to (NULL for all):
+    PyObject * code_filters[256];
 } HandlerTable;
 
 
@@ -61,7 +74,12 @@ DEFINE_VEC(TableVec, HandlerTable, init_tablevec, push_table_entry)
 typedef struct CTracer {
     PyObject_HEAD
     ModuleVec modules;
+    ModuleVec code_filters;  // (parallel to modules; a tuple or Py_None each)
     TableVec handlers;
+    PyObject* last_code;
+    PyObject* last_code_bytes;
+    PyObject* untraced_suffixes;  // (a tuple of str)
+    uintptr_t untraced_generation;
     FrameAndCallbackVec postop_callbacks;
     BOOL enabled;
     BOOL handling;
@@ -78,4 +96,20 @@ typedef struct TraceSwap {
 
 extern PyTypeObject TraceSwapType;
 
+typedef struct InterceptorTable {
+    PyObject_HEAD
+    PyObject* handlers[256];  // (NULL for opcodes without a handler)
+    PyObject* opcodes_wanted;  // (a frozenset)
+} InterceptorTable;
+
+extern PyTypeObject InterceptorTableType;
+
+typedef struct CoverageRecorder {
+    PyObject_HEAD
+    PyObject* codes;  // (a tuple of the code objects to record)
+    unsigned char** bitmaps;  // (parallel to codes; one bit per instruction)
+} CoverageRecorder;
+
+extern PyTypeObject CoverageRecorderType;
+
 #endif /* _COVERAGE_TRACER_H */
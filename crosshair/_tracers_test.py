@@ -1,9 +1,18 @@
+import dis
 import gc
 import sys
 
 import pytest
 
-from _crosshair_tracers import CTracer  # type: ignore
+from _crosshair_tracers import (  # type: ignore
+    CoverageRecorder,
+    CTracer,
+    InterceptorTable,
+    frame_call_target,
+    frame_stack_read,
+    frame_stack_write,
+    stack_fingerprint,
+)
 
 
 class ExampleModule:
@@ -74,3 +83,236 @@ def test_CTracer_does_not_leak_memory():
     if sys.platform == "darwin":
         usage_increase /= 1024  # (it's bytes on osx)
     assert usage_increase < 25
+
+
+class RecordingModule:
+    opcodes_wanted = frozenset(range(256))
+
+    def __init__(self, codeobjects_wanted=None):
+        self.codeobjects_wanted = codeobjects_wanted
+        self.codeobjects_seen = set()
+
+    def __call__(self, frame, codeobj, codenum, extra):
+        assert codeobj is frame.f_code
+        assert isinstance(codenum, int)
+        self.codeobjects_seen.add(codeobj)
+
+
+def _traced_helper():
+    return 42
+
+
+def _untraced_helper():
+    return 24
+
+
+def test_CTracer_code_object_filter():
+    unfiltered = RecordingModule()
+    filtered = RecordingModule(frozenset([_traced_helper.__code__]))
+    tracer = CTracer()
+    tracer.push_module(unfiltered)
+    tracer.push_module(filtered)
+    tracer.start()
+    _traced_helper()
+    _untraced_helper()
+    tracer.stop()
+    tracer.pop_module(filtered)
+    tracer.pop_module(unfiltered)
+    assert filtered.codeobjects_seen == {_traced_helper.__code__}
+    assert _untraced_helper.__code__ in unfiltered.codeobjects_seen
+
+
+def test_CTracer_rejects_bad_code_object_filter():
+    with pytest.raises(TypeError):
+        CTracer().push_module(RecordingModule([_traced_helper.__code__]))
+
+
+def test_CTracer_code_object_refcounts_dont_leak():
+    code = _traced_helper.__code__
+    tracer = CTracer()
+    tracer.push_module(ExampleModule())
+    refcount = sys.getrefcount(code)
+    tracer.start()
+    for _ in range(10):
+        _traced_helper()
+    tracer.stop()
+    del tracer
+    gc.collect()
+    assert sys.getrefcount(code) == refcount
+
+
+def test_CTracer_untraced_suffixes():
+    tracer = CTracer()
+    assert tracer.get_untraced_suffixes() == ()
+    with pytest.raises(TypeError):
+        tracer.set_untraced_suffixes(("_tracers_test.py", 42))
+    module = RecordingModule()
+    tracer.push_module(module)
+    tracer.set_untraced_suffixes(("_tracers_test.py",))
+    tracer.start()
+    _traced_helper()
+    tracer.stop()
+    assert _traced_helper.__code__ not in module.codeobjects_seen
+    # Changing the suffixes must invalidate the cached decision:
+    tracer.set_untraced_suffixes(())
+    tracer.start()
+    _traced_helper()
+    tracer.stop()
+    tracer.pop_module(module)
+    assert _traced_helper.__code__ in module.codeobjects_seen
+
+
+def _fingerprint_from_helper():
+    return stack_fingerprint(1, 2)
+
+
+def test_stack_fingerprint():
+    def call_site_a():
+        return _fingerprint_from_helper()
+
+    def call_site_b():
+        return _fingerprint_from_helper()
+
+    assert len({call_site_a() for _ in range(3)}) == 1
+    assert call_site_a() != call_site_b()
+    # Distinct instructions on the same line are distinguished:
+    first, second = (stack_fingerprint(0, 1), stack_fingerprint(0, 1))
+    assert first != second
+    # Skipping past the top of the stack hashes nothing:
+    assert stack_fingerprint(10_000, 8) == stack_fingerprint(10_001, 8)
+
+
+def test_stack_fingerprint_of_recreated_code():
+    # Code that is compiled anew (as exec(), namedtuple, etc do) gets the same
+    # fingerprint each time:
+    src = "def fingerprint():\n    return stack_fingerprint(0, 1)\n"
+    fingerprints = set()
+    for _ in range(3):
+        namespace = {"stack_fingerprint": stack_fingerprint}
+        exec(compile(src, "<generated>", "exec"), namespace)
+        fingerprints.add(namespace["fingerprint"]())
+    assert len(fingerprints) == 1
+
+
+class CallTargetModule:
+    opcodes_wanted = frozenset(range(256))
+
+    def __init__(self, codeobject, replacements=None):
+        self.codeobjects_wanted = frozenset([codeobject])
+        self.replacements = replacements or {}
+        self.targets = []
+
+    def __call__(self, frame, codeobj, codenum, extra):
+        call_info = frame_call_target(frame, codenum)
+        if call_info is None:
+            return
+        (fn_idx, target, binding_target) = call_info
+        self.targets.append((target, binding_target))
+        replacement = self.replacements.get(target)
+        if replacement is not None:
+            assert frame_stack_read(frame, fn_idx) is target
+            frame_stack_write(frame, fn_idx, replacement)
+
+
+class _Greeter:
+    def greet(self):
+        return "hi"
+
+
+def _calls_helper(greeter, items):
+    _traced_helper()
+    greeter.greet()  # (method calls leave the unbound function on the stack)
+    greet, append = (greeter.greet, items.append)
+    # (a star-call keeps the bound method on the stack on every Python version)
+    greet(*())
+    append(*(1,))
+    return _traced_helper()
+
+
+def _run_traced(module, fn, *args):
+    tracer = CTracer()
+    tracer.push_module(module)
+    tracer.start()
+    try:
+        return fn(*args)
+    finally:
+        tracer.stop()
+        tracer.pop_module(module)
+
+
+def test_frame_call_target():
+    greeter, items = _Greeter(), []
+    module = CallTargetModule(_calls_helper.__code__)
+    assert _run_traced(module, _calls_helper, greeter, items) == 42
+    assert module.targets == [
+        (_traced_helper, None),
+        (_Greeter.greet, None),
+        (_Greeter.greet, greeter),
+        (list.append, items),
+        (_traced_helper, None),
+    ]
+
+
+def test_frame_stack_write_replaces_call_target():
+    module = CallTargetModule(
+        _calls_helper.__code__, {_traced_helper: _untraced_helper}
+    )
+    assert _run_traced(module, _calls_helper, _Greeter(), []) == 24
+
+
+def test_frame_stack_read_checks_bounds():
+    def read_past_top(frame, codeobj, codenum, extra):
+        with pytest.raises(IndexError):
+            frame_stack_read(frame, 0)
+        with pytest.raises(IndexError):
+            frame_stack_read(frame, -10_000)
+
+    read_past_top.opcodes_wanted = frozenset(range(256))
+    read_past_top.codeobjects_wanted = frozenset([_traced_helper.__code__])
+    _run_traced(read_past_top, _traced_helper)
+
+
+class SubscriptKeyRecorder:
+    def __init__(self):
+        self.keys = []
+
+    def __call__(self, frame, codeobj, codenum, extra):
+        self.keys.append(frame_stack_read(frame, -1))
+
+
+def _subscripts(items, mapping):
+    return (items[0], items[:1], mapping["a"], mapping[(1, 2)])
+
+
+def test_InterceptorTable_skips_concrete_operands():
+    recorder = SubscriptKeyRecorder()
+    binary_subscr = dis.opmap["BINARY_SUBSCR"]
+    table = InterceptorTable({binary_subscr: recorder})
+    assert table.opcodes_wanted == frozenset([binary_subscr])
+    _run_traced(table, _subscripts, [1], {"a": 2, (1, 2): 3})
+    # Only the (non-atomic) tuple key on a dict gets to the interceptor:
+    assert recorder.keys == [(1, 2)]
+
+
+class ExampleCoverageRecorder(CoverageRecorder):
+    opcodes_wanted = frozenset(range(256))
+
+    def __init__(self, *codes):
+        self.codeobjects_wanted = frozenset(codes)
+        super().__init__(codes)
+
+
+def test_CoverageRecorder():
+    code = _traced_helper.__code__
+    recorder = ExampleCoverageRecorder(code)
+    assert recorder.offsets_covered(code) == set()
+    _run_traced(recorder, _calls_helper, _Greeter(), [])
+    return_offsets = {
+        i.offset for i in dis.get_instructions(code) if i.opname == "RETURN_VALUE"
+    }
+    assert return_offsets <= recorder.offsets_covered(code)
+    assert recorder.offsets_covered(code) <= {
+        i.offset for i in dis.get_instructions(code)
+    }
+    # Other code objects are not recorded:
+    assert recorder.offsets_covered(_calls_helper.__code__) == set()
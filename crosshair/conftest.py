@@ -1,3 +1,4 @@
+import os
 from sys import argv
 
 import pytest
@@ -11,6 +12,16 @@ def pytest_configure(config):
         set_debug(True)
 
 
+@pytest.fixture(autouse=True, scope="session")
+def isolated_subclass_cache(tmp_path_factory):
+    # Keep the subclass map's disk cache out of the user's own cache directory:
+    cache_dir = str(tmp_path_factory.mktemp("cache"))
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setenv("XDG_CACHE_HOME", cache_dir)
+        monkeypatch.setenv("LOCALAPPDATA", cache_dir)
+        yield
+
+
 @pytest.fixture()
 def space():
     with standalone_statespace as spc, NoTracing():
@@ -8,7 +8,7 @@ from copy import _reconstruct  # type: ignore
 from copy import Error
 from copyreg import dispatch_table  # type: ignore
 from enum import Enum
-from typing import Any, Dict
+from typing import Any, Dict, Sequence
 
 from crosshair.tracers import is_tracing
 from crosshair.util import debug
@@ -35,6 +35,8 @@ def deepcopyext(obj: object, mode: CopyMode, memo: Dict) -> Any:
                 # Do shallow realization here, and then fall through to
                 # _deepconstruct below.
                 obj = obj.__ch_realize__()  # type: ignore
+                if type(obj) in (list, tuple):
+                    _realize_members_together(obj, memo)
         if cpy is _MISSING:
             try:
                 cpy = _deepconstruct(obj, mode, memo)
@@ -48,6 +50,27 @@ def deepcopyext(obj: object, mode: CopyMode, memo: Dict) -> Any:
     return cpy
 
 
+def _realize_members_together(items: Sequence, memo: Dict) -> None:
+    """
+    Realize the members of a (freshly realized) list or tuple in bulk.
+
+    Members whose class defines `__ch_realize_many__` are realized with one call per
+    class, rather than one at a time; the results are placed in the memo.
+    """
+    groups: Dict[type, Dict[int, object]] = {}
+    for item in items:
+        cls = type(item)
+        if hasattr(cls, "__ch_realize_many__") and id(item) not in memo:
+            groups.setdefault(cls, {})[id(item)] = item
+    for cls, group in groups.items():
+        if len(group) < 2:
+            continue
+        members = list(group.values())
+        for member, value in zip(members, cls.__ch_realize_many__(members)):
+            memo[id(member)] = value
+            _keep_alive(member, memo)
+
+
 def _deepconstruct(obj: object, mode: CopyMode, memo: Dict):
     cls = type(obj)
 
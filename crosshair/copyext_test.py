@@ -1,6 +1,6 @@
 from copy import deepcopy
 from threading import RLock
-from typing import Tuple
+from typing import List, Tuple
 
 import pytest
 
@@ -51,3 +51,17 @@ def test_deepcopyext_realize():
 def test_deepcopyext_tuple_type():
     assert deepcopy(Tuple) is Tuple
     assert deepcopyext(Tuple, CopyMode.REALIZE, {}) is Tuple
+
+
+def test_deepcopyext_realizes_members_together():
+    with standalone_statespace as space:
+        xs = proxy_for_type(List[int], "xs")
+        xslen = len(xs)
+        with NoTracing():
+            space.add(xslen.var == 5)
+            num_choices = len(space.choices_made)
+            realized = deepcopyext(xs, CopyMode.REALIZE, {})
+            assert type(realized) is list and len(realized) == 5
+            assert all(type(x) is int for x in realized)
+            # One decision per iteration (plus the end) and one for all of the values:
+            assert len(space.choices_made) - num_choices == 7
@@ -8,11 +8,15 @@
 # TODO: mutating symbolic Callables?
 # TODO: contracts on the contracts of function and object inputs/outputs?
 
+import atexit
+import collections
 import enum
 import functools
 import inspect
 import itertools
 import linecache
+import multiprocessing
+import multiprocessing.pool
 import os.path
 import sys
 import time
@@ -51,6 +55,7 @@ import typing_inspect  # type: ignore
 import z3  # type: ignore
 
 from crosshair import dynamic_typing
+from crosshair.auditwall import engage_auditwall, opened_auditwall
 from crosshair.codeconfig import collect_options
 from crosshair.condition_parser import (
     ConditionExpr,
@@ -67,7 +72,7 @@ from crosshair.enforce import (
     PreconditionFailed,
     WithEnforcement,
 )
-from crosshair.fnutil import FunctionInfo, resolve_signature
+from crosshair.fnutil import FunctionInfo, NotFound, resolve_signature, walk_qualname
 from crosshair.options import DEFAULT_OPTIONS, AnalysisOptions, AnalysisOptionSet
 from crosshair.register_contract import get_contract
 from crosshair.statespace import (
@@ -76,11 +81,13 @@ from crosshair.statespace import (
     MessageType,
     NotDeterministic,
     RootNode,
+    SearchLeaf,
     SimpleStateSpace,
     StateSpace,
     StateSpaceContext,
     VerificationStatus,
     context_statespace,
+    merge_node_results,
     optional_context_statespace,
     prefer_true,
 )
@@ -93,7 +100,12 @@ from crosshair.tracers import (
     TracingModule,
     is_tracing,
 )
-from crosshair.type_repo import get_subclass_map
+from crosshair.type_repo import (
+    get_subclass_map,
+    pop_subclass_map_stats,
+    reset_type_lattice,
+    update_subclass_map,
+)
 from crosshair.util import (
     ATOMIC_IMMUTABLE_TYPES,
     UNABLE_TO_REPR_TEXT,
@@ -107,6 +119,7 @@ from crosshair.util import (
     eval_friendly_repr,
     format_boundargs,
     frame_summary_for_fn,
+    import_module,
     name_of_type,
     samefile,
     smtlib_typename,
@@ -126,7 +139,10 @@ _PATCH_FN_TYPE_REGISTRATIONS: Dict[type, Callable] = {}
 
 class Patched(TracingModule):
     def __enter__(self):
-        pushed = [PatchingModule(_PATCH_REGISTRATIONS, _PATCH_FN_TYPE_REGISTRATIONS)]
+        self.patching_module = PatchingModule(
+            _PATCH_REGISTRATIONS, _PATCH_FN_TYPE_REGISTRATIONS
+        )
+        pushed: List[TracingModule] = [self.patching_module]
         pushed.extend(_OPCODE_PATCHES)
         if len(_OPCODE_PATCHES) == 0:
             raise CrosshairInternal("Opcode patches haven't been loaded yet.")
@@ -675,43 +691,55 @@ class ConditionCheckable(Checkable):
     def analyze(self) -> Iterable[AnalysisMessage]:
         options = self.options
         conditions = self.conditions
-        debug('Analyzing postcondition: "', conditions.post[0].expr_source, '"')
+        debug(
+            "Analyzing postcondition(s): ",
+            ",".join([f'"{p.expr_source}"' for p in conditions.post]),
+        )
         debug(
             "assuming preconditions: ",
             ",".join([p.expr_source for p in conditions.pre]),
         )
-        options.deadline = time.monotonic() + options.per_condition_timeout
+        # (a combined check gets the time budget of each of its postconditions)
+        options.deadline = time.monotonic() + options.per_condition_timeout * len(
+            conditions.post
+        )
 
+        search = None
+        if options.parallel_search_depth > 0 and len(conditions.post) == 1:
+            search = search_calltree_in_parallel(self.ctxfn, options, conditions)
         with condition_parser(options.analysis_kind):
-            analysis = analyze_calltree(options, conditions)
-
-        (condition,) = conditions.post
-        if analysis.verification_status is VerificationStatus.UNKNOWN:
-            message = "Not confirmed."
-            analysis.messages = [
-                AnalysisMessage(
-                    MessageType.CANNOT_CONFIRM,
-                    message,
-                    condition.filename,
-                    condition.line,
-                    0,
-                    "",
-                )
-            ]
-        elif analysis.verification_status is VerificationStatus.CONFIRMED:
-            message = "Confirmed over all paths."
-            analysis.messages = [
-                AnalysisMessage(
-                    MessageType.CONFIRMED,
-                    message,
-                    condition.filename,
-                    condition.line,
-                    0,
-                    "",
-                )
-            ]
+            analyses = analyze_calltree_for_each_postcondition(
+                options, conditions, search
+            )
 
-        return analysis.messages
+        messages: List[AnalysisMessage] = []
+        for condition, analysis in zip(conditions.post, analyses):
+            if analysis.verification_status is VerificationStatus.UNKNOWN:
+                message = "Not confirmed."
+                analysis.messages = [
+                    AnalysisMessage(
+                        MessageType.CANNOT_CONFIRM,
+                        message,
+                        condition.filename,
+                        condition.line,
+                        0,
+                        "",
+                    )
+                ]
+            elif analysis.verification_status is VerificationStatus.CONFIRMED:
+                message = "Confirmed over all paths."
+                analysis.messages = [
+                    AnalysisMessage(
+                        MessageType.CONFIRMED,
+                        message,
+                        condition.filename,
+                        condition.line,
+                        0,
+                        "",
+                    )
+                ]
+            messages.extend(analysis.messages)
+        return messages
 
 
 class ClampedCheckable(Checkable):
@@ -858,12 +886,21 @@ def analyze_function(
             for syntax_message in syntax_messages
         ]
         return [SyntaxErrorCheckable(messages)]
+    post_conditions = [p for p in conditions.post if p.evaluate is not None]
+    if full_options.combine_postconditions:
+        if not post_conditions:
+            return []
+        # Explore the function once, checking all postconditions on each path:
+        return [
+            ConditionCheckable(
+                ctxfn, full_options, replace(conditions, post=post_conditions)
+            )
+        ]
     return [
         ConditionCheckable(
             ctxfn, full_options, replace(conditions, post=[post_condition])
         )
-        for post_condition in conditions.post
-        if post_condition.evaluate is not None
+        for post_condition in post_conditions
     ]
 
 
@@ -1018,20 +1055,72 @@ class CallTreeAnalysis:
     num_confirmed_paths: int = 0
 
 
-def analyze_calltree(
-    options: AnalysisOptions, conditions: Conditions
-) -> CallTreeAnalysis:
-    fn = conditions.fn
-    debug("Begin analyze calltree ", fn.__name__)
+@dataclass
+class CallTreeSearch:
+    """The raw outcome of exploring (some part of) the search tree for a condition."""
 
-    all_messages = MessageCollector()
-    search_root = RootNode()
+    top_analysis: CallAnalysis
+    exhausted: bool
+    failing_precondition: Optional[ConditionExpr]
+    failing_precondition_reason: str = ""
+    num_confirmed_paths: int = 0
+    num_iterations: int = 0
+    # How many decisions of the (parallel search) path prefix were ever reached:
+    path_prefix_used: int = 0
+    # When several postconditions are checked together, their individual outcomes:
+    post_analyses: Optional[List[CallAnalysis]] = None
+
+    def analysis_for_each_postcondition(self) -> List[CallAnalysis]:
+        if self.post_analyses is None:
+            return [self.top_analysis]
+        return self.post_analyses
+
+
+def _combine_post_analyses(analyses: Sequence[CallAnalysis]) -> CallAnalysis:
+    """Summarize the outcomes of several postconditions on one path."""
+    statuses = [a.verification_status for a in analyses if a.verification_status]
+    first = analyses[0]
+    return CallAnalysis(
+        min(statuses) if statuses else None,
+        [m for a in analyses for m in a.messages],
+        first.failing_precondition,
+        first.failing_precondition_reason,
+    )
+
+
+def search_calltree(
+    options: AnalysisOptions,
+    conditions: Conditions,
+    path_prefix: Sequence[bool] = (),
+) -> CallTreeSearch:
+    """
+    Explore the paths through a function call.
+
+    When `path_prefix` is given, the outcomes of the first few (non-forced) branch
+    decisions are fixed, and only the matching part of the search tree is explored.
+
+    When there are multiple postconditions, each path is checked against all of
+    them, and the search continues until every one of them is refuted (or the
+    search ends).
+    """
+    num_posts = len(conditions.post)
+    post_analyses = [CallAnalysis() for _ in conditions.post]
+    # Pick up classes from newly imported modules (but not in the middle of a search):
+    update_subclass_map()
+    reset_type_lattice()
+    search_root = RootNode(
+        incremental_solver=options.incremental_solver,
+        path_prefix=path_prefix,
+        slice_constraints=options.slice_constraints,
+        search_strategy=options.search_strategy,
+    )
     space_exhausted = False
     failing_precondition: Optional[ConditionExpr] = (
         conditions.pre[0] if conditions.pre else None
     )
     failing_precondition_reason: str = ""
     num_confirmed_paths = 0
+    num_iterations = 0
 
     short_circuit = ShortCircuitingContext()
     top_analysis: Optional[CallAnalysis] = None
@@ -1057,9 +1146,10 @@ def analyze_calltree(
             try:
                 with StateSpaceContext(space), COMPOSITE_TRACER, NoTracing():
                     # The real work happens here!:
-                    call_analysis = attempt_call(
+                    path_analyses = attempt_call_for_each_postcondition(
                         conditions, short_circuit, enforced_conditions
                     )
+                call_analysis = _combine_post_analyses(path_analyses)
                 if failing_precondition is not None:
                     cur_precondition = call_analysis.failing_precondition
                     if cur_precondition is None:
@@ -1081,25 +1171,312 @@ def analyze_calltree(
 
             except UnexploredPath:
                 call_analysis = CallAnalysis(VerificationStatus.UNKNOWN)
+                path_analyses = [call_analysis] * num_posts
             except IgnoreAttempt:
                 call_analysis = CallAnalysis()
+                path_analyses = [call_analysis] * num_posts
             status = call_analysis.verification_status
             if status == VerificationStatus.CONFIRMED:
                 num_confirmed_paths += 1
             top_analysis, space_exhausted = space.bubble_status(call_analysis)
+            num_iterations += 1
             debug("Path tree stats", search_root.stats())
             overall_status = top_analysis.verification_status if top_analysis else None
             debug(
                 "Iter complete. Worst status found so far:",
                 overall_status.name if overall_status else "None",
             )
-            if space_exhausted or overall_status == VerificationStatus.REFUTED:
+            if num_posts == 1:
+                if space_exhausted or overall_status == VerificationStatus.REFUTED:
+                    break
+                continue
+            for idx, path_analysis in enumerate(path_analyses):
+                path_status = path_analysis.verification_status
+                if space.status_cap is not None and path_status is not None:
+                    path_analysis = replace(
+                        path_analysis,
+                        verification_status=min(path_status, space.status_cap),
+                    )
+                post_analyses[idx], _ = merge_node_results(
+                    post_analyses[idx], True, SearchLeaf(path_analysis)
+                )
+            if space_exhausted or all(
+                a.verification_status == VerificationStatus.REFUTED
+                for a in post_analyses
+            ):
                 break
-    top_analysis = search_root.child.get_result()
+    if options.stats is not None:
+        options.stats.update(pop_subclass_map_stats())
+        options.stats.update(search_root.query_cache.stats)
+        if search_root.query_cache.slicer is not None:
+            options.stats.update(search_root.query_cache.slicer.stats)
+        options.stats.update(patched.patching_module.call_site_cache.stats)
+        options.stats.update(enforced_conditions.call_site_cache.stats)
+    search = CallTreeSearch(
+        top_analysis=search_root.child.get_result(),
+        exhausted=space_exhausted,
+        failing_precondition=failing_precondition,
+        failing_precondition_reason=failing_precondition_reason,
+        num_confirmed_paths=num_confirmed_paths,
+        num_iterations=num_iterations,
+        path_prefix_used=search_root.path_prefix_used,
+    )
+    if num_posts > 1:
+        if not space_exhausted:
+            # Unexplored paths might still falsify a "confirmed" postcondition:
+            post_analyses = [
+                replace(a, verification_status=VerificationStatus.UNKNOWN)
+                if a.verification_status == VerificationStatus.CONFIRMED
+                else a
+                for a in post_analyses
+            ]
+        search.post_analyses = post_analyses
+    return search
+
+
+def merge_calltree_searches(searches: Sequence[CallTreeSearch]) -> CallTreeSearch:
+    """Combine searches over disjoint parts of one search tree."""
+    top_analysis = CallAnalysis()
+    exhausted = True
+    for search in searches:
+        top_analysis, _ = merge_node_results(
+            top_analysis, True, SearchLeaf(search.top_analysis)
+        )
+        exhausted = exhausted and search.exhausted
+    merged = CallTreeSearch(
+        top_analysis=top_analysis,
+        exhausted=exhausted,
+        failing_precondition=None,
+        num_confirmed_paths=sum(s.num_confirmed_paths for s in searches),
+        num_iterations=sum(s.num_iterations for s in searches),
+    )
+    # The precondition is only unmet if no part of the tree got past it:
+    preconditions = [s.failing_precondition for s in searches]
+    if all(preconditions):
+        worst = max(searches, key=lambda s: s.failing_precondition.line)  # type: ignore
+        merged.failing_precondition = worst.failing_precondition
+        merged.failing_precondition_reason = next(
+            (
+                s.failing_precondition_reason
+                for s in searches
+                if s.failing_precondition_reason
+                and s.failing_precondition == worst.failing_precondition
+            ),
+            "",
+        )
+    return merged
+
+
+FunctionLocator = Tuple[str, str, bool]
+
+
+def function_locator(ctxfn: FunctionInfo) -> Optional[FunctionLocator]:
+    """
+    Describe where to find `ctxfn` from a fresh interpreter.
+
+    Returns a (module name, qualified name, is a method) tuple, or None if the
+    function cannot be found again by name (e.g. because it is defined inline).
+    """
+    ctx = ctxfn.context
+    if isinstance(ctx, type):
+        locator = (ctx.__module__, ctx.__qualname__ + "." + ctxfn.name, True)
+    else:
+        fn = ctxfn.descriptor
+        module_name = ctx.__name__ if ctx else getattr(fn, "__module__", None)
+        qualname = ctxfn.name if ctx else getattr(fn, "__qualname__", None)
+        if module_name is None or qualname is None:
+            return None
+        locator = (module_name, qualname, False)
+    if locator[0] == "__main__" or "<locals>" in locator[1]:
+        return None
+    try:
+        found = locate_function(locator)
+    except Exception:
+        return None
+    if found.descriptor is not ctxfn.descriptor:
+        return None
+    return locator
+
+
+def locate_function(locator: FunctionLocator) -> FunctionInfo:
+    module_name, qualname, is_method = locator
+    module = import_module(module_name)
+    if is_method:
+        class_name, name = qualname.rsplit(".", 1)
+        cls = walk_qualname(module, class_name)
+        if not isinstance(cls, type):
+            raise NotFound(f'"{class_name}" is not a class')
+        return FunctionInfo(cls, name, inspect.getattr_static(cls, name))
+    found = walk_qualname(module, qualname)
+    if not isinstance(found, FunctionInfo):
+        raise NotFound(f'"{qualname}" is not a function')
+    return found
+
+
+def _search_calltree_worker_init() -> None:
+    import crosshair.core_and_libs  # noqa: F401 (registers our patches and proxies)
+
+    engage_auditwall()
+
+
+def _search_calltree_worker(
+    job: Tuple[FunctionLocator, Tuple[int, str], AnalysisOptions, Sequence[bool]]
+) -> Tuple[CallTreeSearch, Optional[int], collections.Counter]:
+    locator, (line, expr_source), options, path_prefix = job
+    options.stats = collections.Counter()
+    ctxfn = locate_function(locator)
+    (checkable,) = [
+        c
+        for c in analyze_function(
+            ctxfn,
+            AnalysisOptionSet(
+                analysis_kind=options.analysis_kind, combine_postconditions=False
+            ),
+        )
+        if isinstance(c, ConditionCheckable)
+        and c.conditions.post[0].line == line
+        and c.conditions.post[0].expr_source == expr_source
+    ]
+    conditions = checkable.conditions
+    # The budget starts now, so that process startup and imports do not count:
+    options.deadline = time.monotonic() + options.per_condition_timeout
+    with condition_parser(options.analysis_kind):
+        search = search_calltree(options, conditions, path_prefix)
+    # ConditionExprs cannot be pickled; send back an index instead:
+    precondition = search.failing_precondition
+    precondition_idx = None
+    if precondition is not None:
+        precondition_idx = conditions.pre.index(precondition)
+    search.failing_precondition = None
+    search.top_analysis = replace(search.top_analysis, failing_precondition=None)
+    return (search, precondition_idx, options.stats)
+
+
+_PARALLEL_SEARCH_POOL: Optional[Tuple[int, multiprocessing.pool.Pool]] = None
+
+
+def _parallel_search_pool(num_processes: int) -> multiprocessing.pool.Pool:
+    """Get a (reused) pool of worker processes for parallel searches."""
+    global _PARALLEL_SEARCH_POOL
+    if _PARALLEL_SEARCH_POOL is not None:
+        size, pool = _PARALLEL_SEARCH_POOL
+        if size == num_processes:
+            return pool
+        pool.terminate()
+    pool = multiprocessing.get_context("spawn").Pool(
+        num_processes, initializer=_search_calltree_worker_init
+    )
+    _PARALLEL_SEARCH_POOL = (num_processes, pool)
+    return pool
+
+
+@atexit.register
+def _shutdown_parallel_search_pool() -> None:
+    global _PARALLEL_SEARCH_POOL
+    if _PARALLEL_SEARCH_POOL is not None:
+        with opened_auditwall():
+            _PARALLEL_SEARCH_POOL[1].terminate()
+        _PARALLEL_SEARCH_POOL = None
+
+
+def search_calltree_in_parallel(
+    ctxfn: FunctionInfo, options: AnalysisOptions, conditions: Conditions
+) -> Optional[CallTreeSearch]:
+    """
+    Split the search tree at its first few branches and explore it in parallel.
+
+    Each worker process explores the paths that match one combination of
+    outcomes for the first `options.parallel_search_depth` branch decisions.
+    Each worker gets its own share of the condition's time budget, which starts
+    once the worker is ready to search.
+    Returns None if the function cannot be analyzed in another process, or if
+    no paths were explored.
+    """
+    locator = function_locator(ctxfn)
+    if locator is None:
+        debug("Cannot locate", ctxfn.name, "from a worker; searching serially")
+        return None
+    depth = options.parallel_search_depth
+    prefixes = list(itertools.product((True, False), repeat=depth))
+    num_processes = min(len(prefixes), os.cpu_count() or 1)
+    worker_options = replace(
+        options,
+        parallel_search_depth=0,
+        # When there are more prefixes than processes, the prefixes take turns:
+        per_condition_timeout=options.per_condition_timeout
+        * num_processes
+        / len(prefixes),
+        max_iterations=max(1, -(-options.max_iterations // len(prefixes))),
+        stats=None,
+    )
+    (post,) = conditions.post
+    jobs = [
+        (locator, (post.line, post.expr_source), worker_options, prefix)
+        for prefix in prefixes
+    ]
+    with opened_auditwall():  # (workers engage their own auditwall)
+        pool = _parallel_search_pool(num_processes)
+        results = pool.map(_search_calltree_worker, jobs)
+    searches = []
+    for prefix, (search, precondition_idx, stats) in zip(prefixes, results):
+        if options.stats is not None:
+            options.stats.update(stats)
+        if not all(prefix[search.path_prefix_used :]):
+            # No path reached the rest of this prefix, so this search duplicates
+            # the one whose unreached decisions are all True.
+            continue
+        if precondition_idx is not None:
+            search.failing_precondition = conditions.pre[precondition_idx]
+        searches.append(search)
+    merged = merge_calltree_searches(searches)
+    if merged.num_iterations == 0:
+        debug("The parallel search explored no paths; searching serially")
+        options.deadline = time.monotonic() + options.per_condition_timeout
+        return None
+    return merged
+
+
+def analyze_calltree(
+    options: AnalysisOptions,
+    conditions: Conditions,
+    search: Optional[CallTreeSearch] = None,
+) -> CallTreeAnalysis:
+    (analysis,) = analyze_calltree_for_each_postcondition(options, conditions, search)
+    return analysis
+
+
+def analyze_calltree_for_each_postcondition(
+    options: AnalysisOptions,
+    conditions: Conditions,
+    search: Optional[CallTreeSearch] = None,
+) -> List[CallTreeAnalysis]:
+    """Explore the function once, and report on each postcondition separately."""
+    debug("Begin analyze calltree ", conditions.fn.__name__)
+    if search is None:
+        search = search_calltree(options, conditions)
+    return [
+        _summarize_calltree_search(search, conditions, post_condition, post_analysis)
+        for post_condition, post_analysis in zip(
+            conditions.post, search.analysis_for_each_postcondition()
+        )
+    ]
+
+
+def _summarize_calltree_search(
+    search: CallTreeSearch,
+    conditions: Conditions,
+    post_condition: ConditionExpr,
+    top_analysis: CallAnalysis,
+) -> CallTreeAnalysis:
+    fn = conditions.fn
+    all_messages = MessageCollector()
+    failing_precondition = search.failing_precondition
+    failing_precondition_reason = search.failing_precondition_reason
+    num_confirmed_paths = search.num_confirmed_paths
     if top_analysis.messages:
         all_messages.extend(
             replace(
-                m, test_fn=fn.__qualname__, condition_src=conditions.post[0].expr_source
+                m, test_fn=fn.__qualname__, condition_src=post_condition.expr_source
             )
             for m in top_analysis.messages
         )
@@ -1126,14 +1503,14 @@ def analyze_calltree(
 
     assert top_analysis.verification_status is not None
     debug(
-        ("Exhausted" if space_exhausted else "Aborted"),
+        ("Exhausted" if search.exhausted else "Aborted"),
         "calltree search with",
         top_analysis.verification_status.name,
         "and",
         len(all_messages.get()),
         "messages.",
         "Number of iterations: ",
-        i - 1,
+        search.num_iterations,
     )
     return CallTreeAnalysis(
         messages=all_messages.get(),
@@ -1272,7 +1649,27 @@ def attempt_call(
     short_circuit: ShortCircuitingContext,
     enforced_conditions: EnforcedConditions,
 ) -> CallAnalysis:
+    (analysis,) = attempt_call_for_each_postcondition(
+        conditions, short_circuit, enforced_conditions
+    )
+    return analysis
+
+
+def attempt_call_for_each_postcondition(
+    conditions: Conditions,
+    short_circuit: ShortCircuitingContext,
+    enforced_conditions: EnforcedConditions,
+) -> List[CallAnalysis]:
+    """
+    Make one (symbolic) call, and check all of the postconditions against it.
+
+    Returns one analysis per postcondition, in order.
+    """
     assert not is_tracing()
+
+    def for_each_postcondition(analysis: CallAnalysis) -> List[CallAnalysis]:
+        return [replace(analysis) for _ in conditions.post]
+
     fn = conditions.fn
     space = context_statespace()
     msg_gen = MessageGenerator(conditions.src_fn)
@@ -1297,10 +1694,12 @@ def attempt_call(
                 precondition_ok = realize(prefer_true(precondition_ok))
             if not precondition_ok:
                 debug("Failed to meet precondition", precondition.expr_source)
-                return CallAnalysis(failing_precondition=precondition)
+                return for_each_postcondition(
+                    CallAnalysis(failing_precondition=precondition)
+                )
         if efilter.ignore:
             debug("Ignored exception in precondition.", efilter.analysis)
-            return efilter.analysis
+            return for_each_postcondition(efilter.analysis)
         elif efilter.user_exc is not None:
             (user_exc, tb) = efilter.user_exc
             formatted_tb = tb.format()
@@ -1311,9 +1710,11 @@ def attempt_call(
                 user_exc,
                 formatted_tb,
             )
-            return CallAnalysis(
-                failing_precondition=precondition,
-                failing_precondition_reason=f'it raised "{repr(user_exc)} at {formatted_tb[-1]}"',
+            return for_each_postcondition(
+                CallAnalysis(
+                    failing_precondition=precondition,
+                    failing_precondition_reason=f'it raised "{repr(user_exc)} at {formatted_tb[-1]}"',
+                )
             )
 
     with ExceptionFilter(expected_exceptions) as efilter:
@@ -1332,7 +1733,7 @@ def attempt_call(
 
     if efilter.ignore:
         debug("Ignored exception in function.", efilter.analysis)
-        return efilter.analysis
+        return for_each_postcondition(efilter.analysis)
     elif efilter.user_exc is not None:
         (e, tb) = efilter.user_exc
         detail = name_of_type(type(e)) + ": " + str(e)
@@ -1343,17 +1744,19 @@ def attempt_call(
                 space.detach_path()
             detail += " " + make_counterexample_message(conditions, original_args)
         debug("exception while evaluating function body:", detail, tb_desc)
-        return CallAnalysis(
-            VerificationStatus.REFUTED,
-            [
-                msg_gen.make(
-                    MessageType.EXEC_ERR,
-                    detail,
-                    frame_filename,
-                    frame_lineno,
-                    "".join(tb_desc),
-                )
-            ],
+        return for_each_postcondition(
+            CallAnalysis(
+                VerificationStatus.REFUTED,
+                [
+                    msg_gen.make(
+                        MessageType.EXEC_ERR,
+                        detail,
+                        frame_filename,
+                        frame_lineno,
+                        "".join(tb_desc),
+                    )
+                ],
+            )
         )
 
     for argname, argval in bound_args.arguments.items():
@@ -1371,66 +1774,86 @@ def attempt_call(
                         argname, old_val, new_val
                     )
                     debug("Mutablity problem:", detail)
-                    return CallAnalysis(
-                        VerificationStatus.REFUTED,
-                        [msg_gen.make(MessageType.POST_ERR, detail, None, 0, "")],
+                    return for_each_postcondition(
+                        CallAnalysis(
+                            VerificationStatus.REFUTED,
+                            [msg_gen.make(MessageType.POST_ERR, detail, None, 0, "")],
+                        )
                     )
 
-    (post_condition,) = conditions.post
-    assert post_condition.evaluate is not None
-    with ExceptionFilter(expected_exceptions) as efilter:
-        # TODO: re-enable post-condition short circuiting. This will require refactoring how
-        # enforced conditions and short curcuiting interact, so that post-conditions are
-        # selectively run when, and only when, performing a short circuit.
-        # with enforced_conditions.enabled_enforcement(), short_circuit:
-        debug("Starting postcondition")
-        with ResumedTracing():
-            isok = bool(post_condition.evaluate(lcls))
-
-    if efilter.ignore:
-        debug("Ignored exception in postcondition.", efilter.analysis)
-        return efilter.analysis
-    elif efilter.user_exc is not None:
-        (e, tb) = efilter.user_exc
-        detail = name_of_type(type(e)) + ": " + str(e)
-        if not isinstance(e, NotDeterministic):
+    # Evaluate every postcondition before detaching the path; after detaching, any
+    # further branching would not be explored.
+    # Each postcondition gets its own copy of the locals, so that side effects of
+    # one cannot change the outcome of another:
+    post_lcls = [lcls] + [
+        deepcopyext(lcls, CopyMode.BEST_EFFORT, {}) for _ in conditions.post[1:]
+    ]
+    post_outcomes: List[Tuple[ExceptionFilter, bool]] = []
+    for post_condition, cur_lcls in zip(conditions.post, post_lcls):
+        assert post_condition.evaluate is not None
+        isok = False
+        with ExceptionFilter(expected_exceptions) as efilter:
+            # TODO: re-enable post-condition short circuiting. This will require refactoring how
+            # enforced conditions and short curcuiting interact, so that post-conditions are
+            # selectively run when, and only when, performing a short circuit.
+            # with enforced_conditions.enabled_enforcement(), short_circuit:
+            debug("Starting postcondition", post_condition.expr_source)
             with ResumedTracing():
-                space.detach_path()
-            detail += " " + make_counterexample_message(
-                conditions, original_args, __return__
-            )
-        debug("exception while calling postcondition:", detail)
-        debug("exception traceback:", test_stack(tb))
-        failures = [
-            msg_gen.make(
-                MessageType.POST_ERR,
-                detail,
-                post_condition.filename,
-                post_condition.line,
-                "".join(tb.format()),
-            )
-        ]
-        return CallAnalysis(VerificationStatus.REFUTED, failures)
-    if isok:
-        debug("Postcondition confirmed.")
-        return CallAnalysis(VerificationStatus.CONFIRMED)
-    else:
+                isok = bool(post_condition.evaluate(cur_lcls))
+        post_outcomes.append((efilter, isok))
+
+    counterexample = ""
+    if any(
+        not isinstance(efilter.user_exc[0], NotDeterministic)
+        if efilter.user_exc is not None
+        else not (efilter.ignore or isok)
+        for (efilter, isok) in post_outcomes
+    ):
         with ResumedTracing():
             space.detach_path()
-        detail = "false " + make_counterexample_message(
+        counterexample = make_counterexample_message(
             conditions, original_args, __return__
         )
-        debug(detail)
-        failures = [
-            msg_gen.make(
-                MessageType.POST_FAIL,
-                detail,
-                post_condition.filename,
-                post_condition.line,
-                "",
-            )
-        ]
-        return CallAnalysis(VerificationStatus.REFUTED, failures)
+
+    analyses = []
+    for post_condition, (efilter, isok) in zip(conditions.post, post_outcomes):
+        if efilter.ignore:
+            debug("Ignored exception in postcondition.", efilter.analysis)
+            analyses.append(efilter.analysis)
+        elif efilter.user_exc is not None:
+            (e, tb) = efilter.user_exc
+            detail = name_of_type(type(e)) + ": " + str(e)
+            if not isinstance(e, NotDeterministic):
+                detail += " " + counterexample
+            debug("exception while calling postcondition:", detail)
+            debug("exception traceback:", test_stack(tb))
+            failures = [
+                msg_gen.make(
+                    MessageType.POST_ERR,
+                    detail,
+                    post_condition.filename,
+                    post_condition.line,
+                    "".join(tb.format()),
+                )
+            ]
+            analyses.append(CallAnalysis(VerificationStatus.REFUTED, failures))
+        elif isok:
+            debug("Postcondition confirmed.")
+            analyses.append(CallAnalysis(VerificationStatus.CONFIRMED))
+        else:
+            detail = "false " + counterexample
+            debug(detail)
+            failures = [
+                msg_gen.make(
+                    MessageType.POST_FAIL,
+                    detail,
+                    post_condition.filename,
+                    post_condition.line,
+                    "",
+                )
+            ]
+            analyses.append(CallAnalysis(VerificationStatus.REFUTED, failures))
+    return analyses
 
 
 def _mutability_testing_hash(o: object) -> int:
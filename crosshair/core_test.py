@@ -11,12 +11,14 @@ import pytest  # type: ignore
 import crosshair
 from crosshair import type_repo
 from crosshair.core import (
+    ConditionCheckable,
     deep_realize,
     get_constructor_signature,
     is_deeply_immutable,
     proxy_for_class,
     proxy_for_type,
     run_checkables,
+    search_calltree_in_parallel,
 )
 from crosshair.core_and_libs import (
     AnalysisKind,
@@ -28,7 +30,7 @@ from crosshair.core_and_libs import (
     standalone_statespace,
 )
 from crosshair.fnutil import FunctionInfo, walk_qualname
-from crosshair.options import DEFAULT_OPTIONS, AnalysisOptionSet
+from crosshair.options import DEFAULT_OPTIONS, AnalysisOptionSet, SearchStrategyKind
 from crosshair.statespace import (
     CANNOT_CONFIRM,
     CONFIRMED,
@@ -277,6 +279,24 @@ def fibb(x: int) -> int:
     return ret
 
 
+def clamped_difference(x: int, y: int) -> int:
+    """post: _ >= 0"""
+    if x > 10:
+        if y > x:
+            return y - x
+        return x
+    return 0
+
+
+def unclamped_difference(x: int, y: int) -> int:
+    """post: _ >= 0"""
+    if x > 10:
+        if y > x:
+            return y - x
+        return x
+    return y
+
+
 def reentrant_precondition(minx: int):
     """pre: reentrant_precondition(minx - 1)"""
     return minx <= 10
@@ -781,6 +801,102 @@ def test_specs_complete():
         assert get_natural_number() == 0
 
 
+@pytest.mark.parametrize("expected", [MessageType.POST_FAIL, MessageType.CONFIRMED])
+def test_incremental_solver(expected) -> None:
+    def f(x: int, y: int) -> int:
+        """post: _ >= 0"""
+        if x > 10:
+            if y > x:
+                return y - x
+            return x
+        return 0 if expected == MessageType.CONFIRMED else y
+
+    check_states(f, expected, AnalysisOptionSet(incremental_solver=True))
+
+
+@pytest.mark.parametrize("depth", [1, 2])
+def test_parallel_search(depth) -> None:
+    options = AnalysisOptionSet(parallel_search_depth=depth)
+    check_states(clamped_difference, MessageType.CONFIRMED, options)
+    check_states(unclamped_difference, MessageType.POST_FAIL, options)
+
+
+def test_parallel_search_skips_unreachable_prefixes() -> None:
+    ctxfn = FunctionInfo.from_fn(clamped_difference)
+    (checkable,) = analyze_function(ctxfn)
+    assert isinstance(checkable, ConditionCheckable)
+    options = DEFAULT_OPTIONS.overlay(parallel_search_depth=3, per_condition_timeout=10)
+    options.deadline = time.monotonic() + 10
+    search = search_calltree_in_parallel(ctxfn, options, checkable.conditions)
+    assert search is not None
+    # There are only three paths; prefixes that go past them are not counted twice:
+    assert search.num_iterations == 3
+    assert search.exhausted
+
+
+def test_parallel_search_falls_back_for_inline_functions() -> None:
+    def f(x: int) -> int:
+        """post: _ != 42"""
+        return x if x > 0 else -x
+
+    check_states(f, MessageType.POST_FAIL, AnalysisOptionSet(parallel_search_depth=1))
+
+
+@pytest.mark.parametrize("strategy", list(SearchStrategyKind))
+def test_search_strategies(strategy: SearchStrategyKind) -> None:
+    def f(x: int, y: int) -> int:
+        """post: _ != 42"""
+        if x > 10:
+            if y > x:
+                return y - x
+        return 0
+
+    check_states(
+        f,
+        MessageType.POST_FAIL,
+        AnalysisOptionSet(search_strategy=strategy, max_iterations=40),
+    )
+
+
+def test_combine_postconditions() -> None:
+    def f(x: int) -> int:
+        """
+        post: _ >= 0
+        post: _ != 42
+        post: _ > x
+        """
+        return x if x > 0 else -x
+
+    options = AnalysisOptionSet(
+        combine_postconditions=True, max_iterations=40, per_condition_timeout=10
+    )
+    (checkable,) = analyze_function(f, options)
+    messages = {m.line: m for m in run_checkables([checkable])}
+    first_line = inspect.getsourcelines(f)[1]
+    assert {line - first_line: m.state for line, m in messages.items()} == {
+        2: MessageType.CONFIRMED,
+        3: MessageType.POST_FAIL,
+        4: MessageType.POST_FAIL,
+    }
+    assert messages[first_line + 3].condition_src == "_ != 42"
+
+
+def test_combined_postconditions_do_not_share_locals() -> None:
+    def f(x: int) -> List[int]:
+        """
+        post: _.append(x) is None
+        post: len(_) == 0
+        """
+        return []
+
+    options = AnalysisOptionSet(
+        combine_postconditions=True, max_iterations=20, per_condition_timeout=10
+    )
+    (checkable,) = analyze_function(f, options)
+    messages = run_checkables([checkable])
+    assert [m.state for m in messages] == [MessageType.CONFIRMED] * 2
+
+
 def test_access_class_method_on_symbolic_type():
     with standalone_statespace as space:
         person = proxy_for_type(Type[Person], "p")
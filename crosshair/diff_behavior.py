@@ -23,6 +23,7 @@ from crosshair.tracers import (
     NoTracing,
     PushedModule,
 )
+from crosshair.type_repo import reset_type_lattice
 from crosshair.util import IgnoreAttempt, UnexploredPath, debug
 
 
@@ -157,7 +158,11 @@ def diff_behavior(
 def diff_behavior_with_signature(
     fn1: Callable, fn2: Callable, sig: inspect.Signature, options: AnalysisOptions
 ) -> Iterable[BehaviorDiff]:
-    search_root = RootNode()
+    reset_type_lattice()
+    search_root = RootNode(
+        incremental_solver=options.incremental_solver,
+        search_strategy=options.search_strategy,
+    )
     condition_start = time.monotonic()
     for i in range(1, options.max_iterations):
         debug("Iteration ", i)
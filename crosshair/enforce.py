@@ -13,8 +13,16 @@ from crosshair.condition_parser import (
     get_current_parser,
 )
 from crosshair.fnutil import FunctionInfo
+from crosshair.register_contract import get_registration_generation
 from crosshair.statespace import prefer_true
-from crosshair.tracers import COMPOSITE_TRACER, NoTracing, ResumedTracing, TracingModule
+from crosshair.tracers import (
+    CALL_SITE_CACHE_MISS,
+    COMPOSITE_TRACER,
+    CallSiteCache,
+    NoTracing,
+    ResumedTracing,
+    TracingModule,
+)
 from crosshair.util import AttributeHolder
 
 
@@ -148,10 +156,7 @@ _FILE_SUFFIXES_WITHOUT_ENFORCEMENT: Tuple[str, ...] = (
     "/crosshair/fnutil.py",
     "/crosshair/statespace.py",
     "/crosshair/tracers.py",
-    "/z3.py",
-    "/z3core.py",
     "/z3printer.py",
-    "/z3types.py",
     "/copy.py",
     "/inspect.py",
     "/re.py",
@@ -187,6 +192,9 @@ class EnforcedConditions(TracingModule):
         self.interceptor = interceptor
         self.fns_enforcing: Optional[Set[Callable]] = None
         self.codeobj_cache: Dict[object, bool] = {}
+        self.codeobj_cache_generation = COMPOSITE_TRACER.untraced_generation
+        self.call_site_cache = CallSiteCache("enforcement_cache")
+        self.call_site_cache_generation = get_registration_generation()
 
     def __enter__(self):  # TODO: no longer used as a context manager; remove
         return self
@@ -226,11 +234,20 @@ class EnforcedConditions(TracingModule):
         fname = codeobj.co_filename
         if fname.endswith(_FILE_SUFFIXES_WITHOUT_ENFORCEMENT):
             return False
+        # Code that the tracer skips is not subject to enforcement either:
+        if fname.endswith(COMPOSITE_TRACER.get_untraced_file_suffixes()):
+            return False
         if name == "_crosshair_wrapper":
             return False
         return True
 
     def cached_wants_codeobj(self, codeobj) -> bool:
+        generation = COMPOSITE_TRACER.untraced_generation
+        if generation != self.codeobj_cache_generation:
+            # (the untraced file suffixes have changed)
+            self.codeobj_cache.clear()
+            self.call_site_cache.clear()
+            self.codeobj_cache_generation = generation
         cache = self.codeobj_cache
         cachedval = cache.get(codeobj)
         if cachedval is None:
@@ -247,6 +264,24 @@ class EnforcedConditions(TracingModule):
         caller_code = frame.f_code
         if not self.cached_wants_codeobj(caller_code):
             return None
+        generation = get_registration_generation()
+        if generation != self.call_site_cache_generation:
+            # (contracts have been registered)
+            self.call_site_cache.clear()
+            self.call_site_cache_generation = generation
+        # Method contracts are found via the type of the object that the method
+        # is bound to (or the object itself, if it is a class):
+        binding_key = (
+            binding_target if isinstance(binding_target, type) else type(binding_target)
+        )
+        site = (caller_code, frame.f_lasti)
+        wrapper = self.call_site_cache.lookup(site, fn, binding_key)
+        if wrapper is CALL_SITE_CACHE_MISS:
+            wrapper = self.find_wrapper(fn, binding_target)
+            self.call_site_cache.store(site, fn, binding_key, wrapper)
+        return wrapper  # type: ignore
+
+    def find_wrapper(self, fn: Callable, binding_target: object) -> Optional[Callable]:
         try:
             target_name = object.__getattribute__(fn, "__name__")
         except AttributeError:
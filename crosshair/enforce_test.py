@@ -1,7 +1,9 @@
 import abc
 import sys
 import unittest
+from collections import Counter
 from contextlib import ExitStack
+from types import SimpleNamespace
 
 import pytest
 
@@ -12,6 +14,7 @@ from crosshair.enforce import (
     PreconditionFailed,
     manual_constructor,
 )
+from crosshair.register_contract import register_modules
 from crosshair.tracers import COMPOSITE_TRACER
 from crosshair.util import set_debug
 
@@ -184,6 +187,47 @@ def test_enforcement_init_on_abcmeta() -> None:
         WithMetaclass(99)
 
 
+def test_codeobj_cache_follows_untraced_suffixes() -> None:
+    enforced = EnforcedConditions(Pep316Parser())
+    codeobj = foo.__code__
+    assert enforced.cached_wants_codeobj(codeobj)
+    prior_suffixes = COMPOSITE_TRACER.get_untraced_file_suffixes()
+    COMPOSITE_TRACER.set_untraced_file_suffixes((codeobj.co_filename,))
+    try:
+        assert not enforced.cached_wants_codeobj(codeobj)
+    finally:
+        COMPOSITE_TRACER.set_untraced_file_suffixes(prior_suffixes)
+    assert enforced.cached_wants_codeobj(codeobj)
+
+
+def call_foo(x: int) -> int:
+    return foo(x)
+
+
+def test_enforcement_call_site_cache() -> None:
+    enforced = EnforcedConditions(Pep316Parser())
+    cache = enforced.call_site_cache
+    frame = SimpleNamespace(f_code=call_foo.__code__, f_lasti=0)
+    wrapper = enforced.trace_call(frame, foo, None)  # type: ignore
+    assert wrapper is not None
+    assert enforced.trace_call(frame, foo, None) is wrapper  # type: ignore
+    assert enforced.trace_call(frame, same_thing, None) is not None  # type: ignore
+    assert enforced.trace_call(frame, call_foo, None) is None  # type: ignore
+    assert enforced.trace_call(frame, call_foo, None) is None  # type: ignore
+    assert cache.stats == Counter(enforcement_cache_hits=2, enforcement_cache_misses=3)
+    # Registering contracts invalidates the cached decisions:
+    register_modules()
+    assert enforced.trace_call(frame, foo, None) is not wrapper  # type: ignore
+
+
+def test_enforcement_with_cached_wrappers() -> None:
+    with Enforcement():
+        for _ in range(3):
+            assert call_foo(50) == 100
+            with pytest.raises(PreconditionFailed):
+                call_foo(-1)
+
+
 if __name__ == "__main__":
     if ("-v" in sys.argv) or ("--verbose" in sys.argv):
         set_debug(True)
@@ -0,0 +1,135 @@
+"""
+Event-based file change detection, using the Linux inotify API (via ctypes).
+
+On other platforms (or when inotify cannot be set up), make_inotify() returns None,
+and callers are expected to fall back to polling.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import struct
+import sys
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from crosshair.util import debug
+
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = (
+    IN_MODIFY
+    | IN_ATTRIB
+    | IN_CLOSE_WRITE
+    | IN_MOVED_FROM
+    | IN_MOVED_TO
+    | IN_CREATE
+    | IN_DELETE
+    | IN_DELETE_SELF
+    | IN_MOVE_SELF
+)
+
+# Events that can change which files exist in a way that we cannot track
+# incrementally (the caller should rescan everything):
+RESCAN_EVENTS = IN_Q_OVERFLOW | IN_IGNORED | IN_DELETE_SELF | IN_MOVE_SELF
+
+_EVENT_HEADER = struct.Struct("iIII")  # (wd, mask, cookie, len)
+
+
+class Inotify:
+    """Watch a set of files and directory trees for changes."""
+
+    def __init__(self, libc: ctypes.CDLL):
+        self._libc = libc
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno))
+        self._fd = fd
+        self._paths_by_wd: Dict[int, Path] = {}
+
+    def _add_watch(self, path: Path) -> None:
+        wd = self._libc.inotify_add_watch(self._fd, os.fsencode(str(path)), _WATCH_MASK)
+        if wd < 0:
+            errno = ctypes.get_errno()
+            raise OSError(errno, os.strerror(errno), str(path))
+        self._paths_by_wd[wd] = path
+
+    def add_paths(self, paths: Iterable[Path]) -> None:
+        """
+        Watch the given files, and directories (recursively).
+
+        Paths are reported back in the same form that `walk_paths` produces.
+        Watching a path that is already watched is harmless.
+        """
+        for path in paths:
+            if not path.exists():
+                continue
+            if path.is_dir():
+                for (dirpath, dirs, _files) in os.walk(str(path)):
+                    self._add_watch(Path(dirpath))
+                    dirs[:] = [d for d in dirs if not _is_ignored_dir(dirpath, d)]
+            else:
+                self._add_watch(path)
+
+    def read_events(self) -> List[Tuple[Path, int]]:
+        """Return (path, event mask) pairs for the changes since the last call."""
+        events = []
+        while True:
+            try:
+                data = os.read(self._fd, 64 * 1024)
+            except BlockingIOError:
+                return events
+            offset = 0
+            while offset < len(data):
+                (wd, mask, _cookie, namelen) = _EVENT_HEADER.unpack_from(data, offset)
+                offset += _EVENT_HEADER.size
+                name = data[offset : offset + namelen].rstrip(b"\0")
+                offset += namelen
+                path = self._paths_by_wd.get(wd)
+                if mask & IN_IGNORED:
+                    self._paths_by_wd.pop(wd, None)
+                if path is None:
+                    # (overflow events have no watch; use a placeholder path)
+                    path = Path(".")
+                elif name:
+                    path = path / os.fsdecode(name)
+                events.append((path, mask))
+
+    def close(self) -> None:
+        if self._fd >= 0:
+            os.close(self._fd)
+            self._fd = -1
+
+
+def _is_ignored_dir(parent: str, name: str) -> bool:
+    """Whether a directory cannot hold source that we would watch."""
+    if name.startswith(".") or name in ("__pycache__", "node_modules"):
+        return True
+    # Skip virtual environments:
+    return os.path.exists(os.path.join(parent, name, "pyvenv.cfg"))
+
+
+def make_inotify() -> Optional[Inotify]:
+    """Create an Inotify instance, or return None if inotify is unavailable."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            return None
+        return Inotify(libc)
+    except OSError as e:
+        debug("Unable to use inotify; falling back to polling:", e)
+        return None
@@ -1026,6 +1026,10 @@ class SymbolicInt(SymbolicIntable, AtomicSymbolicValue):
     def __ch_realize__(self) -> object:
         return self.statespace.find_model_value(self.var)
 
+    @staticmethod
+    def __ch_realize_many__(values: Sequence["SymbolicInt"]) -> List[int]:
+        return values[0].statespace.find_model_values([v.var for v in values])
+
     def __repr__(self):
         if self < 0:
             return "-" + abs(self).__repr__()
@@ -3031,6 +3035,18 @@ def tracing_iter(itr: Iterable[_T]) -> Iterable[_T]:
         yield value
 
 
+def realize_ints(values: Sequence) -> List[int]:
+    """Realize some (possibly symbolic) integers, using a single model if possible."""
+    assert not is_tracing()
+    symbolic = [v for v in values if isinstance(v, SymbolicInt)]
+    if len(symbolic) < 2:
+        return [realize(v) for v in values]
+    realized = iter(SymbolicInt.__ch_realize_many__(symbolic))
+    return [
+        next(realized) if isinstance(v, SymbolicInt) else realize(v) for v in values
+    ]
+
+
 class SymbolicBoundedIntTuple(collections.abc.Sequence):
     def __init__(self, minval: int, maxval: int, varname: str):
         assert not is_tracing()
@@ -3725,7 +3741,7 @@ class LazyIntSymbolicStr(AnySymbolicStr, CrossHairValue):
     def __ch_realize__(self) -> object:
         with ResumedTracing():
             codepoints = tuple(self._codepoints)
-        return "".join(chr(realize(x)) for x in codepoints)
+        return "".join(map(chr, realize_ints(codepoints)))
 
     # This is normally an AtomicSymbolicValue method, but sometimes it's used in a
     # duck-typing way.
@@ -4262,7 +4278,7 @@ class SymbolicBytes(BytesLike):
     data = property(_bytes_data_prop)
 
     def __ch_realize__(self):
-        return bytes(tracing_iter(self.inner))
+        return bytes(realize_ints(list(tracing_iter(self.inner))))
 
     def __ch_pytype__(self):
         return bytes
@@ -10,12 +10,14 @@ import textwrap
 import time
 import traceback
 from pathlib import Path
+from types import ModuleType
 from typing import (
     Any,
     Callable,
     Counter,
     Dict,
     Iterable,
+    Iterator,
     List,
     MutableMapping,
     NoReturn,
@@ -28,7 +30,7 @@ from typing import (
 )
 
 from crosshair import env_info
-from crosshair.auditwall import disable_auditwall, engage_auditwall
+from crosshair.auditwall import disable_auditwall, engage_auditwall, opened_auditwall
 from crosshair.core_and_libs import (
     AnalysisMessage,
     MessageType,
@@ -43,6 +45,7 @@ from crosshair.options import (
     AnalysisKind,
     AnalysisOptions,
     AnalysisOptionSet,
+    SearchStrategyKind,
     option_set_from_dict,
 )
 from crosshair.path_cover import (
@@ -56,7 +59,7 @@ from crosshair.pure_importer import prefer_pure_python_imports
 from crosshair.register_contract import REGISTERED_CONTRACTS
 from crosshair.statespace import NotDeterministic
 from crosshair.util import ErrorDuringImport, add_to_pypath, debug, in_debug, set_debug
-from crosshair.watcher import Watcher
+from crosshair.watcher import Pool, Watcher
 
 create_lsp_server: Any = None
 try:
@@ -137,6 +140,18 @@ def command_line_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Output context and stack traces for counterexamples",
     )
+    check_parser.add_argument(
+        "--jobs",
+        type=int,
+        metavar="N",
+        default=1,
+        help=textwrap.dedent(
+            """\
+        Number of processes to use for analysis. (default: 1)
+        When greater than one, each module is analyzed in a separate worker process.
+        """
+        ),
+    )
     check_parser.add_argument(
         "target",
         metavar="TARGET",
@@ -272,6 +287,22 @@ def command_line_parser() -> argparse.ArgumentParser:
             metavar="FLOAT",
             help="Maximum seconds to spend checking execution paths for one condition",
         )
+        subparser.add_argument(
+            "--search_strategy",
+            type=SearchStrategyKind,
+            choices=SearchStrategyKind.__members__.values(),
+            metavar="STRATEGY",
+            help=textwrap.dedent(
+                """\
+            How to choose which execution path to explore next.
+                coverage      : (default) random, but prefer untaken branches
+                random        : random
+                dfs           : depth-first
+                bfs           : breadth-first
+                least_visited : prefer the less-taken direction at each branch
+            """
+            ),
+        )
     lsp_server_parser = subparsers.add_parser(
         "server",
         help="Start a server, speaking the Language Server Protocol",
@@ -455,6 +486,7 @@ def watch(
         )
     except KeyboardInterrupt:
         pass
+    watcher.shutdown()
     watcher._pool.terminate()
     print()
     if random.uniform(0.0, 1.0) > 0.4:
@@ -633,6 +665,67 @@ def server(
     cast(Callable[[], NoReturn], create_lsp_server(options).start_io)()
 
 
+def check_entities(
+    entities: Sequence[Union[ModuleType, type, FunctionInfo]],
+    options: AnalysisOptionSet,
+    jobs: int = 1,
+) -> Iterator[List[AnalysisMessage]]:
+    """
+    Analyze entities, yielding messages per entity in the order they were given.
+
+    When `jobs` is greater than one, modules are analyzed in a pool of worker
+    processes; classes and functions are always analyzed in this process (while
+    the workers run).
+    """
+    # Module files to analyze in the pool, and the entities that they are for:
+    pooled: Dict[Path, List[int]] = {}
+    if jobs > 1:
+        for idx, entity in enumerate(entities):
+            filename = getattr(entity, "__file__", None)
+            if isinstance(entity, ModuleType) and filename is not None:
+                pooled.setdefault(Path(filename), []).append(idx)
+    results: Dict[Path, List[AnalysisMessage]] = {}
+    pool = Pool(jobs)
+    try:
+        for path in pooled:
+            pool.submit((path, options, float("+inf")))
+        with opened_auditwall():  # (workers engage their own auditwall)
+            pool.garden_workers()
+        pool_paths = {idx: path for path, idxs in pooled.items() for idx in idxs}
+        for idx, entity in enumerate(entities):
+            path = pool_paths.get(idx)
+            if path is None:
+                debug("Check ", getattr(entity, "__name__", str(entity)))
+                yield run_checkables(analyze_any(entity, options))
+                continue
+            while path not in results:
+                with opened_auditwall():
+                    pool.garden_workers()  # (this may start worker processes)
+                if not (pool.is_working() or pool.has_result()):
+                    # The worker for this file died without reporting a result.
+                    results[path] = [worker_failure_msg(path)]
+                    break
+                result = pool.get_result(timeout=1.0)
+                if result is not None:
+                    (filename, _, messages) = result
+                    results[filename] = messages
+            yield results[path]
+    finally:
+        with opened_auditwall():
+            pool.terminate()
+
+
+def worker_failure_msg(path: Path) -> AnalysisMessage:
+    return AnalysisMessage(
+        MessageType.EXEC_ERR,
+        "CrossHair worker failed while analyzing this file",
+        str(path),
+        0,
+        0,
+        "",
+    )
+
+
 def check(
     args: argparse.Namespace, options: AnalysisOptionSet, stdout: TextIO, stderr: TextIO
 ) -> int:
@@ -647,10 +740,13 @@ def check(
         print(f"Could not import your code:\n", file=stderr)
         traceback.print_exception(type(cause), cause, cause.__traceback__, file=stderr)
         return 2
+    if args.jobs > 1 and getattr(args, "extra_plugin", None):
+        # (worker processes do not load plugins)
+        print("The --jobs option cannot be combined with --extra_plugin", file=stderr)
+        return 2
     full_options = DEFAULT_OPTIONS.overlay(report_verbose=False).overlay(options)
-    for entity in entities:
-        debug("Check ", getattr(entity, "__name__", str(entity)))
-        for message in run_checkables(analyze_any(entity, options)):
+    for messages in check_entities(entities, options, args.jobs):
+        for message in messages:
             line = describe_message(message, full_options)
             if line is None:
                 continue
@@ -1,4 +1,5 @@
 import io
+import os
 import re
 import subprocess
 import sys
@@ -48,11 +49,11 @@ def root() -> Path:
 
 
 def call_check(
-    files: List[str], options: AnalysisOptionSet = AnalysisOptionSet()
+    files: List[str], options: AnalysisOptionSet = AnalysisOptionSet(), jobs: int = 1
 ) -> Tuple[int, List[str], List[str]]:
     stdbuf: io.StringIO = io.StringIO()
     errbuf: io.StringIO = io.StringIO()
-    retcode = check(Namespace(target=files), options, stdbuf, errbuf)
+    retcode = check(Namespace(target=files, jobs=jobs), options, stdbuf, errbuf)
     stdlines = [ls for ls in stdbuf.getvalue().split("\n") if ls]
     errlines = [ls for ls in errbuf.getvalue().split("\n") if ls]
     return retcode, stdlines, errlines
@@ -284,6 +285,30 @@ def test_report_confirmation(root):
     assert "foo.py:7: info: Unable to meet precondition." in output_text
 
 
+def test_check_with_jobs(root):
+    simplefs(root, {**SIMPLE_FOO, "bar.py": SIMPLE_FOO["foo.py"]})
+    serial_result = call_check([str(root)])
+    assert serial_result[0] == 1
+    assert len(serial_result[1]) == 2
+    assert call_check([str(root)], jobs=2) == serial_result
+
+
+def test_check_with_jobs_and_repeated_target(root):
+    simplefs(root, SIMPLE_FOO)
+    foo = str(root / "foo.py")
+    serial_result = call_check([foo, foo])
+    assert len(serial_result[1]) == 2
+    assert call_check([foo, foo], jobs=2) == serial_result
+
+
+def test_check_with_jobs_rejects_plugins(root):
+    simplefs(root, SIMPLE_FOO)
+    args = Namespace(target=[str(root)], jobs=2, extra_plugin=["plugin.py"])
+    errbuf = io.StringIO()
+    assert check(args, AnalysisOptionSet(), io.StringIO(), errbuf) == 2
+    assert "--extra_plugin" in errbuf.getvalue()
+
+
 def test_check_nonexistent_filename(root):
     simplefs(root, SIMPLE_FOO)
     retcode, _, errlines = call_check([str(root / "notexisting.py")])
@@ -430,6 +455,39 @@ def test_main_as_subprocess(tmp_path: Path):
     assert "foo.py:3: error: false when calling foofn" in completion.stdout
 
 
+def test_main_as_subprocess_writes_subclass_cache(tmp_path: Path):
+    # Updating the subclass map's disk cache must get past the auditwall:
+    simplefs(
+        tmp_path,
+        {
+            "src": {
+                "ab.py": """
+class A:
+    def val(self) -> int:
+        return 1
+class B(A):
+    def val(self) -> int:
+        return 2
+def f(a: A) -> int:
+    '''post: _ > 0'''
+    return a.val()
+"""
+            }
+        },
+    )
+    completion = subprocess.run(
+        [sys.executable, "-m", "crosshair", "check", str(tmp_path / "src")],
+        stdin=subprocess.DEVNULL,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "XDG_CACHE_HOME": str(tmp_path / "cache")},
+    )
+    assert completion.stderr == ""
+    assert completion.returncode == 0
+    if sys.platform != "win32":
+        assert list((tmp_path / "cache" / "crosshair").glob("subclass-map-*.json"))
+
+
 def test_mypycrosshair_command():
     example_file = join(
         split(__file__)[0], "examples", "icontract", "bugs_detected", "wrong_sign.py"
@@ -14,6 +14,7 @@ from crosshair.libimpl.builtinslib import (
 from crosshair.simplestructs import LinearSet, ShellMutableSet, SimpleDict, SliceView
 from crosshair.tracers import (
     COMPOSITE_TRACER,
+    InterceptorTable,
     NoTracing,
     TracingModule,
     frame_stack_read,
@@ -314,10 +315,16 @@ class SetAddInterceptor(TracingModule):
 
 
 def make_registrations():
-    register_opcode_patch(SymbolicSubscriptInterceptor())
-    register_opcode_patch(ContainmentInterceptor())
-    register_opcode_patch(BuildStringInterceptor())
-    register_opcode_patch(FormatValueInterceptor())
-    register_opcode_patch(MapAddInterceptor())
-    register_opcode_patch(NotInterceptor())
-    register_opcode_patch(SetAddInterceptor())
+    interceptors = [
+        SymbolicSubscriptInterceptor(),
+        ContainmentInterceptor(),
+        BuildStringInterceptor(),
+        FormatValueInterceptor(),
+        MapAddInterceptor(),
+        NotInterceptor(),
+        SetAddInterceptor(),
+    ]
+    # The table only calls an interceptor when some operand might be symbolic:
+    register_opcode_patch(
+        InterceptorTable({op: i for i in interceptors for op in i.opcodes_wanted})
+    )
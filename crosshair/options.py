@@ -18,6 +18,19 @@ class AnalysisKind(enum.Enum):
         return f"AnalysisKind.{self.name}"
 
 
+class SearchStrategyKind(enum.Enum):
+    """How to choose among the unexplored branches of a search."""
+
+    coverage = "coverage"
+    random = "random"
+    dfs = "dfs"
+    bfs = "bfs"
+    least_visited = "least_visited"
+
+    def __repr__(self):
+        return f"SearchStrategyKind.{self.name}"
+
+
 def _parse_analysis_kind(argstr: str) -> Sequence[AnalysisKind]:
     try:
         return [AnalysisKind[part.strip()] for part in argstr.split(",")]
@@ -49,6 +62,11 @@ class AnalysisOptionSet:
     per_condition_timeout: Optional[float] = None
     per_path_timeout: Optional[float] = None
     max_iterations: Optional[int] = None
+    incremental_solver: Optional[bool] = None
+    parallel_search_depth: Optional[int] = None
+    combine_postconditions: Optional[bool] = None
+    slice_constraints: Optional[bool] = None
+    search_strategy: Optional[SearchStrategyKind] = None
     report_all: Optional[bool] = None
     report_verbose: Optional[bool] = None
     timeout: Optional[float] = None
@@ -65,6 +83,11 @@ class AnalysisOptionSet:
             "max_iterations",
             "per_condition_timeout",
             "per_path_timeout",
+            "incremental_solver",
+            "parallel_search_depth",
+            "combine_postconditions",
+            "slice_constraints",
+            "search_strategy",
         }
     )
 
@@ -102,6 +125,7 @@ def option_set_from_dict(source: Mapping[str, object]) -> AnalysisOptionSet:
         "specs_complete",
         "per_path_timeout",
         "per_condition_timeout",
+        "search_strategy",
         "report_all",
         "report_verbose",
     ):
@@ -120,6 +144,11 @@ class AnalysisOptions:
     specs_complete: bool
     per_condition_timeout: float
     max_iterations: int
+    incremental_solver: bool
+    parallel_search_depth: int
+    combine_postconditions: bool
+    slice_constraints: bool
+    search_strategy: SearchStrategyKind
     report_all: bool
     report_verbose: bool
     timeout: float
@@ -189,6 +218,11 @@ DEFAULT_OPTIONS = AnalysisOptions(
     specs_complete=False,
     per_condition_timeout=3.0,
     max_iterations=sys.maxsize,
+    incremental_solver=False,
+    parallel_search_depth=0,
+    combine_postconditions=False,
+    slice_constraints=False,
+    search_strategy=SearchStrategyKind.coverage,
     report_all=False,
     report_verbose=True,
     timeout=float("inf"),
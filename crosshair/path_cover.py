@@ -24,6 +24,7 @@ from crosshair.tracers import (
     NoTracing,
     PushedModule,
 )
+from crosshair.type_repo import reset_type_lattice
 from crosshair.util import IgnoreAttempt, UnexploredPath, debug, name_of_type
 
 
@@ -79,7 +80,11 @@ def path_cover(
         # Usually we don't want to run decorator code. (and we certainly don't want
         # to measure coverage on the decorator rather than the real body) Unwrap:
         fn = fn.__wrapped__  # type: ignore
-    search_root = RootNode()
+    reset_type_lattice()
+    search_root = RootNode(
+        incremental_solver=options.incremental_solver,
+        search_strategy=options.search_strategy,
+    )
     condition_start = time.monotonic()
     paths: List[PathSummary] = []
     for i in range(1, options.max_iterations):
@@ -30,6 +30,10 @@ class ContractOverride:
 REGISTERED_CONTRACTS: Dict[Callable, ContractOverride] = {}
 REGISTERED_MODULES: Set[ModuleType] = set()
 
+# Incremented whenever contracts or modules are registered, so that decisions
+# cached elsewhere can be invalidated:
+_REGISTRATION_GENERATION = 0
+
 # Don't automatically register those functions.
 _NO_AUTO_REGISTER: Set[str] = {
     "__init__",
@@ -210,6 +214,17 @@ def register_contract(
             f"function of the class {cls} instead."
         )
     _internal_register_contract(fn, pre, post, sig, skip_body)
+    _new_registration_generation()
+
+
+def _new_registration_generation() -> None:
+    global _REGISTRATION_GENERATION
+    _REGISTRATION_GENERATION += 1
+
+
+def get_registration_generation() -> int:
+    """Get a number that changes whenever contracts are registered."""
+    return _REGISTRATION_GENERATION
 
 
 def get_contract(fn: Callable) -> Optional[ContractOverride]:
@@ -273,3 +288,4 @@ def register_modules(*modules: ModuleType) -> None:
     :param modules: one or multiple modules whose functions should be skipped.
     """
     REGISTERED_MODULES.update(modules)
+    _new_registration_generation()
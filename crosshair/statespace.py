@@ -3,18 +3,23 @@ import builtins
 import copy
 import enum
 import functools
+import heapq
 import random
 import re
 import threading
 import traceback
-from collections import Counter, defaultdict
+from collections import Counter, OrderedDict, defaultdict, deque
+from contextlib import contextmanager
 from dataclasses import dataclass
 from sys import _getframe
 from time import monotonic, time_ns
 from typing import (
     Any,
     Callable,
+    Deque,
     Dict,
+    FrozenSet,
+    Iterator,
     List,
     NewType,
     Optional,
@@ -30,7 +35,8 @@ import z3  # type: ignore
 
 from crosshair import dynamic_typing
 from crosshair.condition_parser import ConditionExpr
-from crosshair.tracers import NoTracing, ResumedTracing, is_tracing
+from crosshair.options import SearchStrategyKind
+from crosshair.tracers import NoTracing, ResumedTracing, is_tracing, stack_fingerprint
 from crosshair.util import (
     CrosshairInternal,
     IgnoreAttempt,
@@ -146,6 +152,112 @@ HeapRef = z3.DeclareSort("HeapRef")
 SnapshotRef = NewType("SnapshotRef", int)
 
 
+class HeapEntry:
+    """
+    An object in one snapshot of the heap.
+
+    When a snapshot is taken, the new snapshot shares the prior snapshot's values
+    (copy-on-write): each value is only copied once it is used from either side.
+    """
+
+    __slots__ = ("ref", "typ", "_value", "_source", "_dependents")
+
+    def __init__(self, ref: z3.ExprRef, typ: Type, value: object):
+        self.ref = ref
+        self.typ = typ
+        self._value = value
+        # When not yet copied, the entry (and snapshot) that we should copy from:
+        self._source: Optional[Tuple[HeapEntry, SnapshotRef]] = None
+        # Entries in newer snapshots that have not yet copied our value:
+        self._dependents: List[HeapEntry] = []
+
+    def carry_over(self, snapshot: SnapshotRef) -> "HeapEntry":
+        """Create an entry for the next snapshot, which will copy this one lazily."""
+        entry = HeapEntry(self.ref, self.typ, None)
+        entry._source = (self, snapshot)
+        self._dependents.append(entry)
+        return entry
+
+    def _current_value(self, space: "StateSpace") -> object:
+        source = self._source
+        if source is not None:
+            self._source = None
+            source_entry, snapshot = source
+            source_value = source_entry._current_value(space)
+            with space.copying_as_of(snapshot):
+                self._value = copy.deepcopy(source_value)
+        return self._value
+
+    def value(self, space: "StateSpace") -> object:
+        # The caller may mutate the value that we return; give newer snapshots
+        # their copies of the value first:
+        dependents, self._dependents = self._dependents, []
+        for dependent in dependents:
+            dependent._current_value(space)
+        return self._current_value(space)
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_unify(heap_type: Type, lookup_type: Type) -> bool:
+    return dynamic_typing.unify(heap_type, lookup_type)
+
+
+def could_alias(heap_type: Type, lookup_type: Type) -> bool:
+    """Determine whether a heap value of one type may be looked up as another."""
+    try:
+        return _cached_unify(heap_type, lookup_type)
+    except TypeError:  # (some types are unhashable)
+        return dynamic_typing.unify(heap_type, lookup_type)
+
+
+class HeapSnapshot:
+    """The entries of one heap snapshot, indexed by type."""
+
+    __slots__ = ("_entries", "_by_type")
+
+    def __init__(self, entries: Sequence[HeapEntry] = ()):
+        self._entries: List[HeapEntry] = []
+        # Maps each type to the (positions of) the entries with that type:
+        self._by_type: Dict[object, Tuple[Type, List[int]]] = {}
+        for entry in entries:
+            self.append(entry)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[HeapEntry]:
+        return iter(self._entries)
+
+    def __getitem__(self, idx: int) -> HeapEntry:
+        return self._entries[idx]
+
+    def append(self, entry: HeapEntry) -> None:
+        typ = entry.typ
+        try:
+            partition = self._by_type.get(typ)
+            key: object = typ
+        except TypeError:  # (unhashable type)
+            key = id(typ)
+            partition = self._by_type.get(key)
+        if partition is None:
+            partition = (typ, [])
+            self._by_type[key] = partition
+        partition[1].append(len(self._entries))
+        self._entries.append(entry)
+
+    def candidates(self, typ: Type) -> Iterator[HeapEntry]:
+        """Yield the entries that could alias a reference of the given type, in order."""
+        matches = [
+            positions
+            for (entry_type, positions) in self._by_type.values()
+            if could_alias(entry_type, typ)
+        ]
+        entries = self._entries
+        if len(matches) == 1:
+            return (entries[pos] for pos in matches[0])
+        return (entries[pos] for pos in heapq.merge(*matches))
+
+
 def model_value_to_python(value: z3.ExprRef) -> object:
     if z3.is_real(value):
         return float(value.as_fraction())
@@ -300,7 +412,8 @@ class SearchTreeNode(NodeLike):
     Abstract helper class for StateSpace.
     """
 
-    statehash: Optional[str] = None
+    statehash: Optional[int] = None
+    statedesc: Optional[str] = None  # (only recorded when debugging)
     result: CallAnalysis = CallAnalysis()
     exhausted: bool = False
 
@@ -334,6 +447,349 @@ def solver_is_sat(solver, *a) -> bool:
     return ret == z3.sat
 
 
+class ConstraintSlicer:
+    """
+    Check a query against only the constraints that can affect it.
+
+    Constraints that share no (uninterpreted) symbols with the query, directly or
+    through other constraints, are left out. This assumes that the constraints
+    which are left out are satisfiable on their own. That is true for branch
+    decisions (we only follow feasible branches), but not necessarily for other
+    assertions; see `StateSpace.check_sliced_path`.
+    """
+
+    def __init__(self):
+        self.stats: Counter[str] = Counter()
+        self._symbols: Dict[int, Tuple[z3.ExprRef, FrozenSet[int]]] = {}
+        self._solver = z3.Solver()
+        self._solver.set(mbqi=True)
+        self._solver.set("random_seed", 42)
+
+    def begin_path(self, model_check_timeout: float) -> None:
+        smt_timeout = model_check_timeout * 1000 + 1
+        self._solver.set("timeout", int(min(smt_timeout, (1 << 32) - 1)))
+
+    def symbols(self, expr: z3.ExprRef) -> FrozenSet[int]:
+        """Get the ids of the uninterpreted constants and functions in `expr`."""
+        cache = self._symbols
+        known = cache.get(expr.get_id())
+        if known is not None:
+            return known[1]
+        # Visit sub-expressions without recursion; these trees can be very deep.
+        stack: List[Tuple[z3.ExprRef, bool]] = [(expr, False)]
+        while stack:
+            cur, children_done = stack.pop()
+            cur_id = cur.get_id()
+            if cur_id in cache:
+                continue
+            if z3.is_quantifier(cur):
+                children = [cur.body()]
+            elif z3.is_app(cur):
+                children = cur.children()
+            else:
+                children = []
+            if not children_done:
+                stack.append((cur, True))
+                stack.extend((c, False) for c in children if c.get_id() not in cache)
+                continue
+            symbols: Set[int] = set()
+            if z3.is_app(cur) and cur.decl().kind() == z3.Z3_OP_UNINTERPRETED:
+                symbols.add(cur.decl().get_id())
+            for child in children:
+                symbols.update(cache[child.get_id()][1])
+            cache[cur_id] = (cur, frozenset(symbols))
+        return cache[expr.get_id()][1]
+
+    def relevant_constraints(
+        self, constraints: Sequence[z3.ExprRef], exprs: Sequence[z3.ExprRef]
+    ) -> List[z3.ExprRef]:
+        """Get the `constraints` that (transitively) share symbols with `exprs`."""
+        by_symbol: Dict[int, List[int]] = defaultdict(list)
+        constraint_symbols = []
+        for idx, constraint in enumerate(constraints):
+            symbols = self.symbols(constraint)
+            constraint_symbols.append(symbols)
+            for symbol in symbols:
+                by_symbol[symbol].append(idx)
+        pending = set()
+        for expr in exprs:
+            pending.update(self.symbols(expr))
+        seen_symbols: Set[int] = set()
+        selected: Set[int] = set()
+        while pending:
+            symbol = pending.pop()
+            seen_symbols.add(symbol)
+            for idx in by_symbol.get(symbol, ()):
+                if idx not in selected:
+                    selected.add(idx)
+                    pending.update(constraint_symbols[idx] - seen_symbols)
+        stats = self.stats
+        stats["sliced_queries"] += 1
+        stats["sliced_constraints_total"] += len(constraints)
+        stats["sliced_constraints_kept"] += len(selected)
+        return [constraints[idx] for idx in sorted(selected)]
+
+    def find_model(
+        self, constraints: Sequence[z3.ExprRef], exprs: Sequence[z3.ExprRef]
+    ) -> Optional[z3.ModelRef]:
+        """Get a model of `constraints` and `exprs`, or None if they are unsat."""
+        scratch = self._solver
+        scratch.push()
+        try:
+            scratch.add(*constraints)
+            return scratch.model() if solver_is_sat(scratch, *exprs) else None
+        finally:
+            scratch.pop()
+
+
+class SolverQueryCache:
+    """
+    Remember the results of the solver queries made during one search.
+
+    Sibling paths tend to make nearly the same queries. Before asking the solver,
+    we check whether:
+    - the exact same set of constraints was checked before,
+    - a (subset of the) constraints was previously found to be unsatisfiable, or
+    - a recently found model already satisfies all of the constraints.
+
+    (this is the "counterexample cache" from KLEE)
+
+    Only the path constraints are compared; background facts are shared by all
+    queries of a `ReplayingSolver`. Because background facts may be added at any
+    time, satisfiable results are only reused while the background is unchanged.
+
+    All of the caches are bounded; the least recently used results are dropped.
+    """
+
+    def __init__(
+        self,
+        max_models: int = 8,
+        max_unsat_sets: int = 64,
+        max_results: int = 1024,
+        slicer: Optional[ConstraintSlicer] = None,
+    ):
+        self.stats: Counter[str] = Counter()
+        self.slicer = slicer
+        # Expression ids are only unique while the expressions are alive, so each
+        # entry holds on to the expressions that its ids refer to:
+        self._results: OrderedDict[
+            Tuple[int, FrozenSet[int]], Tuple[bool, Tuple[z3.ExprRef, ...]]
+        ] = OrderedDict()
+        self._max_results = max_results
+        self._unsat_sets: Deque[Tuple[FrozenSet[int], Tuple[z3.ExprRef, ...]]] = deque(
+            maxlen=max_unsat_sets
+        )
+        self._models: Deque[Tuple[int, z3.ModelRef]] = deque(maxlen=max_models)
+
+    def _remember(
+        self,
+        key: Tuple[int, FrozenSet[int]],
+        result: bool,
+        constraints: Tuple[z3.ExprRef, ...],
+    ) -> None:
+        results = self._results
+        results[key] = (result, constraints)
+        if len(results) > self._max_results:
+            results.popitem(last=False)
+
+    def is_sat(self, solver: z3.Solver, *exprs: z3.ExprRef) -> bool:
+        """Like `solver_is_sat`, but consult (and update) the cache first."""
+        stats = self.stats
+        stats["query_cache_queries"] += 1
+        # (callers sometimes ask about concrete booleans)
+        exprs = tuple(e if z3.is_expr(e) else z3.BoolVal(e) for e in exprs)
+        slicer = self.slicer
+        if isinstance(solver, ReplayingSolver):
+            constraints = solver.path_assertions()
+            generation = solver.background_size()
+            if slicer is not None:
+                constraints = solver.background_assertions() + constraints
+        else:
+            constraints = list(solver.assertions())
+            generation = 0
+        if slicer is not None:
+            # The background facts that matter are part of the sliced query:
+            constraints = slicer.relevant_constraints(constraints, exprs)
+            generation = 0
+            relevant = constraints[:]
+        constraints.extend(exprs)
+        constraint_exprs = tuple(constraints)
+        constraint_ids = frozenset(c.get_id() for c in constraint_exprs)
+        key = (generation, constraint_ids)
+        known = self._results.get(key)
+        if known is not None:
+            stats["query_cache_exact_hits"] += 1
+            self._results.move_to_end(key)
+            return known[0]
+        for unsat_set, _ in self._unsat_sets:
+            if unsat_set <= constraint_ids:
+                stats["query_cache_unsat_hits"] += 1
+                self._remember(key, False, constraint_exprs)
+                return False
+        for model_generation, model in self._models:
+            if model_generation == generation and all(
+                z3.is_true(model.eval(c, True)) for c in constraints
+            ):
+                stats["query_cache_model_hits"] += 1
+                self._remember(key, True, constraint_exprs)
+                return True
+        stats["query_cache_misses"] += 1
+        if slicer is None:
+            ret = solver_is_sat(solver, *exprs)
+            model = solver.model() if ret else None
+        else:
+            model = slicer.find_model(relevant, exprs)
+            ret = model is not None
+        if model is not None:
+            self._models.appendleft((generation, model))
+        else:
+            self._unsat_sets.appendleft((constraint_ids, constraint_exprs))
+        self._remember(key, ret, constraint_exprs)
+        return ret
+
+
+class ReplayingSolver(z3.Solver):
+    """
+    A solver that persists across the iterations of a search.
+
+    Assertions are grouped into scopes, one per decision made along the current path.
+    When a new path retraces a prefix of the prior path, the assertions in that prefix
+    are already present and are not re-added. At the first point of divergence (or
+    at the first solver query), we pop back to the last shared decision and continue
+    incrementally from there.
+
+    Background facts (see `add_background_fact`) live beneath all of the scopes, and
+    so are asserted only once for the whole search.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self.set(mbqi=True)
+        # turn off every randomization thing we can think of:
+        self.set("random_seed", 42)
+        # Frame k holds the assertions made after the k-th decision.
+        # Every frame (including the first) lives in its own solver scope.
+        self._frames: List[List[z3.ExprRef]] = [[]]
+        self._frame_nodes: List[Optional[NodeLike]] = [None]
+        self._background: Dict[int, z3.ExprRef] = {}
+        self._depth = 0
+        self._pos = 0
+        self._replaying = False
+        z3.Solver.push(self)
+
+    def begin_path(self, model_check_timeout: float) -> None:
+        smt_timeout = model_check_timeout * 1000 + 1
+        self.set("timeout", int(min(smt_timeout, (1 << 32) - 1)))
+        self._depth = 0
+        self._pos = 0
+        self._replaying = True
+
+    def _truncate(self) -> None:
+        """Make the solver hold only the assertions made so far on this path."""
+        self._replaying = False
+        frames, depth, pos = self._frames, self._depth, self._pos
+        if pos == len(frames[depth]):
+            excess_scopes = len(frames) - 1 - depth
+            if excess_scopes:
+                z3.Solver.pop(self, excess_scopes)
+        else:
+            kept = frames[depth][:pos]
+            z3.Solver.pop(self, len(frames) - depth)
+            z3.Solver.push(self)
+            for expr in kept:
+                z3Add(self, expr)
+            frames[depth] = kept
+        del frames[depth + 1 :]
+        del self._frame_nodes[depth + 1 :]
+
+    def decision(self, node: NodeLike) -> None:
+        """Open a new scope for the assertions that follow a decision at `node`."""
+        next_depth = self._depth + 1
+        if self._replaying:
+            if (
+                self._pos == len(self._frames[self._depth])
+                and next_depth < len(self._frames)
+                and self._frame_nodes[next_depth] is node
+            ):
+                self._depth, self._pos = next_depth, 0
+                return
+            self._truncate()
+        z3.Solver.push(self)
+        self._frames.append([])
+        self._frame_nodes.append(node)
+        self._depth, self._pos = next_depth, 0
+
+    def assert_exprs(self, *args) -> None:
+        for expr in z3.z3._get_args(args):
+            if self._replaying:
+                frame, pos = self._frames[self._depth], self._pos
+                if pos < len(frame) and frame[pos].eq(expr):
+                    self._pos = pos + 1
+                    continue
+                self._truncate()
+            z3Add(self, expr)
+            self._frames[self._depth].append(expr)
+            self._pos += 1
+
+    def check(self, *assumptions):
+        if self._replaying:
+            self._truncate()
+        return z3.Solver.check(self, *assumptions)
+
+    def assertions(self):
+        if self._replaying:
+            self._truncate()
+        return z3.Solver.assertions(self)
+
+    def path_assertions(self) -> List[z3.ExprRef]:
+        """Get the assertions made on the current path (excluding background facts)."""
+        if self._replaying:
+            self._truncate()
+        return [expr for frame in self._frames for expr in frame]
+
+    def background_size(self) -> int:
+        return len(self._background)
+
+    def background_assertions(self) -> List[z3.ExprRef]:
+        return list(self._background.values())
+
+    def add_background(self, *exprs: z3.ExprRef) -> None:
+        """Assert `exprs` beneath every scope, so that they hold on all future paths."""
+        background = self._background
+        new_exprs = {}
+        for expr in exprs:
+            expr_id = expr.get_id()
+            if expr_id not in background:
+                new_exprs[expr_id] = expr
+        if not new_exprs:
+            return
+        if self._replaying:
+            self._truncate()
+        frames = self._frames
+        z3.Solver.pop(self, len(frames))
+        for expr in new_exprs.values():
+            z3Add(self, expr)
+        background.update(new_exprs)
+        for frame in frames:
+            z3.Solver.push(self)
+            for frame_expr in frame:
+                z3Add(self, frame_expr)
+
+
+def add_background_fact(solver: z3.Solver, *exprs: z3.ExprRef) -> None:
+    """
+    Assert facts that do not depend on the current path.
+
+    (e.g. the interpretation of a function over unicode characters)
+    A solver that persists across paths (see the incremental_solver option) will
+    only assert each one once; other solvers receive them on every path.
+    """
+    if isinstance(solver, ReplayingSolver):
+        solver.add_background(*exprs)
+    else:
+        solver.add(*exprs)
+
+
 def node_result(node: Optional[NodeLike]) -> Optional[CallAnalysis]:
     if node is None:
         return None
@@ -392,10 +848,95 @@ class BranchCounter:
         self.neg_ct = 0
 
 
+class SearchStrategy:
+    """
+    Decides which way to go at a branch where neither side is exhausted yet.
+
+    The default (coverage) strategy picks randomly, weighted by the node's bias,
+    except that it will always try the untaken side of a branch whose code location
+    has only ever gone one way.
+    """
+
+    def probability_true(
+        self,
+        node: "WorstResultNode",
+        branch_counter: BranchCounter,
+        probability_true: Optional[float],
+    ) -> Optional[float]:
+        """
+        Return the probability of taking the true branch at `node`.
+
+        `branch_counter` counts the decisions made at this code location, and
+        `probability_true` is the caller's preference (if any).
+        A return value of None uses the node's default bias.
+        """
+        if bool(branch_counter.pos_ct) != bool(branch_counter.neg_ct):
+            return 1.0 if branch_counter.neg_ct else 0.0
+        return probability_true
+
+
+class RandomSearchStrategy(SearchStrategy):
+    """Pick randomly, weighted only by the bias of the node (or caller)."""
+
+    def probability_true(self, node, branch_counter, probability_true):
+        return probability_true
+
+
+class DepthFirstSearchStrategy(SearchStrategy):
+    """Finish exploring the false side of each branch before trying the true side."""
+
+    def probability_true(self, node, branch_counter, probability_true):
+        return 0.0
+
+
+class BreadthFirstSearchStrategy(SearchStrategy):
+    """Go to the side of each branch that has been explored the least so far."""
+
+    def probability_true(self, node, branch_counter, probability_true):
+        positive, negative = node.stats_lookahead()
+        return 1.0 if positive.iterations < negative.iterations else 0.0
+
+
+class LeastVisitedSearchStrategy(SearchStrategy):
+    """Go the way that has been taken the fewest times at this code location."""
+
+    def probability_true(self, node, branch_counter, probability_true):
+        if branch_counter.pos_ct == branch_counter.neg_ct:
+            return probability_true
+        return 1.0 if branch_counter.pos_ct < branch_counter.neg_ct else 0.0
+
+
+_SEARCH_STRATEGIES: Dict[SearchStrategyKind, Type[SearchStrategy]] = {
+    SearchStrategyKind.coverage: SearchStrategy,
+    SearchStrategyKind.random: RandomSearchStrategy,
+    SearchStrategyKind.dfs: DepthFirstSearchStrategy,
+    SearchStrategyKind.bfs: BreadthFirstSearchStrategy,
+    SearchStrategyKind.least_visited: LeastVisitedSearchStrategy,
+}
+
+
 class RootNode(SinglePathNode):
-    def __init__(self):
+    def __init__(
+        self,
+        incremental_solver: bool = False,
+        path_prefix: Sequence[bool] = (),
+        slice_constraints: bool = False,
+        search_strategy: SearchStrategyKind = SearchStrategyKind.coverage,
+    ):
         super().__init__(True)
-        self._open_coverage: Dict[str, BranchCounter] = defaultdict(BranchCounter)
+        self._open_coverage: Dict[int, BranchCounter] = defaultdict(BranchCounter)
+        self.search_strategy = _SEARCH_STRATEGIES[search_strategy]()
+        # The outcomes of the first few (non-trivial) branch decisions may be
+        # fixed in advance; this is how we split a search across processes.
+        self.path_prefix = tuple(path_prefix)
+        # The largest number of prefix decisions that any path has reached:
+        self.path_prefix_used = 0
+        self.solver: Optional[ReplayingSolver] = (
+            ReplayingSolver() if incremental_solver else None
+        )
+        self.query_cache = SolverQueryCache(
+            slicer=ConstraintSlicer() if slice_constraints else None
+        )
 
 
 class DeatchedPathNode(SinglePathNode):
@@ -537,19 +1078,27 @@ _RE_WHITESPACE_SUB = re.compile(r"\s+").sub
 
 class WorstResultNode(RandomizedBinaryPathNode):
     forced_path: Optional[bool] = None
+    forced_by_prefix: bool = False
 
-    def __init__(self, rand: random.Random, expr: z3.ExprRef, solver: z3.Solver):
+    def __init__(
+        self,
+        rand: random.Random,
+        expr: z3.ExprRef,
+        solver: z3.Solver,
+        query_cache: Optional[SolverQueryCache] = None,
+    ):
         super().__init__(rand)
         notexpr = z3Not(expr)
+        is_sat = solver_is_sat if query_cache is None else query_cache.is_sat
 
-        if solver_is_sat(solver, notexpr):
-            if not solver_is_sat(solver, expr):
+        if is_sat(solver, notexpr):
+            if not is_sat(solver, expr):
                 self.forced_path = False
         else:
             # TODO: we still run into soundness issues on occasion, so I'd like to
             # leave _PERFORM_EXTRA_SAT_CHECKS enabled a little longer:
             _PERFORM_EXTRA_SAT_CHECKS = True
-            if _PERFORM_EXTRA_SAT_CHECKS and not solver_is_sat(solver, expr):
+            if _PERFORM_EXTRA_SAT_CHECKS and not is_sat(solver, expr):
                 debug(" *** Reached impossible code path *** ")
                 debug("Current solver state:\n", str(solver))
                 raise CrosshairInternal("Reached impossible code path")
@@ -607,14 +1156,22 @@ class WorstResultNode(RandomizedBinaryPathNode):
 class ModelValueNode(WorstResultNode):
     condition_value: object = None
 
-    def __init__(self, rand: random.Random, expr: z3.ExprRef, solver: z3.Solver):
+    def __init__(
+        self,
+        rand: random.Random,
+        expr: z3.ExprRef,
+        solver: z3.Solver,
+        query_cache: Optional[SolverQueryCache] = None,
+    ):
         if not solver_is_sat(solver):
             debug("Solver unexpectedly unsat; solver state:", solver.sexpr())
             raise CrosshairInternal("Unexpected unsat from solver")
 
         self.condition_value = solver.model().evaluate(expr, model_completion=True)
         self._stats_key = f"realize_{expr}" if z3.is_const(expr) else None
-        WorstResultNode.__init__(self, rand, expr == self.condition_value, solver)
+        WorstResultNode.__init__(
+            self, rand, expr == self.condition_value, solver, query_cache
+        )
 
     def compute_result(self, leaf_analysis: CallAnalysis) -> Tuple[CallAnalysis, bool]:
         stats_key = self._stats_key
@@ -625,6 +1182,43 @@ class ModelValueNode(WorstResultNode):
         return (analysis, is_exhausted)
 
 
+class ModelValuesNode(WorstResultNode):
+    """Like `ModelValueNode`, but realizes several expressions with one model."""
+
+    condition_values: List[z3.ExprRef]
+
+    def __init__(
+        self,
+        rand: random.Random,
+        exprs: Sequence[z3.ExprRef],
+        solver: z3.Solver,
+        query_cache: Optional[SolverQueryCache] = None,
+    ):
+        if not solver_is_sat(solver):
+            debug("Solver unexpectedly unsat; solver state:", solver.sexpr())
+            raise CrosshairInternal("Unexpected unsat from solver")
+        model = solver.model()
+        self.exprs = list(exprs)
+        self.condition_values = [
+            model.evaluate(expr, model_completion=True) for expr in exprs
+        ]
+        self._stats_keys = [f"realize_{expr}" for expr in exprs if z3.is_const(expr)]
+        WorstResultNode.__init__(
+            self,
+            rand,
+            z3.And(*[e == v for e, v in zip(exprs, self.condition_values)]),
+            solver,
+            query_cache,
+        )
+
+    def compute_result(self, leaf_analysis: CallAnalysis) -> Tuple[CallAnalysis, bool]:
+        old_realizations = [self._stats[key] for key in self._stats_keys]
+        analysis, is_exhausted = super().compute_result(leaf_analysis)
+        for key, count in zip(self._stats_keys, old_realizations):
+            self._stats[key] = count + 1
+        return (analysis, is_exhausted)
+
+
 def debug_path_tree(node, highlights, prefix="") -> List[str]:
     highlighted = node in highlights
     node = node.simplify()
@@ -673,19 +1267,28 @@ class StateSpace:
         model_check_timeout: float,
         search_root: RootNode,
     ):
-        smt_timeout = model_check_timeout * 1000 + 1
-        smt_tactic = z3.Tactic("smt")
-        if smt_timeout < 1 << 63:
-            smt_tactic = z3.TryFor(smt_tactic, int(smt_timeout))
-        self.solver = smt_tactic.solver()
-        self.solver.set(mbqi=True)
-        # turn off every randomization thing we can think of:
-        self.solver.set("random-seed", 42)
-        self.solver.set("smt.random-seed", 42)
-        # self.solver.set('randomize', False)
+        if search_root.solver is None:
+            smt_timeout = model_check_timeout * 1000 + 1
+            smt_tactic = z3.Tactic("smt")
+            if smt_timeout < 1 << 63:
+                smt_tactic = z3.TryFor(smt_tactic, int(smt_timeout))
+            self.solver = smt_tactic.solver()
+            self.solver.set(mbqi=True)
+            # turn off every randomization thing we can think of:
+            self.solver.set("random-seed", 42)
+            self.solver.set("smt.random-seed", 42)
+            # self.solver.set('randomize', False)
+        else:
+            self.solver = search_root.solver
+            search_root.solver.begin_path(model_check_timeout)
+        if search_root.query_cache.slicer is not None:
+            search_root.query_cache.slicer.begin_path(model_check_timeout)
         self.choices_made: List[SearchTreeNode] = []
         self.status_cap: Optional[VerificationStatus] = None
-        self.heaps: List[List[Tuple[z3.ExprRef, Type, object]]] = [[]]
+        self.heaps: List[HeapSnapshot] = [HeapSnapshot()]
+        # Snapshots that may be looked up (other than as the latest one):
+        self._referenced_snapshots: Set[SnapshotRef] = set()
+        self._copying_snapshot: Optional[SnapshotRef] = None
         self.next_uniq = 1
         self.is_detached = False
         self._extras = {}
@@ -696,6 +1299,7 @@ class StateSpace:
         self._root = search_root
         self._random = search_root._random
         _, self._search_position = search_root.choose()
+        self._prefix_position = 0
         self._deferred_assumptions = []
 
     def add(self, expr: z3.ExprRef) -> None:
@@ -710,6 +1314,14 @@ class StateSpace:
     def rand(self) -> random.Random:
         return self._random
 
+    def _add_decision(self, node: SearchTreeNode, expr: z3.ExprRef) -> None:
+        solver = self.solver
+        if isinstance(solver, ReplayingSolver):
+            solver.decision(node)
+            solver.add(expr)
+        else:
+            z3Add(solver, expr)
+
     def extra(self, typ: Type[_T]) -> _T:
         """Get an object whose lifetime is tied to that of the SMT solver."""
         value = self._extras.get(typ)
@@ -744,9 +1356,15 @@ class StateSpace:
         return ret
 
     def is_possible(self, expr: z3.ExprRef) -> bool:
-        return solver_is_sat(self.solver, expr)
+        return self._root.query_cache.is_sat(self.solver, expr)
 
     def gen_stack_descriptions(self) -> str:
+        """
+        Describe the code locations of the caller's stack, for debugging.
+
+        Describes the same frames that `stack_fingerprint(2, 8)` hashes, when called
+        from `choose_possible`.
+        """
         f: Any = _getframe().f_back.f_back  # type: ignore
         f0 = f.f_back or f
         f1 = f0.f_back or f0
@@ -778,7 +1396,7 @@ class StateSpace:
             raise PathTimeout
         if self._search_position.is_stem():
             node = self._search_position.grow_into(
-                WorstResultNode(self._random, expr, self.solver)
+                WorstResultNode(self._random, expr, self.solver, self._root.query_cache)
             )
         else:
             node = self._search_position.simplify()  # type: ignore
@@ -794,41 +1412,55 @@ class StateSpace:
                 raise NotDeterministic
 
         self._search_position = node
-        # NOTE: format_stack() is more human readable, but it pulls source file contents,
-        # so it is (1) slow, and (2) unstable when source code changes while we are checking.
-        statedesc = self.gen_stack_descriptions()
+        path_prefix = self._root.path_prefix
+        if self._prefix_position < len(path_prefix):
+            if node.forced_path is None:
+                node.forced_path = path_prefix[self._prefix_position]
+                node.forced_by_prefix = True
+            if node.forced_by_prefix:
+                self._prefix_position += 1
+                if self._prefix_position > self._root.path_prefix_used:
+                    self._root.path_prefix_used = self._prefix_position
+        # Identify the decision point by the code locations of the (skipped) caller's
+        # callers. Formatting a readable description of those frames is comparatively
+        # slow, so we only do that when debugging.
+        statehash = stack_fingerprint(2, 8)
         assert isinstance(node, SearchTreeNode)
         if node.statehash is None:
-            node.statehash = statedesc
+            node.statehash = statehash
+            if in_debug():
+                node.statedesc = self.gen_stack_descriptions()
         else:
-            if node.statehash != statedesc:
+            if node.statehash != statehash:
+                statedesc = self.gen_stack_descriptions()
                 debug(" *** Begin Not Deterministic Debug *** ")
-                debug("     First state: ", len(node.statehash))
-                debug(node.statehash)
+                if node.statedesc is not None:
+                    debug("     First state: ", len(node.statedesc))
+                    debug(node.statedesc)
                 debug("     Current state: ", len(statedesc))
                 debug(statedesc)
                 debug("     Decision points prior to this:")
                 for choice in self.choices_made:
                     debug("      ", choice)
-                debug("     Stack Diff: ")
-                import difflib
+                if node.statedesc is not None:
+                    debug("     Stack Diff: ")
+                    import difflib
 
-                debug(
-                    "\n".join(
-                        difflib.context_diff(
-                            node.statehash.split("\n"), statedesc.split("\n")
+                    debug(
+                        "\n".join(
+                            difflib.context_diff(
+                                node.statedesc.split("\n"), statedesc.split("\n")
+                            )
                         )
                     )
-                )
                 debug(" *** End Not Deterministic Debug *** ")
                 raise NotDeterministic()
 
-        # If we've never taken a branch at this code location, make sure we try it!
-        open_coverage = self._root._open_coverage
-        branch_counter = open_coverage[statedesc]
-        if bool(branch_counter.pos_ct) != bool(branch_counter.neg_ct):
-            if probability_true != 0.0 and probability_true != 1.0:
-                probability_true = 1.0 if branch_counter.neg_ct else 0.0
+        branch_counter = self._root._open_coverage[statehash]
+        if probability_true != 0.0 and probability_true != 1.0:
+            probability_true = self._root.search_strategy.probability_true(
+                node, branch_counter, probability_true
+            )
 
         choose_true, stem = node.choose(probability_true=probability_true)
 
@@ -853,7 +1485,7 @@ class StateSpace:
                 1.0 - _pf if choose_true else _pf,
                 ")",
             )
-        z3Add(self.solver, chosen_expr)
+        self._add_decision(node, chosen_expr)
         self._exprs_known[expr] = choose_true
         return choose_true
 
@@ -862,7 +1494,9 @@ class StateSpace:
             while True:
                 if self._search_position.is_stem():
                     self._search_position = self._search_position.grow_into(
-                        ModelValueNode(self._random, expr, self.solver)
+                        ModelValueNode(
+                            self._random, expr, self.solver, self._root.query_cache
+                        )
                     )
                 node = self._search_position.simplify()
                 if not isinstance(node, ModelValueNode):
@@ -875,7 +1509,7 @@ class StateSpace:
                 self.choices_made.append(node)
                 self._search_position = next_node
                 if chosen:
-                    self.solver.add(expr == node.condition_value)
+                    self._add_decision(node, expr == node.condition_value)
                     ret = model_value_to_python(node.condition_value)
                     if (
                         in_debug()
@@ -887,7 +1521,47 @@ class StateSpace:
                         debug("Realized at", test_stack())
                     return ret
                 else:
-                    self.solver.add(expr != node.condition_value)
+                    self._add_decision(node, expr != node.condition_value)
+
+    def find_model_values(self, exprs: Sequence[z3.ExprRef]) -> List[Any]:
+        """
+        Like `find_model_value`, but for several expressions at once.
+
+        All of the values come from one solver model, and are recorded as a single
+        decision in the search tree.
+        """
+        if len(exprs) <= 1:
+            return [self.find_model_value(expr) for expr in exprs]
+        with NoTracing():
+            while True:
+                if self._search_position.is_stem():
+                    self._search_position = self._search_position.grow_into(
+                        ModelValuesNode(
+                            self._random, exprs, self.solver, self._root.query_cache
+                        )
+                    )
+                node = self._search_position.simplify()
+                if not (
+                    isinstance(node, ModelValuesNode)
+                    and len(node.exprs) == len(exprs)
+                    and all(map(z3.eq, node.exprs, exprs))
+                ):
+                    debug(" *** Begin Not Deterministic Debug *** ")
+                    debug(f"Model values node expected; found {node} instead.")
+                    debug("  Traceback: ", test_stack())
+                    debug(" *** End Not Deterministic Debug *** ")
+                    raise NotDeterministic
+                (chosen, next_node) = node.choose(probability_true=1.0)
+                self.choices_made.append(node)
+                self._search_position = next_node
+                if chosen:
+                    self._add_decision(node, node._expr)
+                    ret = list(map(model_value_to_python, node.condition_values))
+                    if in_debug() and not self.is_detached:
+                        debug("SMT realized symbolics:", exprs, "==", repr(ret))
+                    return ret
+                else:
+                    self._add_decision(node, z3Not(node._expr))
 
     def find_model_value_for_function(self, expr: z3.ExprRef) -> object:
         if not solver_is_sat(self.solver):
@@ -901,18 +1575,37 @@ class StateSpace:
         return self.solver.model()[expr]
 
     def current_snapshot(self) -> SnapshotRef:
-        return SnapshotRef(len(self.heaps) - 1)
+        snapshot = self._copying_snapshot
+        if snapshot is None:
+            snapshot = SnapshotRef(len(self.heaps) - 1)
+        self._referenced_snapshots.add(snapshot)
+        return snapshot
+
+    @contextmanager
+    def copying_as_of(self, snapshot: SnapshotRef) -> Iterator[None]:
+        """Make copies that refer to `snapshot`, as if it were still the latest."""
+        prior = self._copying_snapshot
+        self._copying_snapshot = snapshot
+        try:
+            yield
+        finally:
+            self._copying_snapshot = prior
 
     def checkpoint(self):
-        self.heaps.append(
-            [(ref, typ, copy.deepcopy(val)) for (ref, typ, val) in self.heaps[-1]]
-        )
+        head = self.heaps[-1]
+        snapshot = SnapshotRef(len(self.heaps) - 1)
+        if head:
+            # Copies of these entries will refer to the prior snapshot:
+            self._referenced_snapshots.add(snapshot)
+        self.heaps.append(HeapSnapshot([entry.carry_over(snapshot) for entry in head]))
 
     def add_value_to_heaps(self, ref: z3.ExprRef, typ: Type, value: object) -> None:
         # TODO: needs more testing
-        for heap in self.heaps[:-1]:
-            heap.append((ref, typ, copy.deepcopy(value)))
-        self.heaps[-1].append((ref, typ, value))
+        for idx, heap in enumerate(self.heaps[:-1]):
+            # Nothing can look up keys in an unreferenced (prior) snapshot:
+            if idx in self._referenced_snapshots:
+                heap.append(HeapEntry(ref, typ, copy.deepcopy(value)))
+        self.heaps[-1].append(HeapEntry(ref, typ, value))
 
     def find_key_in_heap(
         self,
@@ -923,11 +1616,9 @@ class StateSpace:
     ) -> object:
         with NoTracing():
             # TODO: needs more testing
-            for (curref, curtyp, curval) in self.heaps[snapshot]:
-                could_match = dynamic_typing.unify(curtyp, typ)
-                if not could_match:
-                    continue
-                if self.smt_fork(curref == ref, probability_true=0.1):
+            for entry in self.heaps[snapshot].candidates(typ):
+                if self.smt_fork(entry.ref == ref, probability_true=0.1):
+                    curval = entry.value(self)
                     debug(
                         "HEAP key lookup ",
                         ref,
@@ -991,6 +1682,7 @@ class StateSpace:
                     check_ret = checker()
                 if not prefer_true(check_ret):
                     raise IgnoreAttempt("deferred assumption failed: " + description)
+            self.check_sliced_path()
             self.is_detached = True
             assert self._search_position.is_stem()
             node = self._search_position.grow_into(DeatchedPathNode())
@@ -999,6 +1691,20 @@ class StateSpace:
             self._search_position = node.child
             debug("Detached from search tree")
 
+    def check_sliced_path(self) -> None:
+        """
+        Confirm that the whole path is feasible, when queries have been sliced.
+
+        Sliced queries assume that the constraints they leave out are satisfiable.
+        That does not hold for expressions asserted with `add` (they are never
+        checked), so we check all of the constraints together before any result
+        of the path is reported.
+        """
+        if self._root.query_cache.slicer is None:
+            return
+        if not solver_is_sat(self.solver):
+            raise IgnoreAttempt("path is infeasible")
+
     def cap_result_at_unknown(self):
         self.status_cap = VerificationStatus.UNKNOWN
 
@@ -1,14 +1,25 @@
 import time
+from typing import List, Tuple
 
+import pytest
 import z3  # type: ignore
 
+from crosshair.options import SearchStrategyKind
 from crosshair.statespace import (
+    CallAnalysis,
+    ConstraintSlicer,
+    HeapEntry,
     HeapRef,
+    HeapSnapshot,
     RootNode,
     SimpleStateSpace,
     SnapshotRef,
+    SolverQueryCache,
     StateSpace,
+    VerificationStatus,
+    add_background_fact,
 )
+from crosshair.util import IgnoreAttempt
 
 _HEAD_SNAPSHOT = SnapshotRef(-1)
 
@@ -26,6 +37,26 @@ def test_find_key_in_heap():
     assert isinstance(dictval, dict)
 
 
+def test_heap_snapshot_candidates() -> None:
+    refs = [z3.Const(f"ref{i}", HeapRef) for i in range(5)]
+    types = [int, dict, List[int], dict, bool]
+    heap = HeapSnapshot([HeapEntry(r, t, None) for r, t in zip(refs, types)])
+    assert [e.ref for e in heap.candidates(dict)] == [refs[1], refs[3]]
+    assert [e.ref for e in heap.candidates(int)] == [refs[0], refs[4]]
+    assert [e.ref for e in heap.candidates(List[int])] == [refs[2]]
+
+
+def test_find_key_in_heap_only_forks_on_compatible_types():
+    space = SimpleStateSpace()
+    for i in range(5):
+        ref = z3.Const(f"listref{i}", HeapRef)
+        space.find_key_in_heap(ref, list, lambda t: [], _HEAD_SNAPSHOT)
+    num_choices = len(space.choices_made)
+    dictref = z3.Const("dictref", HeapRef)
+    space.find_key_in_heap(dictref, dict, lambda t: {}, _HEAD_SNAPSHOT)
+    assert len(space.choices_made) == num_choices
+
+
 def test_infinite_timeout() -> None:
     space = StateSpace(time.monotonic() + 1000, float("+inf"), RootNode())
     assert space.solver.check(True) == z3.sat
@@ -52,3 +83,206 @@ def test_checkpoint() -> None:
     assert listval_again is listval
     head_listval_again = find_key(_HEAD_SNAPSHOT)
     assert head_listval_again is head_listval
+
+
+def test_checkpoint_copies_lazily() -> None:
+    space = SimpleStateSpace()
+    refs = [z3.Const(f"ref{i}", HeapRef) for i in range(3)]
+    space.add(z3.Distinct(*refs))
+
+    def find_key(ref, snapshot):
+        return space.find_key_in_heap(ref, list, lambda t: [], snapshot)
+
+    orig_snapshot = space.current_snapshot()
+    orig_vals = [find_key(ref, _HEAD_SNAPSHOT) for ref in refs]
+    space.checkpoint()
+    # Nothing is copied until the entries are used:
+    assert all(entry._source is not None for entry in space.heaps[-1])
+
+    # Using the original first still gives the new snapshot a pristine copy:
+    find_key(refs[0], orig_snapshot).append(1)
+    assert find_key(refs[0], _HEAD_SNAPSHOT) == []
+    head_val = find_key(refs[1], _HEAD_SNAPSHOT)
+    head_val.append(2)
+    assert head_val is not orig_vals[1]
+    assert orig_vals[1] == []
+    assert space.heaps[-1][2]._source is not None
+
+
+def test_unreferenced_snapshots_are_not_copied_into() -> None:
+    space = SimpleStateSpace()
+    space.checkpoint()
+    ref = z3.Const("ref", HeapRef)
+    space.find_key_in_heap(ref, list, lambda t: [], _HEAD_SNAPSHOT)
+    assert [len(heap) for heap in space.heaps] == [0, 1]
+
+
+def test_replaying_solver_reuses_prefix() -> None:
+    root = RootNode(incremental_solver=True)
+    solver = root.solver
+    assert solver is not None
+    x = z3.Int("x")
+    node1, node2 = RootNode(), RootNode()
+
+    solver.begin_path(1.0)
+    solver.add(x > 0)
+    solver.decision(node1)
+    solver.add(x < 10)
+    solver.decision(node2)
+    solver.add(x == 5)
+    assert solver.check() == z3.sat
+    assert solver.num_scopes() == 3
+
+    # The next path shares the first decision, and then diverges:
+    solver.begin_path(1.0)
+    solver.add(x > 0)
+    solver.decision(node1)
+    solver.add(x < 10)
+    assert solver.num_scopes() == 3  # (nothing popped yet)
+    solver.decision(node2)
+    solver.add(x == 6)
+    assert solver.num_scopes() == 3
+    assert solver.check() == z3.sat
+    assert solver.model()[x].as_long() == 6
+    assert len(solver.assertions()) == 3
+
+
+def test_replaying_solver_truncates_before_queries() -> None:
+    root = RootNode(incremental_solver=True)
+    solver = root.solver
+    assert solver is not None
+    x = z3.Int("x")
+    solver.begin_path(1.0)
+    solver.add(x > 0)
+    solver.decision(root)
+    solver.add(x < 0)
+    assert solver.check() == z3.unsat
+
+    solver.begin_path(1.0)
+    solver.add(x > 0)
+    assert solver.check() == z3.sat
+    assert len(solver.assertions()) == 1
+
+
+def test_replaying_solver_keeps_background_facts() -> None:
+    root = RootNode(incremental_solver=True)
+    solver = root.solver
+    assert solver is not None
+    x, y = z3.Ints("x y")
+    solver.begin_path(1.0)
+    solver.add(x > 0)
+    solver.decision(root)
+    solver.add(x < 10)
+    add_background_fact(solver, y == 3)
+    add_background_fact(solver, y == 3)  # (duplicates are ignored)
+    assert solver.num_scopes() == 2
+    assert len(solver.assertions()) == 3
+
+    solver.begin_path(1.0)
+    solver.add(x < 0)
+    assert solver.check() == z3.sat
+    assert solver.model()[y].as_long() == 3
+    assert len(solver.assertions()) == 2
+
+
+def test_solver_query_cache() -> None:
+    solver = z3.Solver()
+    cache = SolverQueryCache()
+    x, y = z3.Ints("x y")
+    solver.add(x > 5)
+    assert cache.is_sat(solver, x < 10)
+    # A prior model can answer a different (but compatible) query:
+    assert cache.is_sat(solver, x != 10)
+    assert cache.stats["query_cache_model_hits"] == 1
+    assert not cache.is_sat(solver, x < 3)
+    # Any superset of an unsatisfiable query is also unsatisfiable:
+    assert not cache.is_sat(solver, x < 3, y > 0)
+    assert cache.stats["query_cache_unsat_hits"] == 1
+    assert cache.is_sat(solver, x < 10)
+    assert cache.stats["query_cache_exact_hits"] == 1
+    assert cache.stats["query_cache_misses"] == 2
+
+
+def test_solver_query_cache_is_bounded() -> None:
+    solver = z3.Solver()
+    cache = SolverQueryCache(max_models=0, max_results=2)
+    x = z3.Int("x")
+    for limit in range(3):
+        assert cache.is_sat(solver, x > limit)
+    # The least recently used result was dropped:
+    assert cache.is_sat(solver, x > 2)
+    assert cache.is_sat(solver, x > 0)
+    assert cache.stats["query_cache_exact_hits"] == 1
+    assert cache.stats["query_cache_misses"] == 4
+
+
+def test_constraint_slicer() -> None:
+    slicer = ConstraintSlicer()
+    x, y, z, w = z3.Ints("x y z w")
+    f = z3.Function("f", z3.IntSort(), z3.IntSort())
+    constraints = [x > y, y > 3, f(z) == 2, w == 5, f(w) > 0]
+    assert slicer.relevant_constraints(constraints, [x < 10]) == constraints[:2]
+    assert slicer.relevant_constraints(constraints, [z == 0]) == constraints[2:]
+    assert slicer.stats["sliced_constraints_kept"] == 5
+
+
+def test_solver_query_cache_with_slicing() -> None:
+    solver = z3.Solver()
+    cache = SolverQueryCache(slicer=ConstraintSlicer())
+    x, y, z = z3.Ints("x y z")
+    solver.add(x > y, y > 3, z == 7)
+    assert cache.is_sat(solver, x < 10)
+    assert not cache.is_sat(solver, x < 3)
+    # The prior model only needs to satisfy the constraints about x and y:
+    assert cache.is_sat(solver, x != 100)
+    assert cache.stats["query_cache_model_hits"] == 1
+
+
+def test_sliced_path_is_checked_before_reporting() -> None:
+    root = RootNode(slice_constraints=True)
+    space = StateSpace(time.monotonic() + 1000, 1000.0, root)
+    x, y = z3.Ints("x y")
+    # Unchecked (and contradictory) assertions about x:
+    space.add(x > 5)
+    space.add(x < 3)
+    # A sliced query about y does not notice:
+    assert space.is_possible(y > 0)
+    with pytest.raises(IgnoreAttempt):
+        space.check_sliced_path()
+
+
+def _explore_two_branches(strategy: SearchStrategyKind) -> List[Tuple[bool, bool]]:
+    root = RootNode(search_strategy=strategy)
+    x, y = z3.Ints("x y")
+    paths = []
+    for _ in range(4):
+        space = StateSpace(time.monotonic() + 1000, 1000.0, root)
+        paths.append((space.choose_possible(x > 0), space.choose_possible(y > 0)))
+        space.bubble_status(CallAnalysis(VerificationStatus.CONFIRMED))
+    return paths
+
+
+def test_depth_first_search_strategy() -> None:
+    assert _explore_two_branches(SearchStrategyKind.dfs) == [
+        (False, False),
+        (False, True),
+        (True, False),
+        (True, True),
+    ]
+
+
+def test_breadth_first_search_strategy() -> None:
+    first_decisions = [x for x, _ in _explore_two_branches(SearchStrategyKind.bfs)]
+    assert first_decisions == [False, True, False, True]
+
+
+def test_find_model_values() -> None:
+    space = SimpleStateSpace()
+    x, y = z3.Ints("x y")
+    space.add(x > 5)
+    space.add(y == x + 1)
+    xval, yval = space.find_model_values([x, y])
+    assert xval > 5 and yval == xval + 1
+    assert len(space.choices_made) == 1
+    # The values are now fixed:
+    assert not space.is_possible(x != xval)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+
+"""Report how quickly each search strategy finds the bugs in the example corpus."""
+import argparse
+import pathlib
+import sys
+import time
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+from crosshair.core_and_libs import MessageType, analyze_module
+from crosshair.options import AnalysisKind, AnalysisOptionSet, SearchStrategyKind
+from crosshair.util import load_file
+
+EXAMPLES_DIR = pathlib.Path(__file__).resolve().parent.parent / "examples"
+
+COUNTEREXAMPLE_STATES = frozenset(
+    [MessageType.POST_FAIL, MessageType.POST_ERR, MessageType.EXEC_ERR]
+)
+
+
+def find_bug_examples() -> Iterable[Tuple[AnalysisKind, pathlib.Path]]:
+    """Find the example files with known bugs, and the kind of contracts they use."""
+    for path in sorted(EXAMPLES_DIR.glob("*/bugs_detected/*.py")):
+        if path.stem != "__init__":
+            yield (AnalysisKind[path.parent.parent.name], path)
+
+
+def time_to_first_counterexample(
+    path: pathlib.Path,
+    kind: AnalysisKind,
+    strategy: SearchStrategyKind,
+    per_condition_timeout: float,
+) -> Optional[float]:
+    """
+    Check the conditions in a file, in order, until one of them fails.
+
+    :return: the number of seconds taken, or None if no counterexample was found
+    """
+    options = AnalysisOptionSet(
+        analysis_kind=[kind],
+        search_strategy=strategy,
+        per_condition_timeout=per_condition_timeout,
+    )
+    module = load_file(str(path))
+    start = time.monotonic()
+    for checkable in analyze_module(module, options):
+        for message in checkable.analyze():
+            if message.state in COUNTEREXAMPLE_STATES:
+                return time.monotonic() - start
+    return None
+
+
+def format_row(cells: Sequence[str], widths: Sequence[int]) -> str:
+    return "  ".join(cell.ljust(width) for cell, width in zip(cells, widths))
+
+
+def main(argv: List[str]) -> int:
+    """Execute the main routine."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--strategy",
+        type=SearchStrategyKind,
+        action="append",
+        help="Benchmark only this strategy (may be repeated)",
+    )
+    parser.add_argument(
+        "--per_condition_timeout",
+        type=float,
+        default=10.0,
+        help="Maximum seconds to spend on each condition",
+    )
+    args = parser.parse_args(argv)
+    strategies = args.strategy or list(SearchStrategyKind)
+
+    examples = list(find_bug_examples())
+    names = [str(path.relative_to(EXAMPLES_DIR)) for _, path in examples]
+    widths = [max(map(len, names))] + [max(13, len(s.name)) for s in strategies]
+    print(format_row(["example"] + [s.name for s in strategies], widths))
+    totals = [0.0 for _ in strategies]
+    found = [0 for _ in strategies]
+    for name, (kind, path) in zip(names, examples):
+        cells = [name]
+        for idx, strategy in enumerate(strategies):
+            try:
+                elapsed = time_to_first_counterexample(
+                    path, kind, strategy, args.per_condition_timeout
+                )
+            except Exception as exc:
+                cells.append(f"error: {type(exc).__name__}")
+                continue
+            if elapsed is None:
+                cells.append("-")
+            else:
+                totals[idx] += elapsed
+                found[idx] += 1
+                cells.append(f"{elapsed:.2f}s")
+        print(format_row(cells, widths), flush=True)
+    print(
+        format_row(
+            ["(found / total seconds)"]
+            + [f"{f}/{len(examples)} {t:.2f}s" for f, t in zip(found, totals)],
+            widths,
+        )
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,144 +1,30 @@
 """Provide access to and overrides for functions as they are called."""
 
-import ctypes
 import dataclasses
 import dis
 import sys
 import traceback
-from collections import defaultdict
+from collections import Counter
 from sys import _getframe
 from types import CodeType, FrameType
-from typing import Any, Callable, DefaultDict, Dict, List, Optional, Set, Tuple
+from typing import Any, Callable
+from typing import Counter as CounterType
+from typing import DefaultDict, Dict, FrozenSet, List, Optional, Set, Tuple
 
 import opcode
 
-from _crosshair_tracers import CTracer, TraceSwap  # type: ignore
-
-USE_C_TRACER = True
-
-PyObjPtr = ctypes.POINTER(ctypes.py_object)
-Py_IncRef = ctypes.pythonapi.Py_IncRef
-Py_DecRef = ctypes.pythonapi.Py_DecRef
-
-
-_debug_header: Tuple[Tuple[str, type], ...] = (
-    (
-        ("_ob_next", PyObjPtr),
-        ("_ob_prev", PyObjPtr),
-    )
-    if sys.flags.debug
-    else ()
+from _crosshair_tracers import (  # type: ignore
+    CoverageRecorder,
+    CTracer,
+    InterceptorTable,
+    TraceSwap,
+    frame_call_target,
+    frame_stack_read,
+    frame_stack_write,
+    stack_fingerprint,
 )
 
-if sys.version_info >= (3, 11):
-
-    class PyInterpreterFrame(ctypes.Structure):
-        _fields_: Tuple[Tuple[str, type], ...] = (
-            ("f_func", ctypes.py_object),
-            ("f_globals", ctypes.c_void_p),
-            ("f_builtins", ctypes.c_void_p),
-            ("f_locals", ctypes.c_void_p),
-            ("f_code", ctypes.py_object),
-            ("frame_obj", ctypes.c_void_p),
-            ("previous", ctypes.c_void_p),
-            ("prev_instr", ctypes.c_void_p),
-            ("stacktop", ctypes.c_int),
-            ("is_entry", ctypes.c_bool),
-            ("owner", ctypes.c_char),
-            ("localsplus", ctypes.py_object * 10_000_000),
-        )
-
-    def addrof(ptr):
-        return ctypes.cast(ptr, ctypes.c_void_p).value
-
-    class CFrame(ctypes.Structure):
-        _fields_: Tuple[Tuple[str, type], ...] = _debug_header + (
-            ("ob_refcnt", ctypes.c_ssize_t),
-            ("ob_type", ctypes.c_void_p),
-            ("f_back", ctypes.c_void_p),
-            ("f_frame", ctypes.POINTER(PyInterpreterFrame)),
-            ("f_trace", ctypes.c_void_p),
-            ("f_lineno", ctypes.c_int),
-            ("f_trace_lines", ctypes.c_char),
-            ("f_trace_opcodes", ctypes.c_char),
-            ("f_fast_as_locals", ctypes.c_char),
-            ("_f_frame_data", PyObjPtr),
-        )
-
-        def stackread(self, idx: int) -> object:
-            frame = self.f_frame.contents
-            return frame.localsplus[frame.stacktop + idx]
-
-        def stackwrite(self, idx: int, val: object):
-            frame = self.f_frame.contents
-            frame.localsplus[frame.stacktop + idx] = val
-
-elif sys.version_info >= (3, 10):
-
-    class CFrame(ctypes.Structure):
-        _fields_: Tuple[Tuple[str, type], ...] = _debug_header + (
-            ("ob_refcnt", ctypes.c_ssize_t),
-            ("ob_type", ctypes.c_void_p),
-            ("ob_size", ctypes.c_ssize_t),
-            ("f_back", ctypes.c_void_p),
-            ("f_code", ctypes.c_void_p),
-            ("f_builtins", ctypes.py_object),
-            ("f_globals", ctypes.py_object),
-            ("f_locals", ctypes.py_object),
-            ("f_valuestack", PyObjPtr),
-            ("f_trace", ctypes.c_void_p),
-            ("f_stackdepth", ctypes.c_int),
-        )
-
-        def stackread(self, idx: int) -> object:
-            return self.f_valuestack[(self.f_stackdepth) + idx]
-
-        def stackwrite(self, idx: int, val: object):
-            self.f_valuestack[(self.f_stackdepth) + idx] = val
-
-else:  # Python < 3.10
-
-    class CFrame(ctypes.Structure):
-        _fields_: Tuple[Tuple[str, type], ...] = _debug_header + (
-            ("ob_refcnt", ctypes.c_ssize_t),
-            ("ob_type", ctypes.c_void_p),
-            ("ob_size", ctypes.c_ssize_t),
-            ("f_back", ctypes.c_void_p),
-            ("f_code", ctypes.c_void_p),
-            ("f_builtins", ctypes.py_object),
-            ("f_globals", ctypes.py_object),
-            ("f_locals", ctypes.py_object),
-            ("f_valuestack", PyObjPtr),
-            ("f_stacktop", PyObjPtr),
-        )
-
-        def stackread(self, idx: int) -> object:
-            return self.f_stacktop[idx]
-
-        def stackwrite(self, idx: int, val: object) -> None:
-            self.f_stacktop[idx] = val
-
-
-def frame_stack_read(frame, idx) -> Any:
-    c_frame = CFrame.from_address(id(frame))
-    val = c_frame.stackread(idx)
-    Py_IncRef(ctypes.py_object(val))
-    return val
-
-
-def frame_stack_write(frame, idx, val):
-    c_frame = CFrame.from_address(id(frame))
-    old_val = c_frame.stackread(idx)
-    try:
-        Py_IncRef(ctypes.py_object(val))
-    except ValueError:  # (PyObject is NULL) - no incref required
-        pass
-    c_frame.stackwrite(idx, val)
-    try:
-        Py_DecRef(ctypes.py_object(old_val))
-    except ValueError:  # (PyObject is NULL) - no decref required
-        pass
-
+USE_C_TRACER = True
 
 CALL_FUNCTION = dis.opmap.get("CALL_FUNCTION", 131)
 CALL_FUNCTION_KW = dis.opmap.get("CALL_FUNCTION_KW", 141)
@@ -146,72 +32,18 @@ CALL_FUNCTION_EX = dis.opmap["CALL_FUNCTION_EX"]
 CALL_METHOD = dis.opmap.get("CALL_METHOD", 161)
 BUILD_TUPLE_UNPACK_WITH_CALL = dis.opmap.get("BUILD_TUPLE_UNPACK_WITH_CALL", 158)
 CALL = dis.opmap.get("CALL", 171)
-NULL_POINTER = object()
-
-
-def handle_build_tuple_unpack_with_call(
-    frame, c_frame
-) -> Optional[Tuple[int, Callable]]:
-    idx = -(frame.f_code.co_code[frame.f_lasti + 1] + 1)
-    try:
-        return (idx, c_frame.stackread(idx))
-    except ValueError:
-        return (idx, NULL_POINTER)  # type: ignore
-
-
-def handle_call(frame, c_frame) -> Optional[Tuple[int, Callable]]:
-    idx = -(frame.f_code.co_code[frame.f_lasti + 1] + 1)
-    try:
-        return (idx - 1, c_frame.stackread(idx - 1))
-    except ValueError:
-        pass
-    return (idx, c_frame.stackread(idx))
-
-
-def handle_call_function(frame, c_frame) -> Optional[Tuple[int, Callable]]:
-    idx = -(frame.f_code.co_code[frame.f_lasti + 1] + 1)
-    try:
-        return (idx, c_frame.stackread(idx))
-    except ValueError:
-        return (idx, NULL_POINTER)  # type: ignore
-
-
-def handle_call_function_kw(frame, c_frame) -> Optional[Tuple[int, Callable]]:
-    idx = -(frame.f_code.co_code[frame.f_lasti + 1] + 2)
-    try:
-        return (idx, c_frame.stackread(idx))
-    except ValueError:
-        return (idx, NULL_POINTER)  # type: ignore
-
-
-def handle_call_function_ex(frame, c_frame) -> Optional[Tuple[int, Callable]]:
-    idx = -((frame.f_code.co_code[frame.f_lasti + 1] & 1) + 2)
-    try:
-        return (idx, c_frame.stackread(idx))
-    except ValueError:
-        return (idx, NULL_POINTER)  # type: ignore
-
-
-def handle_call_method(frame, c_frame) -> Optional[Tuple[int, Callable]]:
-    idx = -(frame.f_code.co_code[frame.f_lasti + 1] + 2)
-    try:
-        return (idx, c_frame.stackread(idx))
-    except ValueError:
-        # not a sucessful method lookup; no call happens here
-        idx += 1
-        return (idx, c_frame.stackread(idx))
-
-
-_CALL_HANDLERS: Dict[
-    int, Callable[[object, object], Optional[Tuple[int, Callable]]]
-] = {
-    BUILD_TUPLE_UNPACK_WITH_CALL: handle_build_tuple_unpack_with_call,
-    CALL: handle_call,
-    CALL_FUNCTION: handle_call_function,
-    CALL_FUNCTION_KW: handle_call_function_kw,
-    CALL_FUNCTION_EX: handle_call_function_ex,
-    CALL_METHOD: handle_call_method,
-}
+
+# The opcodes that frame_call_target() understands:
+_CALL_OPCODES = frozenset(
+    [
+        BUILD_TUPLE_UNPACK_WITH_CALL,
+        CALL,
+        CALL_FUNCTION,
+        CALL_FUNCTION_KW,
+        CALL_FUNCTION_EX,
+        CALL_METHOD,
+    ]
+)
 
 
 class Untracable:
@@ -226,7 +58,9 @@ class TraceException(BaseException):
 
 class TracingModule:
     # override these!:
-    opcodes_wanted = frozenset(_CALL_HANDLERS.keys())
+    opcodes_wanted = _CALL_OPCODES
+    # If not None, only instructions in these code objects are traced:
+    codeobjects_wanted: Optional[FrozenSet[CodeType]] = None
 
     def __call__(self, frame, codeobj, opcodenum, extra):
         return self.trace_op(frame, codeobj, opcodenum, extra)
@@ -235,36 +69,11 @@ class TracingModule:
         if is_tracing():
             raise TraceException
         if extra is None:
-            call_handler = _CALL_HANDLERS.get(opcodenum)
-            if not call_handler:
+            # (we return what we find, so that later modules need not look again)
+            extra = frame_call_target(frame, opcodenum)
+            if extra is None:
                 return None
-            maybe_call_info = call_handler(frame, CFrame.from_address(id(frame)))
-            if maybe_call_info is None:
-                # TODO: this cannot happen?
-                return None
-            (fn_idx, target) = maybe_call_info
-            binding_target = None
-
-            try:
-                __self = object.__getattribute__(target, "__self__")
-            except AttributeError:
-                pass
-            else:
-                try:
-                    __func = object.__getattribute__(target, "__func__")
-                except AttributeError:
-                    # The implementation is likely in C.
-                    # Attempt to get a function via the type:
-                    typelevel_target = getattr(type(__self), target.__name__, None)
-                    if typelevel_target is not None:
-                        binding_target = __self
-                        target = typelevel_target
-                else:
-                    binding_target = __self
-                    target = __func
-
-        else:
-            (fn_idx, target, binding_target) = extra
+        (fn_idx, target, binding_target) = extra
         if isinstance(target, Untracable):
             return None
         replacement = self.trace_call(frame, target, binding_target)
@@ -292,9 +101,43 @@ class TracingModule:
 TracerConfig = Tuple[Tuple[TracingModule, ...], DefaultDict[int, List[TracingModule]]]
 
 
+# Code in files with these suffixes is not traced at all.
+# The decision is cached per code object, so checking it is cheap.
+DEFAULT_UNTRACED_FILE_SUFFIXES: Tuple[str, ...] = (
+    "/z3.py",
+    "/z3core.py",
+    "/z3types.py",
+)
+if sys.platform == "win32":
+    DEFAULT_UNTRACED_FILE_SUFFIXES = tuple(
+        p.replace("/", "\\") for p in DEFAULT_UNTRACED_FILE_SUFFIXES
+    )
+
+
+# All tracing is done through sys.settrace with per-opcode events.
+# A sys.monitoring (PEP 669) backend is not a drop-in replacement: its CALL
+# events report the callable, but offer no way to replace it on the stack, which
+# is how TracingModule.trace_call patches calls.
 class CompositeTracer:
     def __init__(self):
         self.ctracer = CTracer()
+        self.ctracer.set_untraced_suffixes(DEFAULT_UNTRACED_FILE_SUFFIXES)
+        # Incremented whenever the untraced suffixes change, so that decisions
+        # cached elsewhere can be invalidated:
+        self.untraced_generation = 0
+
+    def get_untraced_file_suffixes(self) -> Tuple[str, ...]:
+        return self.ctracer.get_untraced_suffixes()
+
+    def set_untraced_file_suffixes(self, suffixes: Tuple[str, ...]) -> None:
+        """
+        Skip tracing in files that end with any of the given suffixes.
+
+        Only skip code that you trust to never call anything that CrossHair needs
+        to intercept (like a function with contracts, or a symbolic value's method).
+        """
+        self.ctracer.set_untraced_suffixes(tuple(suffixes))
+        self.untraced_generation += 1
 
     def push_module(self, module: TracingModule) -> None:
         self.ctracer.push_module(module)
@@ -328,6 +171,57 @@ class CompositeTracer:
 COMPOSITE_TRACER = CompositeTracer()
 
 
+CALL_SITE_CACHE_MISS = object()
+
+
+class CallSiteCache:
+    """
+    Remember the decisions that a TracingModule makes at each call site.
+
+    A call site (a caller code object and instruction offset) remembers only the
+    callee that it saw most recently, and the replacement chosen for it (usually
+    None). Nearly every call site always calls the same function.
+    """
+
+    max_entries = 10_000
+
+    def __init__(self, stats_prefix: str):
+        self.entries: Dict[Tuple[CodeType, int], Tuple[object, object, object]] = {}
+        self.stats_prefix = stats_prefix
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def stats(self) -> CounterType[str]:
+        prefix = self.stats_prefix
+        return Counter({prefix + "_hits": self.hits, prefix + "_misses": self.misses})
+
+    def lookup(self, site: Tuple[CodeType, int], fn: object, binding_key: object):
+        """Get the cached replacement, or CALL_SITE_CACHE_MISS."""
+        entry = self.entries.get(site)
+        if entry is not None and entry[0] is fn and entry[1] is binding_key:
+            self.hits += 1
+            return entry[2]
+        self.misses += 1
+        return CALL_SITE_CACHE_MISS
+
+    def store(
+        self,
+        site: Tuple[CodeType, int],
+        fn: object,
+        binding_key: object,
+        replacement: Optional[Callable],
+    ) -> None:
+        entries = self.entries
+        if len(entries) >= self.max_entries:
+            # (code objects created on the fly can make for unbounded call sites)
+            entries.clear()
+        entries[site] = (fn, binding_key, replacement)
+
+    def clear(self) -> None:
+        self.entries.clear()
+
+
 class PatchingModule(TracingModule):
     """Hot-swap functions on the interpreter stack."""
 
@@ -338,15 +232,18 @@ class PatchingModule(TracingModule):
     ):
         self.overrides: Dict[Callable, Callable] = {}
         self.nextfn: Dict[object, Callable] = {}  # code object to next, lower layer
+        self.call_site_cache = CallSiteCache("patch_cache")
         if overrides:
             self.add(overrides)
-        self.fn_type_overrides = fn_type_overrides or {}
+        # (copied, so that only `add` can change our decisions)
+        self.fn_type_overrides = dict(fn_type_overrides or {})
 
     def add(self, new_overrides: Dict[Callable, Callable]):
         for orig, new_override in new_overrides.items():
             prev_override = self.overrides.get(orig, orig)
             self.nextfn[(new_override.__code__, orig)] = prev_override
             self.overrides[orig] = new_override
+        self.call_site_cache.clear()
 
     def __repr__(self):
         return f"PatchingModule({list(self.overrides.keys())})"
@@ -357,16 +254,25 @@ class PatchingModule(TracingModule):
         fn: Callable,
         binding_target: object,
     ) -> Optional[Callable]:
+        # Deciding that a function is not patched takes two lookups; that's
+        # cheaper than consulting the call site cache, so we do it first.
         try:
-            target = self.overrides.get(fn)
+            if fn not in self.overrides:
+                if type(fn) not in self.fn_type_overrides:
+                    return None
         except TypeError:
             return None
+        site = (frame.f_code, frame.f_lasti)
+        replacement = self.call_site_cache.lookup(site, fn, None)
+        if replacement is CALL_SITE_CACHE_MISS:
+            replacement = self.find_replacement(frame, fn)
+            self.call_site_cache.store(site, fn, None, replacement)
+        return replacement  # type: ignore
+
+    def find_replacement(self, frame: Any, fn: Callable) -> Optional[Callable]:
+        target = self.overrides.get(fn)
         if target is None:
-            fn_type_override = self.fn_type_overrides.get(type(fn))
-            if fn_type_override is None:
-                return None
-            else:
-                target = fn_type_override(fn)
+            target = self.fn_type_overrides[type(fn)](fn)
         caller_code = frame.f_code
         if caller_code.co_name == "_crosshair_wrapper":
             return None
@@ -388,33 +294,33 @@ class CoverageResult:
     opcode_coverage: float
 
 
-class CoverageTracingModule(TracingModule):
+class CoverageTracingModule(CoverageRecorder, TracingModule):
+    """
+    Record the instructions that execute in some functions.
+
+    The recording happens in the C tracer (in a bitmap for each code object), so
+    the traced instructions never call back into Python.
+    """
+
     opcodes_wanted = frozenset(opcode.opmap.values())
 
     def __init__(self, *fns: Callable):
         assert not is_tracing()
         self.fns = fns
         self.codeobjects = set(fn.__code__ for fn in fns)
+        self.codeobjects_wanted = frozenset(self.codeobjects)
         self.opcode_offsets = {
             code: set(i.offset for i in dis.get_instructions(code))
             for code in self.codeobjects
         }
-        self.offsets_seen: Dict[CodeType, Set[int]] = defaultdict(set)
-
-    def trace_op(self, frame, codeobj, opcodenum, extra):
-        code = frame.f_code
-        if code not in self.codeobjects:
-            return
-        lasti = frame.f_lasti
-        assert lasti in self.opcode_offsets[code]
-        self.offsets_seen[code].add(lasti)
+        super().__init__(tuple(self.codeobjects))
 
     def get_results(self, fn: Optional[Callable] = None):
         if fn is None:
             assert len(self.fns) == 1
             fn = self.fns[0]
         possible = self.opcode_offsets[fn.__code__]
-        seen = self.offsets_seen[fn.__code__]
+        seen = self.offsets_covered(fn.__code__)
         return CoverageResult(
             offsets_covered=seen,
             all_offsets=possible,
@@ -1,3 +1,5 @@
+from collections import Counter
+
 import pytest
 
 from crosshair.tracers import (
@@ -85,6 +87,26 @@ def test_no_tracing():
             assert (1, 2, 3).__len__() == 3
 
 
+def call_examplefn() -> int:
+    return examplefn(42)
+
+
+def test_patching_module_call_site_cache():
+    patches = PatchingModule({examplefn: overridefn})
+    patching_tracer = CompositeTracer()
+    patching_tracer.push_module(patches)
+    with patching_tracer:
+        assert [call_examplefn() for _ in range(3)] == [2, 2, 2]
+    assert patches.call_site_cache.stats == Counter(
+        patch_cache_hits=2, patch_cache_misses=1
+    )
+    # New patches invalidate the cached decisions:
+    patches.add({examplefn: lambda *a: 3})
+    with patching_tracer:
+        assert call_examplefn() == 3
+    patching_tracer.pop_config(patches)
+
+
 def test_measure_fn_coverage() -> None:
     def called_by_foo(x: int) -> int:
         return x
@@ -1,13 +1,19 @@
 import collections
 import inspect
+import json
+import os
 import sys
-from typing import Dict, List, Optional, Type
+import time
+from pathlib import Path
+from types import ModuleType
+from typing import Counter, Dict, Iterable, List, Optional, Set, Tuple, Type
 
 import z3  # type: ignore
 
-from crosshair.z3util import z3Eq, z3Not
-
-_MAP: Optional[Dict[type, List[type]]] = None
+from crosshair.auditwall import SideEffectDetected, opened_auditwall
+from crosshair.statespace import add_background_fact
+from crosshair.util import debug
+from crosshair.z3util import z3Eq
 
 _IGNORED_MODULE_ROOTS = {
     # CrossHair will get confused if we try to proxy our own types:
@@ -21,17 +27,6 @@ _IGNORED_MODULE_ROOTS = {
 }
 
 
-def _add_class(cls: type) -> None:
-    """Add a class just for testing purposes."""
-    global _MAP
-    get_subclass_map()  # ensure we're initialized
-    assert _MAP is not None
-    for base in cls.__bases__:
-        subs = _MAP[base]
-        if cls not in subs:
-            subs.append(cls)
-
-
 _UNSAFE_MEMBERS = frozenset(
     ["__copy___", "__deepcopy__", "__reduce_ex__", "__reduce__"]
 )
@@ -43,37 +38,200 @@ def _class_known_to_be_copyable(cls: type) -> bool:
     return True
 
 
+class SubclassMap:
+    """
+    A map from parent to (direct) child classes, for the classes in loaded modules.
+
+    The map is updated incrementally as more modules are loaded. The names of the
+    classes in each module are cached on disk, so that a fresh process can find
+    them without crawling every member of every module.
+    """
+
+    def __init__(self, cache_file: Optional[Path]):
+        self.map: Dict[type, List[type]] = collections.defaultdict(list)
+        self.stats: Counter[str] = collections.Counter()
+        self._classes: Set[type] = set()
+        # Children whose base classes are not (yet) in the map:
+        self._orphans: Dict[type, List[type]] = collections.defaultdict(list)
+        self._modules_seen: Dict[str, ModuleType] = {}
+        self._cache_file = cache_file
+        self._cache = self._read_cache()
+        self._cache_dirty = False
+
+    def _read_cache(self) -> Dict[str, Tuple[list, List[str]]]:
+        if self._cache_file is None:
+            return {}
+        try:
+            with open(self._cache_file) as fh:
+                contents = json.load(fh)
+            if contents.get("format") == _CACHE_FORMAT_VERSION:
+                return {k: tuple(v) for k, v in contents["modules"].items()}
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, AttributeError, KeyError, TypeError) as e:
+            debug("Ignoring unreadable subclass cache:", e)
+        return {}
+
+    def _write_cache(self) -> None:
+        if self._cache_file is None or not self._cache_dirty:
+            return
+        self._cache_dirty = False
+        contents = {"format": _CACHE_FORMAT_VERSION, "modules": self._cache}
+        try:
+            # (this is our own write; it is fine to do when analyzing user code)
+            with opened_auditwall():
+                self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+                tmp_file = self._cache_file.with_suffix(f".{os.getpid()}.tmp")
+                with open(tmp_file, "w") as fh:
+                    json.dump(contents, fh)
+                os.replace(tmp_file, self._cache_file)
+        except (OSError, SideEffectDetected) as e:
+            debug("Unable to write subclass cache:", e)
+
+    def _add(self, cls: type) -> None:
+        if cls in self._classes:
+            return
+        self._classes.add(cls)
+        for base in cls.__bases__:
+            if base in self._classes:
+                self.map[base].append(cls)
+            else:
+                self._orphans[base].append(cls)
+        adopted = self._orphans.pop(cls, None)
+        if adopted:
+            self.map[cls].extend(adopted)
+
+    def _module_classes(self, module_name: str, module: ModuleType) -> List[type]:
+        fingerprint = _module_fingerprint(module)
+        cached = self._cache.get(module_name)
+        if fingerprint is not None and cached is not None:
+            cached_fingerprint, names = cached
+            if cached_fingerprint == fingerprint:
+                classes = [getattr(module, name, None) for name in names]
+                if all(map(inspect.isclass, classes)):
+                    self.stats["subclass_map_cached_modules"] += 1
+                    return classes  # type: ignore
+        try:
+            members = inspect.getmembers(module, inspect.isclass)
+        except ImportError:
+            return []
+        members = [(n, cls) for n, cls in members if _class_known_to_be_copyable(cls)]
+        if fingerprint is not None:
+            self._cache[module_name] = (fingerprint, [name for name, _ in members])
+            self._cache_dirty = True
+        self.stats["subclass_map_crawled_modules"] += 1
+        return [cls for _, cls in members]
+
+    def _new_modules(self) -> List[Tuple[str, ModuleType]]:
+        modules_seen = self._modules_seen
+        return [
+            (name, module)
+            for name, module in list(sys.modules.items())
+            if modules_seen.get(name) is not module
+        ]
+
+    def update(self) -> None:
+        """Add the classes from modules that were (re)loaded since the last update."""
+        start = time.monotonic()
+        modules_seen = self._modules_seen
+        new_modules = self._new_modules()
+        if not new_modules:
+            return
+        # (inspecting modules may import more modules; repeat until we've seen all)
+        while new_modules:
+            for module_name, module in new_modules:
+                modules_seen[module_name] = module
+                if module_name.split(".", 1)[0] in _IGNORED_MODULE_ROOTS:
+                    continue
+                if module is None:
+                    # We set the internal _datetime module to None, ensuring that
+                    # we don't load the C implementation.
+                    continue
+                for cls in self._module_classes(module_name, module):
+                    self._add(cls)
+            new_modules = self._new_modules()
+        self._write_cache()
+        self.stats["subclass_map_build_ms"] += int((time.monotonic() - start) * 1000)
+
+
+_CACHE_FORMAT_VERSION = 1
+
+
+def _module_fingerprint(module: ModuleType) -> Optional[list]:
+    """Identify a version of a module, or return None if it might not be stable."""
+    filename = getattr(module, "__file__", None)
+    if not isinstance(filename, str):
+        if getattr(module, "__name__", None) in sys.builtin_module_names:
+            return [sys.version]
+        return None
+    try:
+        stat = os.stat(filename)
+    except OSError:
+        return None
+    version = getattr(module, "__version__", None)
+    return [
+        filename,
+        stat.st_mtime_ns,
+        stat.st_size,
+        version if isinstance(version, str) else None,
+    ]
+
+
+def _default_cache_file() -> Optional[Path]:
+    if sys.platform == "win32":
+        root = os.environ.get("LOCALAPPDATA")
+        if not root:
+            return None
+        cache_dir = Path(root) / "crosshair" / "Cache"
+    else:
+        root = os.environ.get("XDG_CACHE_HOME")
+        cache_dir = (Path(root) if root else Path.home() / ".cache") / "crosshair"
+    version = "{}.{}.{}".format(*sys.version_info[:3])
+    return cache_dir / f"subclass-map-{sys.implementation.name}-{version}.json"
+
+
+_MAP: Optional[SubclassMap] = None
+
+
+def _subclass_map() -> SubclassMap:
+    global _MAP
+    if _MAP is None:
+        _MAP = SubclassMap(_default_cache_file())
+        _MAP.update()
+    return _MAP
+
+
+def _add_class(cls: type) -> None:
+    """Add a class just for testing purposes."""
+    subs = get_subclass_map()
+    for base in cls.__bases__:
+        if cls not in subs[base]:
+            subs[base].append(cls)
+
+
 def get_subclass_map() -> Dict[type, List[type]]:
     """
-    Crawl all types presently in memory and makes a map from parent to child classes.
+    Get a map from parent to child classes, for all types in memory.
 
     Only direct children are included.
     Does not yet handle "protocol" subclassing (eg "Iterator", "Mapping", etc).
+    The map only changes when `update_subclass_map()` is called.
     """
-    global _MAP
+    return _subclass_map().map
+
+
+def update_subclass_map() -> None:
+    """Add the classes of any newly imported modules to the subclass map."""
+    if _MAP is not None:
+        _MAP.update()
+
+
+def pop_subclass_map_stats() -> Counter[str]:
+    """Get (and reset) the statistics about building the subclass map."""
     if _MAP is None:
-        classes = set()
-        for module_name, module in list(sys.modules.items()):
-            if module_name.split(".", 1)[0] in _IGNORED_MODULE_ROOTS:
-                continue
-            if module is None:
-                # We set the internal _datetime module to None, ensuring that
-                # we don't load the C implementation.
-                continue
-            try:
-                module_classes = inspect.getmembers(module, inspect.isclass)
-            except ImportError:
-                continue
-            for _, cls in module_classes:
-                if _class_known_to_be_copyable(cls):
-                    classes.add(cls)
-        subclass = collections.defaultdict(list)
-        for cls in classes:
-            for base in cls.__bases__:
-                if base in classes:
-                    subclass[base].append(cls)
-        _MAP = subclass
-    return _MAP
+        return collections.Counter()
+    stats, _MAP.stats = _MAP.stats, collections.Counter()
+    return stats
 
 
 def rebuild_subclass_map():
@@ -106,39 +264,170 @@ SMT_SUBTYPE_FN = z3.Function(
 )
 
 
+# Gives each type a distinct integer, so that we need not assert pairwise distinctness:
+SMT_TYPE_INDEX_FN = z3.Function("pytype_sort_index", PYTYPE_SORT, z3.IntSort())
+
+
+class PyTypeLattice:
+    """
+    The Python types that we have seen (in this process), and their subclass relation.
+
+    Each type gets a stable index, SMT constant, and (cached) facts. These are shared
+    by all solvers; a solver only needs the facts for the types that it uses.
+    """
+
+    def __init__(self):
+        self._types: List[type] = []
+        self._indices: Dict[type, int] = {}
+        self._exprs: List[z3.ExprRef] = []
+        self._expr_indices: Dict[int, int] = {}  # (keyed by the SMT expression id)
+        self._identity_facts: List[z3.ExprRef] = []
+        self._subtype_values: Dict[Tuple[int, int], z3.ExprRef] = {}
+        self._subtype_facts: Dict[Tuple[int, int], z3.ExprRef] = {}
+
+    def index_of(self, typ: Type) -> int:
+        idx = self._indices.get(typ)
+        if idx is None:
+            idx = len(self._types)
+            expr = z3.Const(f"typrepo_{typ.__qualname__}_{id(typ):x}", PYTYPE_SORT)
+            self._types.append(typ)
+            self._indices[typ] = idx
+            self._exprs.append(expr)
+            self._expr_indices[expr.get_id()] = idx
+            self._identity_facts.append(SMT_TYPE_INDEX_FN(expr) == idx)
+        return idx
+
+    def index_of_expr(self, expr: z3.ExprRef) -> Optional[int]:
+        """Get the index of a type's SMT constant, or None for other expressions."""
+        return self._expr_indices.get(expr.get_id())
+
+    def expr(self, idx: int) -> z3.ExprRef:
+        return self._exprs[idx]
+
+    def identity_fact(self, idx: int) -> z3.ExprRef:
+        return self._identity_facts[idx]
+
+    def subtype_value(self, idx1: int, idx2: int) -> z3.ExprRef:
+        key = (idx1, idx2)
+        value = self._subtype_values.get(key)
+        if value is None:
+            value = _pyissubclass(self._types[idx1], self._types[idx2])
+            self._subtype_values[key] = value
+        return value
+
+    def subtype_fact(self, idx1: int, idx2: int) -> z3.ExprRef:
+        key = (idx1, idx2)
+        fact = self._subtype_facts.get(key)
+        if fact is None:
+            fact = z3Eq(
+                SMT_SUBTYPE_FN(self._exprs[idx1], self._exprs[idx2]),
+                self.subtype_value(idx1, idx2),
+            )
+            self._subtype_facts[key] = fact
+        return fact
+
+
+_LATTICE = PyTypeLattice()
+
+
+def reset_type_lattice() -> None:
+    """
+    Forget the types (and their facts) that earlier searches have seen.
+
+    The lattice holds on to every type that it indexes, and its subtype caches grow
+    quadratically; call this between searches (never during one) to bound it.
+    """
+    global _LATTICE
+    _LATTICE = PyTypeLattice()
+
+
 class SymbolicTypeRepository:
+    """
+    The types used by one solver.
+
+    Subclass facts are only asserted for the relationships that we query with a
+    symbolic type: when querying `issubclass(<symbolic type>, T)`, we add the facts
+    relating T to the known types (and to types that become known later).
+    """
+
     pytype_to_smt: Dict[Type, z3.ExprRef]
 
     def __init__(self, solver: z3.Solver):
         self.pytype_to_smt = {}
         self.solver = solver
+        self._known: List[int] = []
+        # Indices of the types whose subclasses (or superclasses) are constrained:
+        self._constrained_subclasses: Set[int] = set()
+        self._constrained_superclasses: Set[int] = set()
+        self._fully_constrained = False
+
+    def _add_facts(self, facts: Iterable[z3.ExprRef]) -> None:
+        facts = list(facts)
+        if facts:
+            add_background_fact(self.solver, *facts)
+
+    def _constrain_subclasses(self, idx: int) -> None:
+        # Facts for `issubclass(<known type>, <type at idx>)`
+        if idx in self._constrained_subclasses:
+            return
+        self._constrained_subclasses.add(idx)
+        self._add_facts(_LATTICE.subtype_fact(other, idx) for other in self._known)
+
+    def _constrain_superclasses(self, idx: int) -> None:
+        # Facts for `issubclass(<type at idx>, <known type>)`
+        if idx in self._constrained_superclasses:
+            return
+        self._constrained_superclasses.add(idx)
+        self._add_facts(_LATTICE.subtype_fact(idx, other) for other in self._known)
+
+    def _constrain_all(self) -> None:
+        if not self._fully_constrained:
+            self._fully_constrained = True
+            for idx in self._known:
+                self._constrain_subclasses(idx)
+
+    def _subtype_relation(self, typ1: z3.ExprRef, typ2: z3.ExprRef) -> z3.ExprRef:
+        idx1 = _LATTICE.index_of_expr(typ1)
+        idx2 = _LATTICE.index_of_expr(typ2)
+        if idx1 is not None and idx2 is not None:
+            return _LATTICE.subtype_value(idx1, idx2)
+        if idx2 is not None:
+            self._constrain_subclasses(idx2)
+        elif idx1 is not None:
+            self._constrain_superclasses(idx1)
+        else:
+            self._constrain_all()
+        return SMT_SUBTYPE_FN(typ1, typ2)
 
     def smt_can_subclass(self, typ1: z3.ExprRef, typ2: z3.ExprRef) -> z3.ExprRef:
-        return SMT_SUBTYPE_FN(typ1, typ2) != MAYBE_SORT.exception
+        return self._subtype_relation(typ1, typ2) != MAYBE_SORT.exception
 
     def smt_issubclass(self, typ1: z3.ExprRef, typ2: z3.ExprRef) -> z3.ExprRef:
-        return SMT_SUBTYPE_FN(typ1, typ2) == MAYBE_SORT.yes
+        return self._subtype_relation(typ1, typ2) == MAYBE_SORT.yes
 
     def get_type(self, typ: Type) -> z3.ExprRef:
         pytype_to_smt = self.pytype_to_smt
         if typ not in pytype_to_smt:
-            stmts = []
-            expr = z3.Const(f"typrepo_{typ.__qualname__}_{id(typ):x}", PYTYPE_SORT)
-            for other_pytype, other_expr in pytype_to_smt.items():
-                stmts.append(z3Not(z3Eq(other_expr, expr)))
-                stmts.append(
-                    z3Eq(
-                        SMT_SUBTYPE_FN(expr, other_expr),
-                        _pyissubclass(typ, other_pytype),
-                    )
-                )
-                stmts.append(
-                    z3Eq(
-                        SMT_SUBTYPE_FN(other_expr, expr),
-                        _pyissubclass(other_pytype, typ),
-                    )
+            idx = _LATTICE.index_of(typ)
+            self._known.append(idx)
+            facts = [_LATTICE.identity_fact(idx)]
+            if self._fully_constrained:
+                self._constrained_subclasses.add(idx)
+            facts.extend(
+                _LATTICE.subtype_fact(idx, other)
+                for other in self._constrained_subclasses
+            )
+            facts.extend(
+                _LATTICE.subtype_fact(other, idx)
+                for other in self._constrained_superclasses
+                if other != idx
+            )
+            if self._fully_constrained:
+                facts.extend(
+                    _LATTICE.subtype_fact(other, idx)
+                    for other in self._known
+                    if other != idx
                 )
-            stmts.append(z3Eq(SMT_SUBTYPE_FN(expr, expr), _pyissubclass(typ, typ)))
-            self.solver.add(stmts)
-            pytype_to_smt[typ] = expr
+            self._add_facts(facts)
+            pytype_to_smt[typ] = _LATTICE.expr(idx)
         return pytype_to_smt[typ]
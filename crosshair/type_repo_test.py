@@ -0,0 +1,131 @@
+import gc
+import sys
+import weakref
+from types import ModuleType
+
+import z3  # type: ignore
+
+from crosshair.type_repo import (
+    PYTYPE_SORT,
+    SubclassMap,
+    SymbolicTypeRepository,
+    reset_type_lattice,
+)
+
+
+class Animal:
+    pass
+
+
+class Cat(Animal):
+    pass
+
+
+class Dog(Animal):
+    pass
+
+
+def test_concrete_subclass_checks_need_no_facts():
+    solver = z3.Solver()
+    repo = SymbolicTypeRepository(solver)
+    cat, animal = repo.get_type(Cat), repo.get_type(Animal)
+    num_facts = len(solver.assertions())
+    assert z3.is_true(z3.simplify(repo.smt_issubclass(cat, animal)))
+    assert z3.is_false(z3.simplify(repo.smt_issubclass(animal, cat)))
+    assert len(solver.assertions()) == num_facts
+
+
+def test_symbolic_subclass_checks():
+    solver = z3.Solver()
+    repo = SymbolicTypeRepository(solver)
+    smt_types = [repo.get_type(t) for t in (int, str, Cat, Dog)]
+    num_facts = len(solver.assertions())
+    var = z3.Const("t", PYTYPE_SORT)
+    is_animal = repo.smt_issubclass(var, repo.get_type(Animal))
+    # Only the facts about Animal's subclasses were added (not all pairs):
+    assert len(solver.assertions()) <= num_facts + 6
+    # Types that become known later are still constrained:
+    bird = repo.get_type(type("Bird", (Animal,), {}))
+    for smt_type, expected in zip(smt_types + [bird], [0, 0, 1, 1, 1]):
+        solver.push()
+        solver.add(var == smt_type, is_animal if expected else z3.Not(is_animal))
+        assert solver.check() == z3.sat
+        solver.pop()
+        solver.push()
+        solver.add(var == smt_type, z3.Not(is_animal) if expected else is_animal)
+        assert solver.check() == z3.unsat
+        solver.pop()
+
+
+def test_fully_symbolic_subclass_checks():
+    solver = z3.Solver()
+    repo = SymbolicTypeRepository(solver)
+    cat, animal = repo.get_type(Cat), repo.get_type(Animal)
+    var1, var2 = z3.Const("t1", PYTYPE_SORT), z3.Const("t2", PYTYPE_SORT)
+    issub = repo.smt_issubclass(var1, var2)
+    dog = repo.get_type(Dog)
+    assert solver.check(issub, var1 == dog, var2 == animal) == z3.sat
+    assert solver.check(issub, var1 == dog, var2 == cat) == z3.unsat
+
+
+def test_reset_type_lattice_releases_types():
+    bird = type("Bird", (Animal,), {})
+    bird_ref = weakref.ref(bird)
+    repo = SymbolicTypeRepository(z3.Solver())
+    repo.smt_issubclass(repo.get_type(bird), repo.get_type(Animal))
+    del repo, bird
+    gc.collect()
+    assert bird_ref() is not None
+    reset_type_lattice()
+    gc.collect()
+    assert bird_ref() is None
+
+
+def test_subclass_map_updates_incrementally(tmp_path):
+    cache_file = tmp_path / "subclasses.json"
+    subclass_map = SubclassMap(cache_file)
+    subclass_map.update()
+    assert subclass_map.stats["subclass_map_crawled_modules"] > 0
+    module = ModuleType("_crosshair_type_repo_example")
+    module.Animal = type("Animal", (), {})  # type: ignore
+    module.Cat = type("Cat", (module.Animal,), {})  # type: ignore
+    sys.modules[module.__name__] = module
+    try:
+        assert module.Animal not in subclass_map.map
+        subclass_map.update()
+        assert subclass_map.map[module.Animal] == [module.Cat]  # type: ignore
+    finally:
+        del sys.modules[module.__name__]
+
+
+def test_subclass_map_notices_replaced_modules(tmp_path):
+    subclass_map = SubclassMap(tmp_path / "subclasses.json")
+    module_name = "_crosshair_type_repo_example"
+    old_module, new_module = ModuleType(module_name), ModuleType(module_name)
+    new_module.Animal = type("Animal", (), {})  # type: ignore
+    new_module.Cat = type("Cat", (new_module.Animal,), {})  # type: ignore
+    sys.modules[module_name] = old_module
+    try:
+        subclass_map.update()
+        # (the number of loaded modules does not change here)
+        sys.modules[module_name] = new_module
+        subclass_map.update()
+        assert subclass_map.map[new_module.Animal] == [new_module.Cat]  # type: ignore
+    finally:
+        del sys.modules[module_name]
+
+
+def test_subclass_map_uses_disk_cache(tmp_path):
+    cache_file = tmp_path / "subclasses.json"
+    first = SubclassMap(cache_file)
+    first.update()
+    assert cache_file.exists()
+    second = SubclassMap(cache_file)
+    second.update()
+    assert second.stats["subclass_map_cached_modules"] > 0
+    assert second.stats["subclass_map_crawled_modules"] < (
+        first.stats["subclass_map_crawled_modules"]
+    )
+    assert {k: set(v) for k, v in first.map.items()} == {
+        k: set(v) for k, v in second.map.items()
+    }
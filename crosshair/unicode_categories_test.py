@@ -1,17 +1,24 @@
-from ast import literal_eval
 from sys import maxunicode
-from unicodedata import unidata_version
 
-from crosshair.unicode_categories import (
-    _PRECOMPUTED_CATEGORY_RANGES,
-    CharMask,
-    compute_categories,
-)
+from crosshair.unicode_categories import CharMask, casemap, mask_from_ranges
+from crosshair.unicode_tables import TABLE_COMPUTERS, data_file, load_tables
 
 
-def test_categories_cached_correctly():
-    precomputed_str = _PRECOMPUTED_CATEGORY_RANGES[unidata_version]
-    assert compute_categories() == literal_eval(precomputed_str)
+def test_tables_precomputed_correctly():
+    precomputed = load_tables(data_file())
+    assert precomputed is not None
+    assert precomputed.keys() == TABLE_COMPUTERS.keys()
+    for name, compute in TABLE_COMPUTERS.items():
+        assert precomputed[name] == compute(), name
+
+
+def test_casemap():
+    assert (ord("\u00df"), "ss") in casemap("casefold")
+    assert (ord("A"), "a") in casemap("lower")
+
+
+def test_mask_from_ranges():
+    assert mask_from_ranges([0, 1, 5, 10]) == CharMask([0, (5, 10)])
 
 
 def test_transformation_assumptions():
@@ -0,0 +1,222 @@
+"""
+Precomputed tables of unicode character properties.
+
+Computing these tables requires a pass over every codepoint, which takes several
+seconds. So, we precompute them for each version of the unicode database (different
+Python versions ship different versions) and store them as compact binary files
+in the unicode_data/ directory. Tables that aren't available for the running unicode
+version are computed on first use.
+
+Run this file directly with each Python version to (re)generate its data file:
+
+    python crosshair/unicode_tables.py
+
+This module only depends on the standard library, so that it can be run with any
+supported Python version (even without CrossHair's dependencies installed).
+"""
+
+import json
+import re
+import sys
+import zlib
+from array import array
+from fractions import Fraction
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Optional
+from unicodedata import (
+    bidirectional,
+    category,
+    decimal,
+    digit,
+    numeric,
+    unidata_version,
+)
+
+# Bump this when changing how tables are computed or stored:
+TABLES_FORMAT_VERSION = 1
+
+DATA_DIR = Path(__file__).parent / "unicode_data"
+
+# Each table is a dictionary of named arrays.
+# Masks are stored as arrays of (flattened) half-open codepoint ranges.
+UnicodeTable = Dict[str, array]
+
+_CODEPOINT_TYPECODE = "I"  # (we assume 4 bytes; checked when saving & loading)
+_VALUE_TYPECODE = "q"
+# Case mappings produce up to 3 characters; shorter values are padded with zeros:
+CASEMAP_WIDTH = 3
+
+
+def _all_chars():
+    return map(chr, range(sys.maxunicode + 1))
+
+
+def _mask_ranges(predicate: Callable[[str], bool]) -> array:
+    ranges = array(_CODEPOINT_TYPECODE)
+    inside = False
+    for cp, ch in enumerate(_all_chars()):
+        if bool(predicate(ch)) != inside:
+            ranges.append(cp)
+            inside = not inside
+    if inside:
+        ranges.append(sys.maxunicode + 1)
+    return ranges
+
+
+def _compute_categories() -> UnicodeTable:
+    ranges: Dict[str, array] = {}
+    last_point, last_category = 0, category(chr(0))
+    for cur_point in range(1, sys.maxunicode + 2):
+        cur_category = category(chr(cur_point)) if cur_point <= sys.maxunicode else ""
+        if cur_category != last_category:
+            if last_category not in ranges:
+                ranges[last_category] = array(_CODEPOINT_TYPECODE)
+            ranges[last_category].extend((last_point, cur_point))
+            last_point, last_category = cur_point, cur_category
+    word_regex = re.compile(r"\w")
+    ranges["word"] = _mask_ranges(word_regex.fullmatch)  # type: ignore
+    return {k: v for (k, v) in sorted(ranges.items())}
+
+
+def _compute_mask(predicate: Callable[[str], bool]) -> UnicodeTable:
+    return {"ranges": _mask_ranges(predicate)}
+
+
+def _is_space_char(ch: str) -> bool:
+    return category(ch) == "Zs" or bidirectional(ch) in ("WS", "B", "S")
+
+
+def _compute_casemap(casefn: Callable[[str], str]) -> UnicodeTable:
+    keys = array(_CODEPOINT_TYPECODE)
+    values = array(_CODEPOINT_TYPECODE)
+    for cp, ch in enumerate(_all_chars()):
+        mapped = casefn(ch)
+        if mapped != ch:
+            assert len(mapped) <= CASEMAP_WIDTH
+            keys.append(cp)
+            values.extend(map(ord, mapped.ljust(CASEMAP_WIDTH, "\0")))
+    return {"keys": keys, "values": values}
+
+
+def _compute_intmap(mapfn: Callable[..., Optional[int]]) -> UnicodeTable:
+    keys = array(_CODEPOINT_TYPECODE)
+    values = array(_VALUE_TYPECODE)
+    for cp, ch in enumerate(_all_chars()):
+        val = mapfn(ch, None)
+        if val is not None:
+            keys.append(cp)
+            values.append(val)
+    return {"keys": keys, "values": values}
+
+
+def _compute_fractions() -> UnicodeTable:
+    keys = array(_CODEPOINT_TYPECODE)
+    numerators = array(_VALUE_TYPECODE)
+    denominators = array(_VALUE_TYPECODE)
+    for cp, ch in enumerate(_all_chars()):
+        val = numeric(ch, None)
+        if val is not None:
+            frac = Fraction(val).limit_denominator()
+            keys.append(cp)
+            numerators.append(frac.numerator)
+            denominators.append(frac.denominator)
+    return {"keys": keys, "numerators": numerators, "denominators": denominators}
+
+
+TABLE_COMPUTERS: Dict[str, Callable[[], UnicodeTable]] = {
+    "categories": _compute_categories,
+    "islower": partial(_compute_mask, str.islower),
+    "isupper": partial(_compute_mask, str.isupper),
+    "istitle": partial(_compute_mask, str.istitle),
+    "space": partial(_compute_mask, _is_space_char),
+    "casefold": partial(_compute_casemap, str.casefold),
+    "lower": partial(_compute_casemap, str.lower),
+    "title": partial(_compute_casemap, str.title),
+    "upper": partial(_compute_casemap, str.upper),
+    "decimal": partial(_compute_intmap, decimal),
+    "digit": partial(_compute_intmap, digit),
+    "numeric": _compute_fractions,
+}
+
+
+def data_file(version: str = unidata_version) -> Path:
+    return DATA_DIR / f"unicode-{version}.bin"
+
+
+def save_tables(path: Path, tables: Dict[str, UnicodeTable]) -> None:
+    """
+    Write tables in our compact binary format.
+
+    The file is a zlib-compressed JSON header line, followed by the raw
+    (little-endian) contents of each array, in header order.
+    """
+    header: Dict[str, object] = {
+        "format": TABLES_FORMAT_VERSION,
+        "unidata_version": unidata_version,
+        "tables": {
+            table_name: {
+                array_name: [arr.typecode, arr.itemsize, len(arr)]
+                for (array_name, arr) in table.items()
+            }
+            for (table_name, table) in tables.items()
+        },
+    }
+    chunks = [json.dumps(header, separators=(",", ":")).encode() + b"\n"]
+    for table in tables.values():
+        for arr in table.values():
+            if sys.byteorder != "little":
+                arr = array(arr.typecode, arr)
+                arr.byteswap()
+            chunks.append(arr.tobytes())
+    path.write_bytes(zlib.compress(b"".join(chunks), 9))
+
+
+def load_tables(path: Path) -> Optional[Dict[str, UnicodeTable]]:
+    """Read tables that were written with `save_tables`, if compatible."""
+    try:
+        data = zlib.decompress(path.read_bytes())
+    except (OSError, zlib.error):
+        return None
+    header_end = data.index(b"\n")
+    header = json.loads(data[:header_end])
+    if header["format"] != TABLES_FORMAT_VERSION:
+        return None
+    offset = header_end + 1
+    tables: Dict[str, UnicodeTable] = {}
+    for table_name, array_specs in header["tables"].items():
+        table: UnicodeTable = {}
+        for array_name, (typecode, itemsize, count) in array_specs.items():
+            arr = array(typecode)
+            if arr.itemsize != itemsize:
+                return None
+            end = offset + itemsize * count
+            arr.frombytes(data[offset:end])
+            if sys.byteorder != "little":
+                arr.byteswap()
+            offset = end
+            table[array_name] = arr
+        tables[table_name] = table
+    return tables
+
+
+_TABLES: Optional[Dict[str, UnicodeTable]] = None
+
+
+def get_table(name: str) -> UnicodeTable:
+    global _TABLES
+    if _TABLES is None:
+        _TABLES = load_tables(data_file()) or {}
+    table = _TABLES.get(name)
+    if table is None:
+        table = TABLE_COMPUTERS[name]()
+        _TABLES[name] = table
+    return table
+
+
+if __name__ == "__main__":
+    DATA_DIR.mkdir(exist_ok=True)
+    save_tables(
+        data_file(), {name: compute() for (name, compute) in TABLE_COMPUTERS.items()}
+    )
+    print("Wrote", data_file())
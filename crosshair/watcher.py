@@ -1,5 +1,7 @@
+import ast
 import base64
 import binascii
+import hashlib
 import multiprocessing
 import os
 import pickle
@@ -15,6 +17,7 @@ from typing import (
     Any,
     Counter,
     Dict,
+    FrozenSet,
     Iterable,
     Iterator,
     List,
@@ -31,12 +34,14 @@ from crosshair.core_and_libs import (
     analyze_module,
     run_checkables,
 )
-from crosshair.fnutil import NotFound, walk_paths
+from crosshair.fnutil import NotFound, analyzable_filename, walk_paths
+from crosshair.inotify import IN_ISDIR, RESCAN_EVENTS, Inotify, make_inotify
 from crosshair.options import AnalysisOptionSet
 from crosshair.util import (
     CrosshairInternal,
     ErrorDuringImport,
     debug,
+    extract_module_from_file,
     load_file,
     set_debug,
 )
@@ -55,6 +60,9 @@ def mtime(path: Path) -> Optional[float]:
 WorkItemInput = Tuple[Path, AnalysisOptionSet, float]  # (file, opts, deadline)
 WorkItemOutput = Tuple[Path, Counter[str], List[AnalysisMessage]]
 
+# Workers are recycled once they grow larger than this (in bytes):
+WORKER_MAX_MEMORY = 2 * 1024**3
+
 
 def serialize(obj: object) -> str:
     return str(base64.b64encode(zlib.compress(pickle.dumps(obj))), "ascii")
@@ -78,6 +86,45 @@ def import_error_msg(err: ErrorDuringImport) -> AnalysisMessage:
     return AnalysisMessage(MessageType.IMPORT_ERR, str(cause), filename, line, 0, "")
 
 
+def imported_module_names(
+    source: bytes, module_name: str, is_package: bool
+) -> FrozenSet[str]:
+    """
+    Find the absolute names of the modules that some source code may import.
+
+    >>> sorted(imported_module_names(b"import a.b", "c", False))
+    ['a', 'a.b']
+    >>> sorted(imported_module_names(b"from .sib import x", "pkg.mod", False))
+    ['pkg', 'pkg.sib', 'pkg.sib.x']
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return frozenset()
+    package = module_name if is_package else module_name.rpartition(".")[0]
+    names: Set[str] = set()
+
+    def add_with_parents(name: str) -> None:
+        parts = name.split(".")
+        names.update(".".join(parts[:i]) for i in range(1, len(parts) + 1))
+
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            for alias in node.names:
+                add_with_parents(alias.name)
+        elif isinstance(node, ast.ImportFrom):
+            base = node.module or ""
+            if node.level > 0:
+                package_parts = package.split(".") if package else []
+                package_parts = package_parts[: len(package_parts) - node.level + 1]
+                base = ".".join(package_parts + ([base] if base else []))
+            if base:
+                add_with_parents(base)
+            # The imported names might be submodules:
+            names.update(f"{base}.{a.name}" if base else a.name for a in node.names)
+    return frozenset(names)
+
+
 def pool_worker_process_item(
     item: WorkItemInput,
 ) -> Tuple[Counter[str], List[AnalysisMessage]]:
@@ -96,54 +143,126 @@ def pool_worker_process_item(
     return (stats, messages)
 
 
+def worker_memory_exceeded() -> bool:
+    try:
+        import resource
+    except ImportError:  # (not available on Windows)
+        return False
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform != "darwin":  # (linux reports kilobytes; mac reports bytes)
+        max_rss *= 1024
+    return max_rss > WORKER_MAX_MEMORY
+
+
 class PoolWorkerShell(threading.Thread):
-    def __init__(
-        self, input_item: WorkItemInput, results: "queue.Queue[WorkItemOutput]"
-    ):
-        self.input_item = input_item
+    """
+    Feed work items, one at a time, to a long-lived worker process.
+
+    The worker process is (re)started lazily; it may exit on its own to give back
+    memory, or be killed when it runs over a deadline.
+    We track the source files that the worker has imported, so that we know
+    when its imports have gone stale.
+    """
+
+    def __init__(self, results: "queue.Queue[WorkItemOutput]"):
         self.results = results
+        self.work: "queue.Queue[Optional[WorkItemInput]]" = Queue()
+        self.current_item: Optional[WorkItemInput] = None
         self.proc: Optional[subprocess.Popen] = None
-        super().__init__()
-
-    def run(self) -> None:
-        encoded_input = serialize(self.input_item)
+        self.imported_files: Set[Path] = set()
+        super().__init__(daemon=True)
+
+    def assign(self, item: WorkItemInput) -> None:
+        # We start the process here, rather than in our thread, so that the caller
+        # controls when processes are started (e.g. while the auditwall is open).
+        proc = self.proc
+        if proc is None or proc.poll() is not None:
+            self.proc = self._start_process()
+            self.imported_files = set()
+        self.current_item = item
+        self.work.put(item)
+
+    def _start_process(self) -> subprocess.Popen:
         worker_args = [
             sys.executable,
             "-c",
             f"import crosshair.watcher; crosshair.watcher.pool_worker_main()",
-            encoded_input,
         ]
-        self.proc = subprocess.Popen(
+        return subprocess.Popen(
             worker_args,
-            stdin=subprocess.DEVNULL,
+            stdin=subprocess.PIPE,
             stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
         )
-        (stdout, _stderr) = self.proc.communicate(b"")
-        if stdout:
-            last_line = stdout.splitlines()[-1]  # (in case of spurious print()s)
-            self.results.put(deserialize(last_line))
+
+    def run(self) -> None:
+        while True:
+            item = self.work.get()
+            if item is None:
+                break
+            proc = self.proc
+            assert proc is not None
+            assert proc.stdin is not None and proc.stdout is not None
+            try:
+                proc.stdin.write(serialize(item).encode("ascii") + b"\n")
+                proc.stdin.flush()
+                response = proc.stdout.readline()
+            except (BrokenPipeError, ValueError):  # (ValueError if pipes are closed)
+                response = b""
+            if response:
+                (output, retiring, imported_files) = deserialize(response)
+                self.imported_files.update(imported_files)
+                self.results.put(output)
+                if retiring:
+                    proc.wait()
+            else:
+                # The worker died (or was killed); we'll start another next time.
+                self.proc = None
+            self.current_item = None
+
+    def stop(self) -> None:
+        self.work.put(None)
+        proc = self.proc
+        if proc is not None and proc.poll() is None:
+            proc.kill()
 
 
 def pool_worker_main() -> None:
-    item: WorkItemInput = deserialize(sys.argv[-1])
-    filename = item[0]
-    try:
-        if hasattr(os, "nice"):  # analysis should run at a low priority
-            # Note that the following "type: ignore" is ONLY required for mypy on
-            # Windows, where the nice function does not exist:
-            os.nice(10)  # type: ignore
-        set_debug(False)
-        engage_auditwall()
-        (stats, messages) = pool_worker_process_item(item)
+    # Anything the code under test prints should not confuse our protocol:
+    output_stream = sys.stdout
+    sys.stdout = sys.stderr
+    if hasattr(os, "nice"):  # analysis should run at a low priority
+        # Note that the following "type: ignore" is ONLY required for mypy on
+        # Windows, where the nice function does not exist:
+        os.nice(10)  # type: ignore
+    set_debug(False)
+    engage_auditwall()
+    reported_files: Set[str] = set()
+    for line in sys.stdin:
+        item: WorkItemInput = deserialize(line)
+        filename = item[0]
+        try:
+            (stats, messages) = pool_worker_process_item(item)
+        except BaseException as e:
+            raise CrosshairInternal(
+                "Worker failed while analyzing " + str(filename)
+            ) from e
         output: WorkItemOutput = (filename, stats, messages)
-        print(serialize(output))
-    except BaseException as e:
-        raise CrosshairInternal("Worker failed while analyzing " + str(filename)) from e
+        retiring = worker_memory_exceeded()
+        module_files = {
+            getattr(m, "__file__", None) for m in list(sys.modules.values())
+        }
+        new_files = {f for f in module_files if f} - reported_files
+        reported_files |= new_files
+        imported_files = {Path(f).resolve() for f in new_files}
+        response = (output, retiring, imported_files)
+        print(serialize(response), file=output_stream, flush=True)
+        if retiring:
+            break
 
 
 class Pool:
-    _workers: List[Tuple[PoolWorkerShell, WorkItemInput]]
+    _workers: List[PoolWorkerShell]
     _work: List[WorkItemInput]
     _results: "Queue[WorkItemOutput]"
     _max_processes: int
@@ -157,40 +276,71 @@ class Pool:
     def _spawn_workers(self):
         work_list = self._work
         workers = self._workers
-        while work_list and len(self._workers) < self._max_processes:
-            work_item = work_list.pop()
+        while work_list:
             # NOTE: We are martialling data manually.
             # Earlier versions used multiprocessing and Queues, but
             # multiprocessing.Process is incompatible with pygls on windows
             # (something with the async blocking on stdin, which must remain open
             # in the child).
-
-            thread = PoolWorkerShell(work_item, self._results)
-            workers.append((thread, work_item))
-            thread.start()
+            idle = [w for w in workers if w.current_item is None]
+            if idle:
+                worker = idle[0]
+            elif len(workers) < self._max_processes:
+                worker = PoolWorkerShell(self._results)
+                workers.append(worker)
+                worker.start()
+            else:
+                break
+            worker.assign(work_list.pop())
 
     def _prune_workers(self, curtime: float) -> None:
-        for worker, item in self._workers:
+        for worker in self._workers:
+            item, proc = worker.current_item, worker.proc
+            if item is None or proc is None:
+                continue
             (_, _, deadline) = item
-            if worker.is_alive() and curtime > deadline and worker.proc is not None:
+            if curtime > deadline and proc.poll() is None:
                 debug("Killing worker over deadline", worker)
-                worker.proc.terminate()
+                proc.terminate()
                 time.sleep(0.5)
-                if worker.is_alive():
-                    worker.proc.kill()
-                    worker.join()
-        self._workers = [(w, i) for w, i in self._workers if w.is_alive()]
+                if proc.poll() is None:
+                    proc.kill()
 
     def terminate(self) -> None:
-        self._prune_workers(float("+inf"))
+        for worker in self._workers:
+            worker.stop()
+        self._workers = []
+        self._work = []
+
+    def discard_work(self, stale_files: Set[Path]) -> None:
+        """
+        Abandon all queued and in-progress work.
+
+        Idle workers are kept (with their warm imports), unless they have imported
+        one of the given `stale_files`.
+        Results from abandoned work are never reported.
+        """
         self._work = []
+        self._results = Queue()
+        kept_workers = []
+        for worker in self._workers:
+            if worker.current_item is None and not (
+                worker.imported_files & stale_files
+            ):
+                worker.results = self._results
+                kept_workers.append(worker)
+            else:
+                worker.stop()
+        self._workers = kept_workers
 
     def garden_workers(self) -> None:
         self._prune_workers(time.time())
         self._spawn_workers()
 
     def is_working(self) -> bool:
-        return bool(self._workers or self._work)
+        return bool(self._work) or any(
+            w.current_item is not None for w in self._workers
+        )
 
     def submit(self, item: WorkItemInput) -> None:
         self._work.append(item)
@@ -210,6 +360,13 @@ class Watcher:
     _pool: Pool
     _modtimes: Dict[Path, float]
     _options: AnalysisOptionSet
+    # (modtime, content digest, module name, imported module names) for each file:
+    _file_summaries: Dict[Path, Tuple[float, str, str, FrozenSet[str]]]
+    # Cached results per file; valid while the file's source digest is unchanged:
+    _result_cache: Dict[Path, Tuple[str, Dict[str, WorkItemOutput]]]
+    # The inotify backend (when available), and the paths that it is watching:
+    _notifier: Optional[Inotify] = None
+    _notifier_paths: Optional[Set[Path]] = None
     _next_file_check: float = 0.0
     _change_flag: bool = False
     _stop_flag: bool = False
@@ -221,15 +378,23 @@ class Watcher:
         self._pool = self.startpool()
         self._modtimes = {}
         self._options = options
+        self._file_summaries = {}
+        self._result_cache = {}
+        # (shutdown() may be called from another thread)
+        self._notifier_lock = threading.Lock()
 
     def shutdown(self):
         self._stop_flag = True
+        with self._notifier_lock:
+            if self._notifier is not None:
+                self._notifier.close()
+                self._notifier = None
 
     def update_paths(self, paths: Iterable[Path]):
         self._paths = set(paths)
 
     def startpool(self) -> Pool:
-        return Pool(multiprocessing.cpu_count() - 1)
+        return Pool(max(1, multiprocessing.cpu_count() - 1))
 
     def run_iteration(
         self, max_condition_timeout=0.5
@@ -237,6 +402,9 @@ class Watcher:
         debug(f"starting pass with a condition timeout of {max_condition_timeout}")
         debug("Files:", self._modtimes.keys())
         pool = self._pool
+        source_digests = self.source_digests()
+        cached_results = []
+        submitted: Dict[Path, AnalysisOptionSet] = {}
         for filename in self._modtimes.keys():
             worker_timeout = max(
                 10.0, max_condition_timeout * 100.0
@@ -245,19 +413,29 @@ class Watcher:
                 per_condition_timeout=max_condition_timeout,
             )
             options = self._options.overlay(iter_options)
+            cached = self.cached_result(filename, source_digests[filename], options)
+            if cached is not None:
+                cached_results.append(cached)
+                continue
+            submitted[filename] = options
             pool.submit((filename, options, time.time() + worker_timeout))
 
         pool.garden_workers()
+        for (_, counters, messages) in cached_results:
+            yield (counters, messages)
         if not pool.is_working():
             # Unusual case where there is nothing to do:
             time.sleep(1.5)
             self.handle_periodic()  # (keep checking for changes!)
             yield (Counter(), [])
             return
-        while pool.is_working():
+        while pool.is_working() or pool.has_result():
             result = pool.get_result(timeout=1.0)
             if result is not None:
-                (_, counters, messages) = result
+                (filename, counters, messages) = result
+                if filename in submitted:
+                    digest = source_digests[filename]
+                    self.cache_result(digest, submitted[filename], result)
                 yield (counters, messages)
                 if pool.has_result():
                     continue
@@ -274,15 +452,133 @@ class Watcher:
             return True
         if time.time() >= self._next_file_check:
             self._next_file_check = time.time() + 1.0
+            prior_modtimes = self._modtimes.copy()
             if self.check_changed():
                 self._change_flag = True
                 debug("Aborting iteration on change detection")
-                self._pool.terminate()
-                self._pool = self.startpool()
+                modtimes = self._modtimes
+                changed_files = {
+                    f.resolve()
+                    for f in prior_modtimes.keys() | modtimes.keys()
+                    if prior_modtimes.get(f) != modtimes.get(f)
+                }
+                self._pool.discard_work(changed_files)
                 return True
         return False
 
+    def source_digests(self) -> Dict[Path, str]:
+        """
+        Digest each watched file together with the watched files it imports.
+
+        Imports are found syntactically, and followed transitively.
+        """
+        summaries = {}
+        for path, modtime in self._modtimes.items():
+            summary = self._file_summaries.get(path)
+            if summary is None or summary[0] != modtime:
+                try:
+                    source = path.read_bytes()
+                except OSError:  # (deleted since we last checked; that's ok)
+                    source = b""
+                _, module_name = extract_module_from_file(str(path))
+                is_package = path.name == "__init__.py"
+                imports = imported_module_names(source, module_name, is_package)
+                digest = hashlib.sha256(source).hexdigest()
+                summary = (modtime, digest, module_name, imports)
+            summaries[path] = summary
+        self._file_summaries = summaries
+        for removed in self._result_cache.keys() - summaries.keys():
+            del self._result_cache[removed]
+        path_by_module = {summary[2]: path for path, summary in summaries.items()}
+        digests = {}
+        for path in summaries:
+            dependencies: Set[Path] = set()
+            pending = [path]
+            while pending:
+                cur = pending.pop()
+                if cur in dependencies:
+                    continue
+                dependencies.add(cur)
+                for module_name in summaries[cur][3]:
+                    if module_name in path_by_module:
+                        pending.append(path_by_module[module_name])
+            hasher = hashlib.sha256()
+            for dependency in sorted(dependencies):
+                hasher.update(f"{dependency}:{summaries[dependency][1]};".encode())
+            digests[path] = hasher.hexdigest()
+        return digests
+
+    def cached_result(
+        self, filename: Path, source_digest: str, options: AnalysisOptionSet
+    ) -> Optional[WorkItemOutput]:
+        cached = self._result_cache.get(filename)
+        if cached is None or cached[0] != source_digest:
+            return None
+        return cached[1].get(repr(options))
+
+    def cache_result(
+        self, source_digest: str, options: AnalysisOptionSet, result: WorkItemOutput
+    ) -> None:
+        filename = result[0]
+        cached = self._result_cache.get(filename)
+        if cached is None or cached[0] != source_digest:
+            cached = (source_digest, {})
+            self._result_cache[filename] = cached
+        cached[1][repr(options)] = result
+
+    def _start_notifier(self) -> None:
+        if self._notifier is not None:
+            self._notifier.close()
+        self._notifier = make_inotify()
+        self._notifier_paths = set(self._paths)
+        self._watch_paths()
+
+    def _watch_paths(self) -> None:
+        notifier = self._notifier
+        if notifier is None:
+            return
+        try:
+            notifier.add_paths(self._paths)
+        except OSError as e:  # (e.g. we've hit the system's limit on watches)
+            debug("Unable to watch for changes; falling back to polling:", e)
+            notifier.close()
+            self._notifier = None
+
     def check_changed(self) -> bool:
+        """
+        Update our knowledge of the watched files; return whether anything changed.
+
+        When inotify is available, we only look at the files that it reports as
+        changed. Otherwise (or when the directory structure changes), we walk
+        through everything.
+        """
+        with self._notifier_lock:
+            if self._stop_flag:
+                return self.scan_for_changes()
+            if self._notifier_paths != self._paths:
+                self._start_notifier()
+                return self.scan_for_changes()
+            notifier = self._notifier
+            if notifier is None:
+                return self.scan_for_changes()
+            events = notifier.read_events()
+            if any(mask & (RESCAN_EVENTS | IN_ISDIR) for (_, mask) in events):
+                self._watch_paths()  # (start watching any new directories)
+                return self.scan_for_changes()
+        changed = False
+        for curfile in {path for (path, _) in events}:
+            if curfile not in self._paths and not analyzable_filename(curfile.name):
+                continue
+            cur_mtime = mtime(curfile)
+            if cur_mtime is None:
+                if self._modtimes.pop(curfile, None) is not None:
+                    changed = True
+            elif cur_mtime != self._modtimes.get(curfile):
+                self._modtimes[curfile] = cur_mtime
+                changed = True
+        return changed
+
+    def scan_for_changes(self) -> bool:
         unchecked_modtimes = self._modtimes.copy()
         changed = False
         for curfile in walk_paths(self._paths, ignore_missing=True):
@@ -5,9 +5,11 @@ from pathlib import Path
 
 import pytest
 
+import crosshair.watcher
+from crosshair.options import AnalysisOptionSet
 from crosshair.statespace import MessageType
 from crosshair.test_util import simplefs
-from crosshair.watcher import Watcher
+from crosshair.watcher import Pool, Watcher
 
 # TODO: DRY a bit with main_test.py
 
@@ -24,6 +26,15 @@ def rewind_modules():
             del sys.modules[name]
 
 
+@pytest.fixture(params=["inotify", "polling"])
+def change_detection(request, monkeypatch):
+    if request.param == "polling":
+        monkeypatch.setattr(crosshair.watcher, "make_inotify", lambda: None)
+    elif not sys.platform.startswith("linux"):
+        pytest.skip("inotify is only available on Linux")
+    return request.param
+
+
 BUGGY_FOO = {
     "foo.py": """
 def foofn(x: int) -> int:
@@ -56,7 +67,14 @@ EMPTY_BAR = {
 }
 
 
-def test_added_file(tmp_path: Path):
+BAZ_IMPORTS_BAR = {
+    "baz.py": """
+import bar
+"""
+}
+
+
+def test_added_file(tmp_path: Path, change_detection):
     simplefs(tmp_path, CORRECT_FOO)
     watcher = Watcher([tmp_path])
     assert watcher.check_changed()
@@ -78,7 +96,35 @@ def test_added_file_to_empty_dir(tmp_path: Path):
     assert [m.state for m in results[0][1]] == [MessageType.POST_FAIL]
 
 
-def test_modified_file(tmp_path: Path):
+def test_modified_file_in_new_directory(tmp_path: Path, change_detection):
+    watcher = Watcher([tmp_path])
+    assert not watcher.check_changed()
+    assert (watcher._notifier is not None) == (change_detection == "inotify")
+    simplefs(tmp_path, {"pkg": CORRECT_FOO})
+    assert watcher.check_changed()
+    assert not watcher.check_changed()
+    time.sleep(0.01)  # Ensure mtime is actually different!
+    simplefs(tmp_path / "pkg", BUGGY_FOO)
+    assert watcher.check_changed()
+    assert list(watcher._modtimes.keys()) == [tmp_path / "pkg" / "foo.py"]
+
+
+def test_inotify_skips_non_source_dirs(tmp_path: Path, change_detection):
+    if change_detection != "inotify":
+        pytest.skip("only relevant for inotify")
+    simplefs(tmp_path, {"pkg": CORRECT_FOO, ".git": {}, "__pycache__": {}})
+    simplefs(tmp_path, {"venv": {"pyvenv.cfg": "", "lib": {}}})
+    watcher = Watcher([tmp_path])
+    watcher.check_changed()
+    notifier = watcher._notifier
+    assert notifier is not None
+    assert set(notifier._paths_by_wd.values()) == {tmp_path, tmp_path / "pkg"}
+    watcher.shutdown()
+    assert watcher._notifier is None
+    assert notifier._fd == -1
+
+
+def test_modified_file(tmp_path: Path, change_detection):
     simplefs(tmp_path, CORRECT_FOO)
     watcher = Watcher([tmp_path])
     assert watcher.check_changed()
@@ -89,7 +135,7 @@ def test_modified_file(tmp_path: Path):
     assert not watcher.check_changed()
 
 
-def test_removed_file(tmp_path: Path):
+def test_removed_file(tmp_path: Path, change_detection):
     simplefs(tmp_path, CORRECT_FOO)
     simplefs(tmp_path, EMPTY_BAR)
     watcher = Watcher([tmp_path])
@@ -99,9 +145,53 @@ def test_removed_file(tmp_path: Path):
     assert watcher.check_changed()
 
 
-def test_removed_file_given_as_argument(tmp_path: Path):
+def test_removed_file_given_as_argument(tmp_path: Path, change_detection):
     simplefs(tmp_path, CORRECT_FOO)
     watcher = Watcher([tmp_path / "foo.py"])
     assert watcher.check_changed()
     (tmp_path / "foo.py").unlink()
     assert watcher.check_changed()
+
+
+def test_pool_reuses_worker_process(tmp_path: Path):
+    simplefs(tmp_path, BUGGY_FOO)
+    simplefs(tmp_path, EMPTY_BAR)
+    pool = Pool(1)
+    pids = set()
+    try:
+        for filename in ["foo.py", "bar.py"]:
+            pool.submit((tmp_path / filename, AnalysisOptionSet(), time.time() + 60))
+            pool.garden_workers()
+            result = pool.get_result(timeout=60.0)
+            assert result is not None
+            assert result[0] == tmp_path / filename
+            pids.add(pool._workers[0].proc.pid)  # type: ignore
+    finally:
+        pool.terminate()
+    assert len(pids) == 1
+
+
+def test_unchanged_files_reuse_cached_results(tmp_path: Path, monkeypatch):
+    simplefs(tmp_path, BUGGY_FOO)
+    simplefs(tmp_path, EMPTY_BAR)
+    simplefs(tmp_path, BAZ_IMPORTS_BAR)
+    watcher = Watcher([tmp_path])
+    watcher.check_changed()
+    first_messages = [m for _, msgs in watcher.run_iteration() for m in msgs]
+    assert [m.state for m in first_messages] == [MessageType.POST_FAIL]
+
+    time.sleep(0.01)  # Ensure mtime is actually different!
+    simplefs(tmp_path, {"bar.py": "# Still nothing here"})
+    assert watcher.check_changed()
+    submitted = []
+    real_submit = watcher._pool.submit
+    monkeypatch.setattr(
+        watcher._pool,
+        "submit",
+        lambda item: submitted.append(item) or real_submit(item),
+    )
+    messages = [m for _, msgs in watcher.run_iteration() for m in msgs]
+    watcher._pool.terminate()
+    assert messages == first_messages
+    # The edited file and the file that imports it are re-analyzed; foo.py is not:
+    assert {item[0].name for item in submitted} == {"bar.py", "baz.py"}
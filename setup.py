@@ -24,6 +24,7 @@ setup(
         ),
     ],
     packages=find_packages(),
+    package_data={"crosshair": ["unicode_data/*.bin"]},
     scripts=[],
     entry_points={
         "console_scripts": [